@@ -0,0 +1,45 @@
+"""add qris is_active
+
+Revision ID: 3f1c2a9d7b10
+Revises: d686fee292f3
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b10'
+down_revision: Union[str, Sequence[str], None] = 'd686fee292f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('qris', sa.Column('is_active', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # QRIS terbaru sebelumnya dipakai sebagai QRIS aktif, pertahankan perilaku itu
+    op.execute(
+        """
+        UPDATE qris SET is_active = true
+        WHERE id = (SELECT id FROM qris ORDER BY created_at DESC LIMIT 1)
+        """
+    )
+
+    op.create_index(
+        'uq_qris_single_active',
+        'qris',
+        ['is_active'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_qris_single_active', table_name='qris', postgresql_where=sa.text('is_active'))
+    op.drop_column('qris', 'is_active')
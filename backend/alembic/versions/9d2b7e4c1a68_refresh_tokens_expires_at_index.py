@@ -0,0 +1,27 @@
+"""index refresh_tokens expires_at for pruning
+
+Revision ID: 9d2b7e4c1a68
+Revises: e3a1f7c29b54
+Create Date: 2026-10-19 16:40:12.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2b7e4c1a68'
+down_revision: Union[str, Sequence[str], None] = 'e3a1f7c29b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_refresh_tokens_expires_at', table_name='refresh_tokens')
@@ -0,0 +1,34 @@
+"""created_at not null with server default
+
+Revision ID: e3a1f7c29b54
+Revises: c51e8f2a9d34
+Create Date: 2026-10-19 14:12:05.318624
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a1f7c29b54'
+down_revision: Union[str, Sequence[str], None] = 'c51e8f2a9d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabel yang di-paginate dengan cursor (created_at, id)
+TABLES = ('packages', 'bookings', 'reviews', 'qris')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=False, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=True, server_default=None)
@@ -0,0 +1,199 @@
+"""
+ASGI entry point - Route baca yang I/O-bound (katalog, daftar booking, analytics)
+dilayani async lewat asyncpg, route lain diteruskan ke app Pyramid (WSGI) yang sama
+Query & serializer dipakai bersama dengan view sync via AsyncSession.run_sync
+Usage: uvicorn asgi:app --host 0.0.0.0 --port 6543 --workers 4
+"""
+import json
+import logging
+import time
+from urllib.parse import parse_qsl
+
+import jwt
+from a2wsgi import WSGIMiddleware
+
+from db import AsyncSession, dispose_async_engine, engine, get_async_engine
+from helpers.jwt_validate_helper import verify_token, TokenRevokedError
+from helpers.logging_helper import resolve_request_id, request_id_context, log_access
+from helpers.metrics_helper import instrument_engine, record_request, track_sql
+from helpers.pagination_helper import set_pagination_headers
+from helpers.slow_query_helper import flush_slow_query_log
+from main import CORS_HEADERS, make_app
+from views.analytics import agent_stats, tourist_stats
+from views.bookings import list_bookings
+from views.packages import list_packages
+
+
+logger = logging.getLogger(__name__)
+
+
+class JSONResponse:
+    """Response JSON minimal, format body sama dengan renderer json di main.py"""
+
+    def __init__(self, body, status: int = 200):
+        self.body = body
+        self.status = status
+        self.headers = {}
+        self.content_length = None
+
+    async def __call__(self, send):
+        payload = json.dumps(self.body, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+        self.content_length = len(payload)
+        headers = {"Content-Type": "application/json", **CORS_HEADERS, **self.headers}
+        await send({
+            "type": "http.response.start",
+            "status": self.status,
+            "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+                       + [(b"content-length", str(len(payload)).encode("latin-1"))],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+
+def _authenticate(scope):
+    """
+    Validasi header Authorization (pesan error sama dengan @jwt_validate)
+
+    Returns:
+        Tuple (claims, None) jika valid, (None, JSONResponse 401) jika tidak
+    """
+    headers = dict(scope["headers"])
+    auth_header = headers.get(b"authorization", b"").decode("latin-1")
+    if not auth_header:
+        return None, JSONResponse({"error": "Missing Token"}, 401)
+    try:
+        token_type, token = auth_header.split(" ", 1)
+        if token_type != "Bearer":
+            raise ValueError("Invalid token type")
+    except ValueError:
+        return None, JSONResponse({"error": "Invalid Authorization header format"}, 401)
+
+    try:
+        return verify_token(token), None
+    except jwt.ExpiredSignatureError:
+        return None, JSONResponse({"error": "Token expired"}, 401)
+    except TokenRevokedError:
+        return None, JSONResponse({"error": "Token revoked"}, 401)
+    except Exception:
+        return None, JSONResponse({"error": "Invalid token"}, 401)
+
+
+async def get_packages(scope, params):
+    """GET /api/packages (pasangan async dari views.packages.packages_view.get_packages)"""
+    try:
+        async with AsyncSession() as session:
+            packages, meta = await session.run_sync(list_packages, params)
+    except ValueError as err:
+        return JSONResponse({"error": str(err)}, 400)
+    except Exception:
+        logger.exception("Error fetching packages")
+        return JSONResponse({"error": "Internal server error"}, 500)
+
+    response = JSONResponse(packages)
+    if meta:
+        set_pagination_headers(response, meta)
+    return response
+
+
+async def bookings_list(scope, params):
+    """GET /api/bookings (pasangan async dari views.bookings.booking_list_view.bookings_list)"""
+    claims, error = _authenticate(scope)
+    if error:
+        return error
+    try:
+        async with AsyncSession() as session:
+            bookings, meta = await session.run_sync(list_bookings, params, claims)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, 400)
+    except Exception as e:
+        return JSONResponse({"error": f"Internal server error: {str(e)}"}, 500)
+
+    response = {"data": bookings}
+    if meta:
+        response["pagination"] = meta
+    return JSONResponse(response)
+
+
+async def analytics_agent_stats(scope, params):
+    """GET /api/analytics/agent/stats"""
+    claims, error = _authenticate(scope)
+    if error:
+        return error
+    if claims.get("role") != "agent":
+        return JSONResponse({"error": "Only agents can access agent analytics"}, 403)
+    try:
+        async with AsyncSession() as session:
+            return JSONResponse(await session.run_sync(agent_stats, claims.get("sub")))
+    except Exception as e:
+        return JSONResponse({"error": f"Internal server error: {str(e)}"}, 500)
+
+
+async def analytics_tourist_stats(scope, params):
+    """GET /api/analytics/tourist/stats"""
+    claims, error = _authenticate(scope)
+    if error:
+        return error
+    if claims.get("role") != "tourist":
+        return JSONResponse({"error": "Only tourists can access tourist analytics"}, 403)
+    try:
+        async with AsyncSession() as session:
+            return JSONResponse(await session.run_sync(tourist_stats, claims.get("sub")))
+    except Exception as e:
+        return JSONResponse({"error": f"Internal server error: {str(e)}"}, 500)
+
+
+# (method, path) -> (nama route di routes/manifest.py, handler async), path lain ditangani app WSGI
+ASYNC_ROUTES = {
+    ("GET", "/api/packages"): ("packages", get_packages),
+    ("GET", "/api/bookings"): ("bookings", bookings_list),
+    ("GET", "/api/analytics/agent/stats"): ("analytics_agent_stats", analytics_agent_stats),
+    ("GET", "/api/analytics/tourist/stats"): ("analytics_tourist_stats", analytics_tourist_stats),
+}
+
+
+class App:
+    def __init__(self):
+        # WSGI dijalankan di thread pool a2wsgi, tween (CORS, rate limit, cache) tetap berlaku
+        self.wsgi = WSGIMiddleware(make_app())
+        # route async tidak melewati metrics tween, query asyncpg dihitung lewat sync_engine
+        instrument_engine(get_async_engine().sync_engine)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        route = None
+        if scope["type"] == "http":
+            path = scope["path"].rstrip("/") or "/"
+            route = ASYNC_ROUTES.get((scope["method"], path))
+        if route is None:
+            await self.wsgi(scope, receive, send)
+            return
+
+        route_name, handler = route
+        params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        request_id = resolve_request_id(dict(scope["headers"]).get(b"x-request-id", b"").decode("latin-1"))
+        with request_id_context(request_id), track_sql(route_name) as stats:
+            started = time.perf_counter()
+            response = await handler(scope, params)
+            response.headers["X-Request-ID"] = request_id
+            await response(send)
+            elapsed = time.perf_counter() - started
+            record_request(route_name, scope["method"], response.status, elapsed, response.content_length, stats)
+            log_access(scope["method"], scope["path"], response.status, elapsed * 1000, route=handler.__name__)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                # uvicorn sudah menunggu request yang berjalan selesai (--timeout-graceful-shutdown)
+                await dispose_async_engine()
+                flush_slow_query_log()
+                engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+app = App()
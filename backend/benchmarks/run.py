@@ -0,0 +1,334 @@
+"""
+HTTP benchmark per route: throughput & latency p50 / p95 / p99
+Default app WSGI dipanggil langsung di proses ini (tanpa socket), atau --url ke server lokal
+Hasil ditulis sebagai JSON dan dibandingkan dengan baseline, exit code 1 jika ada regresi
+Butuh dataset dari seeds.generate_dataset (login tourist0 / agent0)
+Usage: python -m benchmarks.run [--url http://localhost:6543] [--requests 200] [--concurrency 4]
+       python -m benchmarks.run --save-baseline
+"""
+import argparse
+import datetime
+import http.client
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.scenarios import SCENARIOS, png_bytes
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+
+
+class InProcessClient:
+    """Panggil app WSGI langsung, yang terukur hanya app + database (tanpa waitress / jaringan)"""
+
+    mode = "in-process"
+
+    def __init__(self):
+        # Rate limit, public cache dan access log dimatikan sebelum app di-import (env dibaca saat import).
+        # Tanpa cache setiap request GET katalog benar-benar sampai ke view + database
+        os.environ.setdefault("RATE_LIMIT_BACKEND", "off")
+        os.environ.setdefault("PUBLIC_CACHE_TTL", "0")
+        os.environ.setdefault("ACCESS_LOG", "0")
+        # Token dibuat dan diverifikasi di proses ini sendiri, secret apa pun cukup
+        os.environ.setdefault("JWT_SECRET", "benchmark")
+        from webob import Request
+        from main import make_app
+
+        self.request_class = Request
+        self.app = make_app()
+
+    def request(self, method, path, headers, body=None, content_type=None):
+        request = self.request_class.blank(path, method=method, headers=headers)
+        request.remote_addr = "127.0.0.1"
+        if body is not None:
+            request.body = body
+            request.content_type = content_type
+        response = request.get_response(self.app)
+        return response.status_code, response.body
+
+
+class HTTPClient:
+    """Request ke server yang sudah jalan (serve.py / uvicorn), satu koneksi keep-alive per thread"""
+
+    mode = "http"
+
+    def __init__(self, base_url: str):
+        parts = urllib.parse.urlsplit(base_url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.netloc = parts.netloc
+        self.local = threading.local()
+
+    def request(self, method, path, headers, body=None, content_type=None):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = self.connection_class(self.netloc, timeout=30)
+        headers = dict(headers)
+        if content_type:
+            headers["Content-Type"] = content_type
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            self.local.connection = None
+            raise
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Nearest-rank percentile dari list yang sudah diurutkan"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def fetch_json(client, path, headers=None):
+    status, body = client.request("GET", path, headers or {})
+    if status != 200:
+        raise RuntimeError(f"GET {path} returned {status}")
+    return json.loads(body)
+
+
+def prepare(client, args) -> dict:
+    """Login akun dataset & kumpulkan id package / destination / booking untuk skenario"""
+    ctx = {"accounts": args.accounts, "email_domain": args.email_domain, "password": args.password}
+    for role in ("tourist", "agent"):
+        body = json.dumps({"email": f"{role}0@{args.email_domain}", "password": args.password}).encode()
+        status, response = client.request("POST", "/api/auth/login", {}, body, "application/json")
+        data = json.loads(response) if status == 200 else {}
+        if "token" not in data:
+            sys.exit(
+                f"Login {role}0@{args.email_domain} failed ({status}). "
+                "Generate the dataset first: python -m seeds.generate_dataset --rows 100000"
+            )
+        ctx[f"{role}_token"] = data["token"]
+        ctx[f"{role}_id"] = data["user"]["id"]
+
+    tourist = {"Authorization": f"Bearer {ctx['tourist_token']}"}
+    ctx["packages"] = fetch_json(client, "/api/packages?limit=100")
+    ctx["package_ids"] = [package["id"] for package in ctx["packages"]]
+    ctx["destination_ids"] = [destination["id"] for destination in fetch_json(client, "/api/destinations")]
+    ctx["agent_package_ids"] = [
+        package["id"] for package in fetch_json(client, f"/api/packages/agent/{ctx['agent_id']}")
+    ] or ctx["package_ids"]
+    ctx["booking_ids"] = [
+        booking["id"] for booking in fetch_json(client, f"/api/bookings/tourist/{ctx['tourist_id']}", tourist)
+    ]
+    if not ctx["package_ids"] or not ctx["destination_ids"] or not ctx["booking_ids"]:
+        sys.exit("Dataset is missing packages, destinations or bookings for tourist0")
+    ctx["created_booking_ids"] = []
+    ctx["proof_image"] = png_bytes()
+    return ctx
+
+
+def run_scenario(client, scenario, ctx, args) -> dict:
+    requests = min(args.requests, scenario.get("max_requests", args.requests))
+    if scenario.get("needs"):
+        requests = min(requests, len(ctx[scenario["needs"]]))
+    headers = {}
+    if scenario["auth"]:
+        headers["Authorization"] = f"Bearer {ctx[scenario['auth'] + '_token']}"
+
+    # builder dipanggil di thread utama (urutan & data deterministik), request di thread pool
+    prepared = [scenario["build"](ctx, i) for i in range(requests)]
+    latencies = []
+    errors = {}
+    lock = threading.Lock()
+
+    def call(spec):
+        method, path, body, content_type = spec
+        started = time.perf_counter()
+        try:
+            status, response = client.request(method, path, headers, body, content_type)
+        except Exception as e:
+            status, response = e.__class__.__name__, b""
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if status != scenario["expect"]:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+            elif scenario.get("produces"):
+                ctx[scenario["produces"]].append(json.loads(response)["id"])
+
+    # warmup tidak dihitung (koneksi pool, cache, import lazy), skenario yang menulis data tidak di-warmup,
+    # skenario bisa mematikan warmup sendiri ("warmup": 0, misal login supaya tidak menghabiskan rate limit)
+    warmup = 0 if scenario.get("needs") or scenario.get("produces") else scenario.get("warmup", args.warmup)
+    for i in range(warmup):
+        call(scenario["build"](ctx, i))
+    latencies.clear()
+    errors.clear()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(call, prepared))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "route": scenario["route"],
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "errorStatuses": errors,
+        "throughput": round(len(latencies) / wall, 2) if wall > 0 else 0.0,
+        "meanMs": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        "p50Ms": round(percentile(ms, 50), 3),
+        "p95Ms": round(percentile(ms, 95), 3),
+        "p99Ms": round(percentile(ms, 99), 3),
+        "maxMs": round(ms[-1], 3) if ms else 0.0,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Returns list pesan regresi (p95 naik / throughput turun lebih dari tolerance, atau error baru)"""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: errors {previous['errors']} -> {current['errors']}")
+        if previous["p95Ms"] > 0 and current["p95Ms"] > previous["p95Ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95Ms']:.1f}ms -> {current['p95Ms']:.1f}ms")
+        if previous["throughput"] > 0 and current["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {previous['throughput']:.1f}/s -> {current['throughput']:.1f}/s"
+            )
+    return regressions
+
+
+def uncovered_routes(scenarios) -> list:
+    """Route di routes/manifest.py yang belum punya skenario"""
+    from routes.manifest import ROUTES
+
+    covered = {scenario["route"] for scenario in scenarios}
+    return [name for name, _ in ROUTES if name not in covered]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=BENCHMARK_DIR, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results: dict, baseline):
+    print(f"\n{'scenario':<38}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'p95 vs base':>13}")
+    for name, row in results["scenarios"].items():
+        delta = ""
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous and previous["p95Ms"] > 0:
+            delta = f"{(row['p95Ms'] / previous['p95Ms'] - 1) * 100:+.0f}%"
+        print(
+            f"{name:<38}{row['throughput']:>10.1f}{row['p50Ms']:>10.1f}{row['p95Ms']:>10.1f}"
+            f"{row['p99Ms']:>10.1f}{row['errors']:>8}{delta:>13}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API routes (throughput, p50/p95/p99)")
+    parser.add_argument("--url", help="Base URL server yang sudah jalan, default app dipanggil in-process")
+    parser.add_argument("--requests", type=int, default=200, help="Request per skenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Thread client paralel")
+    parser.add_argument("--warmup", type=int, default=10, help="Request warmup per skenario (tidak dihitung)")
+    parser.add_argument("--only", help="Nama skenario dipisah koma, misal catalog_browse,login")
+    parser.add_argument("--accounts", type=int, default=100, help="Jumlah akun tourist yang dipakai skenario login")
+    parser.add_argument("--password", default="password123", help="Password akun dataset")
+    parser.add_argument("--email-domain", default="loadtest.local", help="Domain email akun dataset")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="File JSON hasil")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="File JSON baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil sebagai baseline baru")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="Regresi jika p95 naik / throughput turun lebih dari rasio ini dari baseline",
+    )
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.only:
+        names = set(args.only.split(","))
+        unknown = names - {scenario["name"] for scenario in SCENARIOS}
+        if unknown:
+            sys.exit(f"Unknown scenario: {', '.join(sorted(unknown))}")
+        # booking_create tetap dijalankan jika payment_upload dipilih (butuh booking baru)
+        if "payment_upload" in names:
+            names.add("booking_create")
+        scenarios = [scenario for scenario in SCENARIOS if scenario["name"] in names]
+
+    client = HTTPClient(args.url) if args.url else InProcessClient()
+    ctx = prepare(client, args)
+
+    results = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "mode": client.mode,
+        "url": args.url,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "scenarios": {},
+    }
+    for scenario in scenarios:
+        print(f"Running {scenario['name']}...", flush=True)
+        results["scenarios"][scenario["name"]] = run_scenario(client, scenario, ctx, args)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    limited = [name for name, result in results["scenarios"].items() if "429" in result["errorStatuses"]]
+    if limited:
+        print(
+            f"\nRate limited (429): {', '.join(limited)}. "
+            "Start the target server with RATE_LIMIT_BACKEND=off (and PUBLIC_CACHE_TTL=0)"
+        )
+
+    missing = uncovered_routes(SCENARIOS)
+    if missing and not args.only:
+        print(f"\nRoutes without a scenario: {', '.join(missing)}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return
+    if (baseline.get("mode"), baseline.get("concurrency")) != (results["mode"], results["concurrency"]):
+        print("Warning: baseline was recorded with a different mode / concurrency")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nPerformance regressions (tolerance {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nNo regressions against baseline (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
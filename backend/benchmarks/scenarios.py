@@ -0,0 +1,207 @@
+"""
+Skenario benchmark per route (urutan = urutan dijalankan)
+Data diambil dari dataset seeds.generate_dataset (login tourist0 / agent0)
+"""
+import datetime
+import io
+import json
+
+
+SEARCH_TERMS = ["bali", "lombok", "diving", "family", "culture", "komodo", "hiking", "kyoto"]
+
+
+def png_bytes() -> bytes:
+    """Gambar PNG kecil untuk upload bukti pembayaran"""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (200, 120, 40)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def multipart(field: str, filename: str, content_type: str, data: bytes):
+    """Body multipart/form-data satu file, returns (body, content type)"""
+    boundary = "benchmark-boundary-7d1f"
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def pick(items: list, i: int):
+    return items[i % len(items)]
+
+
+def catalog_browse(ctx, i):
+    return "GET", f"/api/packages?page={i % 5 + 1}&limit=12", None, None
+
+
+def catalog_filter(ctx, i):
+    destination = pick(ctx["destination_ids"], i)
+    return "GET", f"/api/packages?destination={destination}&sortBy=price&order=desc&limit=12", None, None
+
+
+def catalog_search(ctx, i):
+    return "GET", f"/api/packages?q={pick(SEARCH_TERMS, i)}&limit=12", None, None
+
+
+def package_detail(ctx, i):
+    return "GET", f"/api/packages/{pick(ctx['package_ids'], i)}", None, None
+
+
+def package_agent(ctx, i):
+    return "GET", f"/api/packages/agent/{ctx['agent_id']}", None, None
+
+
+def destinations(ctx, i):
+    return "GET", "/api/destinations", None, None
+
+
+def destination_detail(ctx, i):
+    return "GET", f"/api/destinations/{pick(ctx['destination_ids'], i)}", None, None
+
+
+def reviews_by_package(ctx, i):
+    return "GET", f"/api/reviews/package/{pick(ctx['package_ids'], i)}", None, None
+
+
+def login(ctx, i):
+    # akun bergantian tiap request, cache profil per akun tidak membuat login terlihat lebih cepat
+    body = {"email": f"tourist{i % ctx['accounts']}@{ctx['email_domain']}", "password": ctx["password"]}
+    return "POST", "/api/auth/login", json.dumps(body).encode(), "application/json"
+
+
+def me(ctx, i):
+    return "GET", "/api/auth/me", None, None
+
+
+def bookings_list(ctx, i):
+    return "GET", f"/api/bookings?page={i % 3 + 1}&limit=20", None, None
+
+
+def booking_detail(ctx, i):
+    return "GET", f"/api/bookings/{pick(ctx['booking_ids'], i)}", None, None
+
+
+def bookings_by_tourist(ctx, i):
+    return "GET", f"/api/bookings/tourist/{ctx['tourist_id']}", None, None
+
+
+def reviews_by_tourist(ctx, i):
+    return "GET", f"/api/reviews/tourist/{ctx['tourist_id']}", None, None
+
+
+def bookings_by_package(ctx, i):
+    return "GET", f"/api/bookings/package/{pick(ctx['agent_package_ids'], i)}", None, None
+
+
+def payment_pending(ctx, i):
+    return "GET", "/api/bookings/payment/pending", None, None
+
+
+def agent_stats(ctx, i):
+    return "GET", "/api/analytics/agent/stats", None, None
+
+
+def agent_package_performance(ctx, i):
+    return "GET", "/api/analytics/agent/package-performance", None, None
+
+
+def tourist_stats(ctx, i):
+    return "GET", "/api/analytics/tourist/stats", None, None
+
+
+def booking_create(ctx, i):
+    package = pick(ctx["packages"], i)
+    travel_date = datetime.date.today() + datetime.timedelta(days=30 + i % 60)
+    body = {
+        "packageId": package["id"],
+        "travelDate": travel_date.isoformat(),
+        "travelersCount": 1,
+        "totalPrice": package["price"],
+    }
+    return "POST", "/api/bookings", json.dumps(body).encode(), "application/json"
+
+
+def payment_upload(ctx, i):
+    # satu booking hanya bisa di-upload sekali, pakai booking hasil skenario booking_create
+    booking_id = ctx["created_booking_ids"].pop()
+    body, content_type = multipart("proof", "proof.png", "image/png", ctx["proof_image"])
+    return "POST", f"/api/bookings/{booking_id}/payment-proof", body, content_type
+
+
+def healthz(ctx, i):
+    return "GET", "/healthz", None, None
+
+
+def jwks(ctx, i):
+    return "GET", "/.well-known/jwks.json", None, None
+
+
+# name, route (routes/manifest.py), builder, token (None | tourist | agent), status yang diharapkan
+# max_requests: batas request (login = bcrypt), warmup: override --warmup,
+# produces / needs: id hasil skenario lain di ctx
+SCENARIOS = [
+    {"name": "healthz", "route": "healthz", "build": healthz, "auth": None, "expect": 200},
+    {"name": "jwks", "route": "jwks", "build": jwks, "auth": None, "expect": 200},
+    {"name": "catalog_browse", "route": "packages", "build": catalog_browse, "auth": None, "expect": 200},
+    {"name": "catalog_filter", "route": "packages", "build": catalog_filter, "auth": None, "expect": 200},
+    {"name": "catalog_search", "route": "packages", "build": catalog_search, "auth": None, "expect": 200},
+    {"name": "package_detail", "route": "package_detail", "build": package_detail, "auth": None, "expect": 200},
+    {"name": "package_agent", "route": "package_agent", "build": package_agent, "auth": None, "expect": 200},
+    {"name": "destinations", "route": "destinations", "build": destinations, "auth": None, "expect": 200},
+    {
+        "name": "destination_detail", "route": "destination_detail", "build": destination_detail,
+        "auth": None, "expect": 200,
+    },
+    {
+        "name": "reviews_by_package", "route": "review_by_package", "build": reviews_by_package,
+        "auth": None, "expect": 200,
+    },
+    {
+        "name": "login", "route": "login", "build": login, "auth": None, "expect": 200,
+        "max_requests": 20, "warmup": 0,
+    },
+    {"name": "me", "route": "me", "build": me, "auth": "tourist", "expect": 200},
+    {"name": "bookings_list", "route": "bookings", "build": bookings_list, "auth": "tourist", "expect": 200},
+    {"name": "booking_detail", "route": "booking_detail", "build": booking_detail, "auth": "tourist", "expect": 200},
+    {
+        "name": "bookings_by_tourist", "route": "booking_by_tourist", "build": bookings_by_tourist,
+        "auth": "tourist", "expect": 200,
+    },
+    {
+        "name": "reviews_by_tourist", "route": "review_by_tourist", "build": reviews_by_tourist,
+        "auth": "tourist", "expect": 200,
+    },
+    {
+        "name": "bookings_by_package", "route": "booking_by_package", "build": bookings_by_package,
+        "auth": "agent", "expect": 200,
+    },
+    {
+        "name": "payment_pending", "route": "booking_payment_pending", "build": payment_pending,
+        "auth": "agent", "expect": 200,
+    },
+    {
+        "name": "analytics_agent_stats", "route": "analytics_agent_stats", "build": agent_stats,
+        "auth": "agent", "expect": 200,
+    },
+    {
+        "name": "analytics_agent_package_performance", "route": "analytics_agent_package_performance",
+        "build": agent_package_performance, "auth": "agent", "expect": 200,
+    },
+    {
+        "name": "analytics_tourist_stats", "route": "analytics_tourist_stats", "build": tourist_stats,
+        "auth": "tourist", "expect": 200,
+    },
+    # menulis ke database: booking baru + file bukti bayar di storage/payment_proofs
+    {
+        "name": "booking_create", "route": "bookings", "build": booking_create, "auth": "tourist",
+        "expect": 201, "produces": "created_booking_ids",
+    },
+    {
+        "name": "payment_upload", "route": "booking_payment_upload", "build": payment_upload,
+        "auth": "tourist", "expect": 200, "needs": "created_booking_ids",
+    },
+]
@@ -0,0 +1,138 @@
+"""
+Health Helper - Cek kesiapan instance untuk load balancer (/readyz)
+Database (satu round trip, sekaligus cek revisi alembic), saturasi pool koneksi,
+dan panjang antrian task waitress
+"""
+import concurrent.futures
+import os
+import threading
+import time
+
+
+# Batas waktu cek database (ms): checkout pool + connect + query
+READY_DB_TIMEOUT_MS = int(os.getenv("READY_DB_TIMEOUT_MS", "1000"))
+# Not ready jika koneksi pool yang sedang dipakai >= rasio ini dari kapasitas (size + overflow)
+READY_POOL_THRESHOLD = float(os.getenv("READY_POOL_THRESHOLD", "0.9"))
+# Not ready jika request yang antri menunggu thread waitress lebih dari ini
+READY_MAX_QUEUE = int(os.getenv("READY_MAX_QUEUE", "32"))
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+_heads = None
+_heads_lock = threading.Lock()
+_task_dispatcher = None
+_draining = False
+
+# Cek database jalan di thread sendiri supaya /readyz bisa berhenti menunggu tepat waktu;
+# selama cek sebelumnya masih menggantung, probe berikutnya menunggu cek yang sama (tidak menumpuk)
+_db_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="readyz-db")
+_db_check = None
+_db_check_lock = threading.Lock()
+
+
+def register_task_dispatcher(dispatcher):
+    """Dipanggil serve.py setelah membuat server waitress (untuk membaca antrian task)"""
+    global _task_dispatcher
+    _task_dispatcher = dispatcher
+
+
+def set_draining():
+    """Dipanggil saat shutdown: /readyz langsung 503 supaya load balancer berhenti mengirim traffic"""
+    global _draining
+    _draining = True
+
+
+def migration_heads() -> set:
+    """Revisi head alembic di kode (dibaca sekali per proses)"""
+    global _heads
+    if _heads is None:
+        with _heads_lock:
+            if _heads is None:
+                from alembic.config import Config
+                from alembic.script import ScriptDirectory
+                _heads = set(ScriptDirectory.from_config(Config(ALEMBIC_INI)).get_heads())
+    return _heads
+
+
+def check_pool(engine) -> dict:
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"ok": True}
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    in_use = pool.checkedout()
+    return {
+        "ok": capacity <= 0 or in_use < capacity * READY_POOL_THRESHOLD,
+        "inUse": in_use,
+        "capacity": capacity,
+    }
+
+
+def check_queue() -> dict:
+    if _task_dispatcher is None:
+        return {"ok": True}
+    depth = len(_task_dispatcher.queue)
+    return {
+        "ok": depth <= READY_MAX_QUEUE,
+        "depth": depth,
+        "active": _task_dispatcher.active_count,
+        "threads": len(_task_dispatcher.threads),
+    }
+
+
+def _query_database(engine) -> dict:
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            with conn.begin():
+                if engine.dialect.name == "postgresql":
+                    conn.exec_driver_sql(f"SET LOCAL statement_timeout = {READY_DB_TIMEOUT_MS}")
+                revisions = {row[0] for row in conn.exec_driver_sql("SELECT version_num FROM alembic_version")}
+    except Exception as e:
+        return {"ok": False, "error": e.__class__.__name__}
+    latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    heads = migration_heads()
+    return {
+        "ok": revisions == heads,
+        "latencyMs": latency_ms,
+        "revision": sorted(revisions),
+        "head": sorted(heads),
+    }
+
+
+def check_database(engine) -> dict:
+    """
+    Satu koneksi, satu transaksi pendek: cek koneksi + revisi alembic, koneksi langsung dikembalikan
+
+    Checkout pool dan connect ke server yang tidak merespon dibatasi READY_DB_TIMEOUT_MS
+    (hasil {"ok": False, "error": "Timeout"}), connect sendiri dibatasi DB_CONNECT_TIMEOUT di db.py.
+    """
+    global _db_check
+    with _db_check_lock:
+        if _db_check is None or _db_check.done():
+            _db_check = _db_executor.submit(_query_database, engine)
+        future = _db_check
+    try:
+        return future.result(timeout=READY_DB_TIMEOUT_MS / 1000)
+    except concurrent.futures.TimeoutError:
+        return {"ok": False, "error": "Timeout"}
+
+
+def readiness(engine) -> dict:
+    """
+    Status kesiapan instance
+
+    Returns:
+        Dictionary {ready, checks: {pool, queue, database}} atau {ready: False, draining: True}
+    """
+    if _draining:
+        return {"ready": False, "draining": True}
+
+    checks = {"pool": check_pool(engine), "queue": check_queue()}
+    # pool / antrian sudah penuh: jangan ikut antri minta koneksi database
+    if checks["pool"]["ok"] and checks["queue"]["ok"]:
+        checks["database"] = check_database(engine)
+    else:
+        checks["database"] = {"ok": None, "skipped": True}
+    ready = all(check["ok"] for check in checks.values())
+    return {"ready": ready, "checks": checks}
@@ -0,0 +1,147 @@
+"""
+JWT Key Helper - Key ring untuk signing & verifikasi JWT (HS256, RS256 atau EdDSA)
+Setiap token membawa header "kid", public key dipublikasikan lewat /.well-known/jwks.json
+sehingga proxy / worker lain bisa verifikasi token tanpa shared secret
+"""
+import os
+import threading
+import time
+import jwt
+
+from helpers.metrics_helper import APP_DEBUG
+
+
+# HS256 (default, kompatibel dengan token lama) | RS256 | EdDSA
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+
+# HS256: shared secret, wajib di-set kecuali APP_DEBUG (fallback "secret" hanya untuk development)
+JWT_SECRET = os.getenv("JWT_SECRET")
+DEBUG_JWT_SECRET = "secret"
+
+# RS256 / EdDSA: folder berisi private key PEM, nama file (tanpa .pem) = kid.
+# Rotasi: taruh key baru di folder lalu set JWT_ACTIVE_KID (default file terbaru),
+# key lama tetap dipakai untuk verifikasi sampai file-nya dihapus.
+JWT_KEYS_DIR = os.getenv("JWT_KEYS_DIR")
+JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID")
+
+# Alternatif satu key lewat env (misal dari secret manager)
+JWT_PRIVATE_KEY = os.getenv("JWT_PRIVATE_KEY")
+JWT_KEY_ID = os.getenv("JWT_KEY_ID", "default")
+
+# Jarak minimum reload key ring saat ketemu kid yang belum dikenal (detik)
+JWT_KEYS_RELOAD_INTERVAL = float(os.getenv("JWT_KEYS_RELOAD_INTERVAL", "30"))
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+
+class KeyRing:
+    """Key aktif untuk signing + semua key yang masih valid untuk verifikasi"""
+
+    def __init__(self):
+        # Gagal saat start (bukan saat login pertama) jika tidak ada key yang dikonfigurasi
+        if JWT_ALGORITHM == "HS256" and not JWT_SECRET and not APP_DEBUG:
+            raise RuntimeError("JWT_SECRET is not set (the default secret is only allowed with APP_DEBUG)")
+        if JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS and not (JWT_PRIVATE_KEY or JWT_KEYS_DIR):
+            raise RuntimeError(f"JWT_ALGORITHM={JWT_ALGORITHM} requires JWT_KEYS_DIR or JWT_PRIVATE_KEY")
+        self._lock = threading.Lock()
+        self._loaded_at = None
+        self.signing_kid = None
+        self.signing_key = None
+        self.verification_keys = {}
+        self.jwks = {"keys": []}
+
+    def load(self):
+        if JWT_ALGORITHM not in ("HS256",) + ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT_ALGORITHM: {JWT_ALGORITHM}")
+
+        if JWT_ALGORITHM == "HS256":
+            # Symmetric secret tidak pernah dipublikasikan di JWKS
+            secret = JWT_SECRET or DEBUG_JWT_SECRET
+            signing_kid, signing_key = None, secret
+            verification_keys = {None: secret}
+            jwks = {"keys": []}
+        else:
+            private_keys = self._read_private_keys()
+            if not private_keys:
+                raise RuntimeError(
+                    f"JWT_ALGORITHM={JWT_ALGORITHM} requires JWT_KEYS_DIR or JWT_PRIVATE_KEY"
+                )
+            signing_kid = JWT_ACTIVE_KID if JWT_ACTIVE_KID in private_keys else next(iter(private_keys))
+            signing_key = private_keys[signing_kid]
+            verification_keys = {kid: key.public_key() for kid, key in private_keys.items()}
+            jwks = {"keys": [self._to_jwk(kid, key) for kid, key in verification_keys.items()]}
+
+        with self._lock:
+            self.signing_kid = signing_kid
+            self.signing_key = signing_key
+            self.verification_keys = verification_keys
+            self.jwks = jwks
+            self._loaded_at = time.monotonic()
+
+    def _read_private_keys(self) -> dict:
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+        keys = []
+        if JWT_PRIVATE_KEY:
+            keys.append((JWT_KEY_ID, float("inf"), JWT_PRIVATE_KEY.encode("utf-8")))
+        if JWT_KEYS_DIR and os.path.isdir(JWT_KEYS_DIR):
+            for filename in os.listdir(JWT_KEYS_DIR):
+                if filename.endswith(".pem"):
+                    path = os.path.join(JWT_KEYS_DIR, filename)
+                    with open(path, "rb") as f:
+                        keys.append((filename[:-4], os.path.getmtime(path), f.read()))
+
+        # Urutkan dari yang terbaru, key pertama jadi default signing key
+        keys.sort(key=lambda item: item[1], reverse=True)
+        return {kid: load_pem_private_key(pem, password=None) for kid, _, pem in keys}
+
+    @staticmethod
+    def _to_jwk(kid: str, public_key) -> dict:
+        algorithm = jwt.get_algorithm_by_name(JWT_ALGORITHM)
+        jwk = algorithm.to_jwk(public_key, as_dict=True)
+        jwk.update({"kid": kid, "use": "sig", "alg": JWT_ALGORITHM})
+        return jwk
+
+    def ensure_loaded(self):
+        if self._loaded_at is None:
+            self.load()
+
+    def get_verification_key(self, kid):
+        """Ambil public key untuk kid, reload key ring (dibatasi interval) jika kid belum dikenal"""
+        self.ensure_loaded()
+        key = self.verification_keys.get(kid)
+        if key is None and JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS:
+            if time.monotonic() - self._loaded_at >= JWT_KEYS_RELOAD_INTERVAL:
+                self.load()
+                key = self.verification_keys.get(kid)
+        return key
+
+
+key_ring = KeyRing()
+
+
+def sign_token(claims: dict) -> str:
+    """Sign claims dengan key aktif (header kid diisi untuk RS256 / EdDSA)"""
+    key_ring.ensure_loaded()
+    headers = {"kid": key_ring.signing_kid} if key_ring.signing_kid else None
+    return jwt.encode(claims, key_ring.signing_key, algorithm=JWT_ALGORITHM, headers=headers)
+
+
+def decode_token(token: str, **options) -> dict:
+    """
+    Verifikasi signature (key dipilih dari header kid) lalu kembalikan claims
+
+    Raises:
+        jwt.InvalidTokenError: If kid tidak dikenal, signature atau claims invalid
+    """
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = key_ring.get_verification_key(kid)
+    if key is None:
+        raise jwt.InvalidTokenError("Unknown key id")
+    return jwt.decode(token, key, algorithms=[JWT_ALGORITHM], **options)
+
+
+def get_jwks() -> dict:
+    """JSON Web Key Set berisi public key yang masih valid"""
+    key_ring.ensure_loaded()
+    return key_ring.jwks
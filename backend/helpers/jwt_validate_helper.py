@@ -1,7 +1,140 @@
 import jwt
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
 from pyramid.response import Response
 
+from helpers.jwt_key_helper import decode_token
+
+
+# Jumlah token terverifikasi yang disimpan (LRU)
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "4096"))
+
+_cache = OrderedDict()  # sha256(token) -> claims
+_cache_lock = threading.Lock()
+
+# Umur access token (detik), batas iat per user tidak perlu disimpan lebih lama dari ini
+ACCESS_TOKEN_TTL = int(os.getenv("ACCESS_TOKEN_MINUTES", "15")) * 60
+
+# Token yang dicabut (digest -> exp) dan batas iat per user (sub -> timestamp).
+# Hanya berlaku di proses ini: dengan prefork (serve.py --workers > 1) worker lain
+# tetap menerima token tersebut sampai exp, jadi andalkan umur access token yang pendek.
+_revoked_tokens = {}
+_user_not_before = {}
+
+_stats = {"hits": 0, "misses": 0, "rejected": 0}
+
+
+class TokenRevokedError(jwt.InvalidTokenError):
+    """Token valid secara signature tapi sudah dicabut"""
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _is_revoked(digest: bytes, claims: dict) -> bool:
+    if digest in _revoked_tokens:
+        return True
+    not_before = _user_not_before.get(claims.get("sub"))
+    return not_before is not None and claims.get("iat", 0) < not_before
+
+
+def _count(key: str):
+    with _cache_lock:
+        _stats[key] += 1
+
+
+def _verify(token: str):
+    """Return (claims, cache_hit)"""
+    digest = _digest(token)
+    now = time.time()
+
+    with _cache_lock:
+        claims = _cache.get(digest)
+        if claims is not None:
+            if claims["exp"] <= now:
+                del _cache[digest]
+                claims = None
+            else:
+                _cache.move_to_end(digest)
+
+    if claims is not None:
+        if _is_revoked(digest, claims):
+            _count("rejected")
+            raise TokenRevokedError("Token revoked")
+        _count("hits")
+        return claims, True
+
+    _count("misses")
+    claims = decode_token(token, options={"require": ["exp", "iat"]})
+    if _is_revoked(digest, claims):
+        _count("rejected")
+        raise TokenRevokedError("Token revoked")
+
+    with _cache_lock:
+        _cache[digest] = claims
+        _cache.move_to_end(digest)
+        while len(_cache) > JWT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return claims, False
+
+
+def verify_token(token: str) -> dict:
+    """
+    Verifikasi JWT dan kembalikan claims (pakai cache untuk token yang sama)
+
+    Token yang sudah pernah diverifikasi disimpan sampai exp, jadi request berikutnya
+    dengan token yang sama cukup lookup dict tanpa HMAC / parsing ulang.
+
+    Raises:
+        jwt.ExpiredSignatureError: If token expired
+        TokenRevokedError: If token sudah dicabut
+        jwt.InvalidTokenError: If token invalid
+    """
+    return _verify(token)[0]
+
+
+def revoke_token(token: str, exp: float = None):
+    """Cabut satu token (misal logout), disimpan sampai exp token tersebut"""
+    digest = _digest(token)
+    with _cache_lock:
+        claims = _cache.pop(digest, None)
+        if exp is None:
+            exp = claims["exp"] if claims else time.time() + 24 * 3600
+        _revoked_tokens[digest] = exp
+        _prune(time.time())
+
+
+def revoke_user_tokens(user_id: str):
+    """
+    Cabut semua token milik user yang diterbitkan sebelum saat ini
+    (ganti password, reuse refresh token). Per proses, lihat catatan _user_not_before.
+    """
+    with _cache_lock:
+        now = time.time()
+        _user_not_before[str(user_id)] = int(now)
+        for key in [key for key, claims in _cache.items() if claims.get("sub") == str(user_id)]:
+            del _cache[key]
+        _prune(now)
+
+
+def _prune(now: float):
+    """Bersihkan daftar revoke yang sudah expired (dipanggil dengan _cache_lock)"""
+    for key in [key for key, expires in _revoked_tokens.items() if expires <= now]:
+        del _revoked_tokens[key]
+    for key in [key for key, not_before in _user_not_before.items() if not_before + ACCESS_TOKEN_TTL <= now]:
+        del _user_not_before[key]
+
+
+def token_cache_stats() -> dict:
+    """Counter cache token (hits, misses, rejected, size)"""
+    with _cache_lock:
+        return dict(_stats, size=len(_cache))
+
 
 def jwt_validate(func):
     @wraps(func)
@@ -20,13 +153,14 @@ def jwt_validate(func):
             )
 
         # validate jwt
+        request.jwt_cache_hit = False
         try:
-            payload = jwt.decode(
-                token, "secret", algorithms=["HS256"], require=["exp", "iat"]
-            )
+            payload, request.jwt_cache_hit = _verify(token)
             request.jwt_claims = payload
         except jwt.ExpiredSignatureError:
             return Response(json_body={"error": "Token expired"}, status=401)
+        except TokenRevokedError:
+            return Response(json_body={"error": "Token revoked"}, status=401)
         except:
             return Response(json_body={"error": "Invalid token"}, status=401)
 
@@ -0,0 +1,202 @@
+"""
+Logging Helper - Log JSON per baris, request id per request, access log
+Record dikirim lewat QueueHandler, penulisan ke stdout dilakukan thread QueueListener,
+jadi thread request tidak pernah menunggu I/O log
+"""
+import atexit
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode
+
+from helpers.metrics_helper import route_name
+
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# json | text (text lebih enak dibaca saat development)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+ACCESS_LOG = os.getenv("ACCESS_LOG", "1").lower() in ("1", "true", "yes")
+# Batas antrian log, record dibuang jika penuh (log tidak boleh menahan request)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# X-Request-ID dari client / proxy hanya dipakai jika formatnya aman
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+# Parameter query berisi credential, nilainya tidak pernah ditulis ke log / output debug
+SENSITIVE_QUERY_PARAMS = {"token", "access_token", "sig"}
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+_listener = None
+
+access_logger = logging.getLogger("access")
+
+
+def current_request_id():
+    """Request id request yang sedang diproses thread / task ini (None di luar request)"""
+    return _request_id.get()
+
+
+def resolve_request_id(header_value) -> str:
+    """Pakai X-Request-ID dari client / proxy jika formatnya aman, kalau tidak buat baru"""
+    if header_value and REQUEST_ID_PATTERN.match(header_value):
+        return header_value
+    return uuid.uuid4().hex
+
+
+@contextmanager
+def request_id_context(request_id: str):
+    """Semua log di dalam blok ini (thread / task yang sama) membawa request id"""
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+def redact_query(path: str, query_string: str) -> str:
+    """Path + query string dengan nilai SENSITIVE_QUERY_PARAMS diganti "***" """
+    if not query_string:
+        return path
+    params = [
+        (key, "***" if key.lower() in SENSITIVE_QUERY_PARAMS else value)
+        for key, value in parse_qsl(query_string, keep_blank_values=True)
+    ]
+    return f"{path}?{urlencode(params, safe='*/')}"
+
+
+def log_access(method: str, path: str, status: int, duration_ms: float, **fields):
+    """Satu baris access log (logger "access"), fields tambahan ikut di JSON"""
+    if ACCESS_LOG:
+        access_logger.info(
+            "%s %s %s", method, path, status,
+            extra={"fields": dict(method=method, path=path, status=status, durationMs=round(duration_ms, 2), **fields)},
+        )
+
+
+class RequestIdFilter(logging.Filter):
+    # Dijalankan di thread pemanggil (sebelum masuk queue), contextvar masih tersedia
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["requestId"] = record.request_id
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # Traceback disimpan terpisah di exc_text (bawaan QueueHandler menggabungkannya ke message)
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_logging():
+    """Pasang handler root logger (idempotent, aman dipanggil di setiap worker)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        stream.setFormatter(JSONFormatter())
+    else:
+        stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s"))
+
+    handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(LOG_LEVEL)
+
+    _listener = logging.handlers.QueueListener(handler.queue, stream, respect_handler_level=False)
+    _listener.start()
+
+
+def _reset_after_fork():
+    # thread listener tidak ikut ter-fork, worker membuat queue & listener sendiri
+    global _listener
+    if _listener is not None:
+        _listener = None
+        setup_logging()
+
+
+def stop_logging():
+    """Flush sisa antrian log (dipanggil saat shutdown)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(stop_logging)
+
+
+def request_id_tween_factory(handler, registry):
+    def request_id_tween(request):
+        request_id = resolve_request_id(request.headers.get("X-Request-ID"))
+        request.request_id = request_id
+
+        with request_id_context(request_id):
+            started = time.perf_counter()
+            response = handler(request)
+            response.headers["X-Request-ID"] = request_id
+
+            fields = {
+                "route": route_name(request),
+                "bytes": response.content_length or 0,
+                "clientIp": request.client_addr,
+            }
+            # diisi metrics tween (jumlah & durasi query SQL request ini)
+            sql_stats = getattr(request, "sql_stats", None)
+            if sql_stats is not None:
+                fields["sqlCount"] = sql_stats.count
+                fields["sqlMs"] = round(sql_stats.seconds * 1000, 2)
+            # path tanpa query string: ?sig= / ?token= tidak pernah masuk access log
+            log_access(
+                request.method, request.path, response.status_code,
+                (time.perf_counter() - started) * 1000, **fields,
+            )
+            return response
+
+    return request_id_tween
@@ -0,0 +1,218 @@
+"""
+Metrics Helper - Latency, ukuran response dan jumlah / durasi query SQL per route
+Dikumpulkan di memori per proses dan diekspor di /metrics (Prometheus text format)
+Setiap series membawa label worker (pid): dengan prefork / uvicorn --workers, setiap
+scrape hanya melihat satu worker, jumlahkan per worker (sum without (worker)) di Prometheus
+Server-Timing (app;dur, db;dur) ditambahkan ke response jika APP_DEBUG aktif
+"""
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from sqlalchemy import event
+from pyramid.interfaces import IRoutesMapper
+
+
+APP_DEBUG = os.getenv("APP_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Bucket histogram (detik untuk latency, jumlah statement untuk SQL)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+_lock = threading.Lock()
+_requests = {}  # (route, method, status) -> count
+_latency = {}   # (route, method) -> Histogram
+_sql_count = {}  # (route, method) -> Histogram
+_sql_seconds = {}  # (route, method) -> total detik
+_response_bytes = {}  # (route, method) -> total byte
+
+# Statistik SQL request yang sedang berjalan (per thread / per task)
+_current = contextvars.ContextVar("sql_stats", default=None)
+
+
+class Histogram:
+    """Histogram kumulatif ala Prometheus (bucket, sum, count)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class SQLStats:
+    __slots__ = ("count", "seconds", "started", "request", "route")
+
+    def __init__(self, request=None, route=None):
+        self.count = 0
+        self.seconds = 0.0
+        self.started = []
+        self.request = request
+        self.route = route
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.started.append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None and stats.started:
+        stats.seconds += time.perf_counter() - stats.started.pop()
+        stats.count += 1
+
+
+def instrument_engine(engine):
+    """Pasang event SQLAlchemy untuk menghitung statement & durasi query request aktif"""
+    # make_app bisa dipanggil lebih dari sekali dalam satu proses
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_name(request) -> str:
+    # Response dari fast path cache tidak melewati router, cocokkan manual
+    if request.matched_route is not None:
+        return request.matched_route.name
+    mapper = request.registry.queryUtility(IRoutesMapper)
+    if mapper is not None:
+        route = mapper(request)["route"]
+        if route is not None:
+            return route.name
+    return "unmatched"
+
+
+def current_route():
+    """Nama route request yang sedang diproses thread / task ini (None di luar request)"""
+    stats = _current.get()
+    if stats is None:
+        return None
+    if stats.route is not None:
+        return stats.route
+    if stats.request is None:
+        return None
+    return route_name(stats.request)
+
+
+@contextlib.contextmanager
+def track_sql(route: str):
+    """
+    Hitung statement SQL di dalam blok untuk route (request di luar tween Pyramid, misal ASGI)
+
+    Yields:
+        SQLStats untuk diteruskan ke record_request
+    """
+    stats = SQLStats(route=route)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def record_request(route, method, status, elapsed, size, stats):
+    """Catat satu request (latency detik, ukuran body byte, SQLStats) ke metric route"""
+    key = (route, method)
+    with _lock:
+        status_key = (route, method, status)
+        _requests[status_key] = _requests.get(status_key, 0) + 1
+        if key not in _latency:
+            _latency[key] = Histogram(LATENCY_BUCKETS)
+            _sql_count[key] = Histogram(SQL_COUNT_BUCKETS)
+            _sql_seconds[key] = 0.0
+            _response_bytes[key] = 0
+        _latency[key].observe(elapsed)
+        _sql_count[key].observe(stats.count)
+        _sql_seconds[key] += stats.seconds
+        _response_bytes[key] += size
+
+
+def metrics_tween_factory(handler, registry):
+    def metrics_tween(request):
+        stats = SQLStats(request)
+        request.sql_stats = stats
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = handler(request)
+        finally:
+            _current.reset(token)
+        elapsed = time.perf_counter() - started
+
+        # content_length kosong untuk response streaming, dihitung 0
+        size = response.content_length or 0
+        record_request(route_name(request), request.method, response.status_code, elapsed, size, stats)
+
+        if APP_DEBUG:
+            response.headers["Server-Timing"] = (
+                f"app;dur={elapsed * 1000:.1f}, "
+                f"db;dur={stats.seconds * 1000:.1f};desc=\"{stats.count} queries\""
+            )
+        return response
+
+    return metrics_tween
+
+
+def _labels(**labels) -> str:
+    # pid dibaca saat render, proses prefork di-fork setelah modul ini di-import
+    labels = {"worker": os.getpid(), **labels}
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+def _write_histogram(lines, name, histograms):
+    for (route, method), hist in sorted(histograms.items()):
+        for bound, count in zip(hist.buckets, hist.counts):
+            lines.append(f"{name}_bucket{_labels(route=route, method=method, le=bound)} {count}")
+        lines.append(f"{name}_bucket{_labels(route=route, method=method, le='+Inf')} {hist.count}")
+        lines.append(f"{name}_sum{_labels(route=route, method=method)} {hist.sum}")
+        lines.append(f"{name}_count{_labels(route=route, method=method)} {hist.count}")
+
+
+def render_metrics() -> str:
+    """Semua metric proses ini (label worker = pid) dalam Prometheus text exposition format"""
+    # import di sini supaya helper ini tidak bergantung urutan import cache lain
+    from helpers.jwt_validate_helper import token_cache_stats
+
+    lines = []
+    with _lock:
+        lines.append("# HELP http_requests_total Total HTTP requests")
+        lines.append("# TYPE http_requests_total counter")
+        for (route, method, status), count in sorted(_requests.items()):
+            lines.append(f"http_requests_total{_labels(route=route, method=method, status=status)} {count}")
+
+        lines.append("# HELP http_request_duration_seconds Request latency")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        _write_histogram(lines, "http_request_duration_seconds", _latency)
+
+        lines.append("# HELP http_response_size_bytes_total Total response body bytes")
+        lines.append("# TYPE http_response_size_bytes_total counter")
+        for (route, method), size in sorted(_response_bytes.items()):
+            lines.append(f"http_response_size_bytes_total{_labels(route=route, method=method)} {size}")
+
+        lines.append("# HELP db_queries_per_request SQL statements executed per request")
+        lines.append("# TYPE db_queries_per_request histogram")
+        _write_histogram(lines, "db_queries_per_request", _sql_count)
+
+        lines.append("# HELP db_query_duration_seconds_total Total time spent in SQL statements")
+        lines.append("# TYPE db_query_duration_seconds_total counter")
+        for (route, method), seconds in sorted(_sql_seconds.items()):
+            lines.append(f"db_query_duration_seconds_total{_labels(route=route, method=method)} {seconds}")
+
+    cache = token_cache_stats()
+    lines.append("# HELP jwt_cache_events_total JWT verification cache lookups")
+    lines.append("# TYPE jwt_cache_events_total counter")
+    for result in ("hits", "misses", "rejected"):
+        lines.append(f"jwt_cache_events_total{_labels(result=result)} {cache[result]}")
+    lines.append("# TYPE jwt_cache_size gauge")
+    lines.append(f"jwt_cache_size{_labels()} {cache['size']}")
+    return "\n".join(lines) + "\n"
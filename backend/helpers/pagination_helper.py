@@ -0,0 +1,199 @@
+"""
+Pagination Helper - Pagination untuk list endpoint
+Mendukung offset (page/limit) dan keyset (cursor "after"), total dihitung dengan
+COUNT(*) memakai filter yang sama (atau estimasi pg_class untuk tabel besar)
+"""
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import func, select, text, tuple_
+
+
+COUNT_MODES = ("exact", "estimated", "none")
+
+# Di bawah jumlah ini estimasi pg_class tidak dipakai (COUNT exact masih murah)
+ESTIMATE_MIN_ROWS = 100000
+
+
+def get_pagination_params(params, default_limit: int = 10, max_limit: int = 100, required: bool = True):
+    """
+    Ambil parameter pagination dari query string
+
+    Query Parameters yang dibaca:
+    - page: nomor halaman (offset mode)
+    - limit: jumlah item per halaman
+    - after: cursor dari response sebelumnya (keyset mode, page diabaikan)
+    - count: exact | estimated | none
+
+    Args:
+        params: request.params
+        default_limit: limit default
+        max_limit: batas limit maksimum
+        required: jika False dan tidak ada parameter pagination, return None
+            (endpoint lama tetap mengembalikan semua data)
+
+    Returns:
+        Dictionary {page, limit, offset, after, count} atau None
+
+    Raises:
+        ValueError: If page/limit/count is invalid
+    """
+    if not required and not any(key in params for key in ("page", "limit", "after")):
+        return None
+
+    page = max(1, int(params.get("page", 1)))
+    limit = max(1, min(int(params.get("limit", default_limit)), max_limit))
+    count_mode = params.get("count", "exact")
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"count must be one of {', '.join(COUNT_MODES)}")
+
+    after = params.get("after") or None
+    return {
+        "page": page,
+        "limit": limit,
+        "offset": 0 if after else (page - 1) * limit,
+        "after": after,
+        "count": count_mode,
+    }
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def _decode_value(column, raw):
+    if raw is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is date:
+        return date.fromisoformat(raw)
+    if python_type is uuid.UUID:
+        return uuid.UUID(raw)
+    return python_type(raw)
+
+
+def encode_cursor(sort_value, row_id) -> str:
+    """Encode posisi baris terakhir menjadi cursor (base64url JSON)"""
+    payload = json.dumps([_encode_value(sort_value), _encode_value(row_id)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column, id_column) -> tuple:
+    """
+    Decode cursor menjadi (sort_value, id) sesuai tipe kolom
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_raw, id_raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return _decode_value(sort_column, sort_raw), _decode_value(id_column, id_raw)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def count_rows(session, stmt, mode: str = "exact"):
+    """
+    Hitung total baris dari statement (filter sama, tanpa ORDER BY / LIMIT)
+
+    Args:
+        session: SQLAlchemy session
+        stmt: select statement yang sudah berisi filter
+        mode: exact (COUNT(*)), estimated (pg_class.reltuples jika tanpa filter), none
+
+    Returns:
+        Total baris (int) atau None jika mode none
+    """
+    if mode == "none":
+        return None
+
+    # Estimasi hanya valid jika query tidak punya filter (total = isi seluruh tabel)
+    if mode == "estimated" and stmt.whereclause is None:
+        froms = stmt.get_final_froms()
+        if len(froms) == 1 and getattr(froms[0], "name", None):
+            estimate = session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": froms[0].name},
+            ).scalar()
+            if estimate is not None and estimate >= ESTIMATE_MIN_ROWS:
+                return int(estimate)
+
+    stmt = stmt.order_by(None).limit(None).offset(None)
+    if stmt._distinct or stmt._group_by_clauses:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+    else:
+        # SELECT count(*) FROM ... WHERE ... (tanpa memuat kolom, bisa index-only scan)
+        count_stmt = stmt.with_only_columns(func.count(), maintain_column_froms=True)
+    return session.execute(count_stmt).scalar() or 0
+
+
+def paginate(session, stmt, pagination: dict, sort_column, id_column, descending: bool = False):
+    """
+    Jalankan query dengan pagination (offset atau keyset)
+
+    Urutan selalu (sort_column, id_column) supaya hasil stabil antar halaman.
+
+    Args:
+        session: SQLAlchemy session
+        stmt: select(Model) yang sudah berisi filter
+        pagination: hasil get_pagination_params
+        sort_column: kolom urutan utama (misal Model.created_at), harus NOT NULL:
+            baris dengan NULL tidak pernah lolos perbandingan cursor dan hilang dari halaman berikutnya
+        id_column: kolom unik sebagai tie-breaker (misal Model.id)
+        descending: urutan menurun
+
+    Returns:
+        Tuple (items, meta) dengan meta {page, limit, total, nextCursor}
+
+    Raises:
+        ValueError: If cursor is invalid
+    """
+    total = count_rows(session, stmt, pagination["count"])
+
+    if descending:
+        stmt = stmt.order_by(None).order_by(sort_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(None).order_by(sort_column.asc(), id_column.asc())
+
+    if pagination["after"]:
+        sort_value, row_id = decode_cursor(pagination["after"], sort_column, id_column)
+        position = tuple_(sort_column, id_column)
+        stmt = stmt.where(position < (sort_value, row_id) if descending else position > (sort_value, row_id))
+    else:
+        stmt = stmt.offset(pagination["offset"])
+
+    # Ambil 1 baris ekstra untuk tahu apakah masih ada halaman berikutnya
+    rows = session.execute(stmt.limit(pagination["limit"] + 1)).scalars().all()
+    items = rows[: pagination["limit"]]
+
+    next_cursor = None
+    if len(rows) > pagination["limit"] and items:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+
+    meta = {
+        "page": pagination["page"],
+        "limit": pagination["limit"],
+        "total": total,
+        "nextCursor": next_cursor,
+    }
+    return items, meta
+
+
+def set_pagination_headers(response, meta: dict):
+    """Untuk endpoint yang response-nya array: total & cursor dikirim lewat header"""
+    if meta["total"] is not None:
+        response.headers["X-Total-Count"] = str(meta["total"])
+    if meta["nextCursor"]:
+        response.headers["X-Next-Cursor"] = meta["nextCursor"]
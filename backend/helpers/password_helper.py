@@ -0,0 +1,86 @@
+"""
+Password Helper - Hash & verifikasi password bcrypt
+bcrypt berjalan di thread request (WSGI sync: thread itu harus menunggu hasilnya juga),
+jumlah bcrypt yang berjalan bersamaan dibatasi setengah thread waitress, kelebihan langsung
+ditolak (503 + Retry-After) supaya burst login/register tidak menghabiskan semua thread
+"""
+import os
+import re
+import threading
+import bcrypt
+from pyramid.response import Response
+
+
+# Cost factor bcrypt (hash lama dengan cost berbeda di-rehash saat login)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Jumlah thread waitress per proses (serve.py mengisi dari --threads)
+WAITRESS_THREADS = int(os.getenv("WAITRESS_THREADS", "8"))
+
+# Maksimal bcrypt bersamaan per proses, default setengah thread waitress supaya
+# read path selalu kebagian thread; bcrypt melepas GIL jadi tetap paralel di beberapa core
+BCRYPT_CONCURRENCY = int(os.getenv("BCRYPT_CONCURRENCY", str(max(1, WAITRESS_THREADS // 2))))
+
+RETRY_AFTER_SECONDS = 1
+
+_BCRYPT_COST_PATTERN = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+_slots = threading.BoundedSemaphore(BCRYPT_CONCURRENCY)
+
+
+class PasswordHasherBusy(Exception):
+    """Semua slot bcrypt terpakai, request harus ditolak dengan 503"""
+
+
+def _run(func, *args):
+    # tidak menunggu slot: lebih baik 503 cepat daripada thread request ikut antri
+    if not _slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        return func(*args)
+    finally:
+        _slots.release()
+
+
+def _hash(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash password dengan bcrypt (cost BCRYPT_ROUNDS)
+
+    Raises:
+        PasswordHasherBusy: If semua slot bcrypt terpakai
+    """
+    return _run(_hash, password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """
+    Cek password terhadap hash bcrypt
+
+    Raises:
+        PasswordHasherBusy: If semua slot bcrypt terpakai
+    """
+    return _run(_verify, password, password_hash)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Cek apakah hash dibuat dengan cost yang berbeda dari BCRYPT_ROUNDS"""
+    match = _BCRYPT_COST_PATTERN.match(password_hash or "")
+    return not match or int(match.group(1)) != BCRYPT_ROUNDS
+
+
+def busy_response() -> Response:
+    """Response 503 untuk request yang ditolak karena slot bcrypt penuh"""
+    return Response(
+        json_body={"error": "Server sedang sibuk, silakan coba lagi"},
+        status=503,
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
@@ -0,0 +1,277 @@
+"""
+Payment Reconcile Helper - Cocokkan data settlement QRIS dengan booking
+Booking yang cocok langsung di-verify tanpa menunggu verifikasi manual agent
+"""
+import csv
+import io
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import or_, select
+
+from models.booking_model import Booking
+from models.package_model import Package
+from helpers.qris_helper import booking_id_range, booking_qris_reference, decode_qris_string
+
+
+# Booking dengan status ini masih boleh di-reconcile
+RECONCILABLE_STATUSES = ("unpaid", "pending_verification", "rejected")
+# Booking yang sudah ditutup tidak boleh dibuka lagi (mark_paid mengubah status jadi confirmed)
+CLOSED_BOOKING_STATUSES = ("cancelled", "completed")
+
+# Alias nama kolom CSV settlement (export dari dashboard PJP berbeda-beda)
+COLUMN_ALIASES = {
+    "amount": ("amount", "nominal", "jumlah", "total"),
+    "qris_string": ("qris_string", "qris", "qr_data", "payload"),
+    "reference": ("reference", "ref", "rrn", "transaction_id"),
+    "bill_number": ("bill_number", "reference_label", "bill_no", "invoice"),
+}
+
+
+# Rupiah: pemisah ribuan "." atau "," selalu diikuti tepat 3 digit ("8.000", "1,010,000")
+THOUSANDS_PATTERN = re.compile(r"^\d{1,3}([.,]\d{3})+$|^\d+$")
+# Desimal: ",dd" di akhir, atau ".dd" jika tidak ada pemisah lain ("7229.85" dari export mesin)
+DECIMALS_PATTERN = re.compile(r",(\d{1,2})$|^\d+\.(\d{1,2})$")
+
+
+def _normalize_amount(value):
+    """
+    Parse nominal rupiah dari CSV settlement
+
+    "Rp 8.000" -> 8000, "1.010" -> 1010, "1,010,000" -> 1010000, "1.010.000,50" -> 1010000.50,
+    "7229.85" -> 7229.85, "1010000.50" -> 1010000.50.
+    Desimal hanya ",dd" di akhir, atau ".dd" jika nominal tidak punya pemisah lain.
+
+    Raises:
+        ValueError: If format nominal tidak dikenali
+    """
+    if value is None:
+        return None
+    cleaned = re.sub(r"^(rp|idr)", "", str(value).strip().replace(" ", ""), flags=re.IGNORECASE)
+    decimals = "00"
+    match = DECIMALS_PATTERN.search(cleaned)
+    if match:
+        digits = match.group(1) or match.group(2)
+        decimals = digits.ljust(2, "0")
+        cleaned = cleaned[:len(cleaned) - len(digits) - 1]
+    if not THOUSANDS_PATTERN.match(cleaned):
+        raise ValueError(f"Invalid amount: {value}")
+    try:
+        return Decimal(f"{re.sub(r'[.,]', '', cleaned)}.{decimals}")
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value}")
+
+
+def _cell(raw: dict, column):
+    if not column:
+        return None
+    return (raw.get(column) or "").strip() or None
+
+
+def parse_settlement_csv(content: str) -> list:
+    """
+    Parse CSV settlement menjadi list row {amount, qris_string, reference, bill_number}
+
+    Args:
+        content: Isi file CSV (header wajib, minimal kolom amount atau qris_string)
+
+    Returns:
+        List of dictionary per baris; baris dengan amount invalid punya key "error"
+        (dilaporkan reconcile_settlements sebagai unmatched, baris lain tetap diproses)
+
+    Raises:
+        ValueError: If header tidak punya kolom amount / qris_string
+    """
+    reader = csv.DictReader(io.StringIO(content))
+    headers = {name.strip().lower(): name for name in (reader.fieldnames or [])}
+
+    columns = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        columns[key] = next((headers[alias] for alias in aliases if alias in headers), None)
+
+    if not columns["amount"] and not columns["qris_string"]:
+        raise ValueError("Settlement CSV must have an amount or qris_string column")
+
+    rows = []
+    for line_number, raw in enumerate(reader, start=2):
+        row = {
+            "line": line_number,
+            "amount": None,
+            "qris_string": _cell(raw, columns["qris_string"]),
+            "reference": _cell(raw, columns["reference"]),
+            "bill_number": _cell(raw, columns["bill_number"]),
+        }
+        amount = _cell(raw, columns["amount"])
+        try:
+            row["amount"] = _normalize_amount(amount)
+        except ValueError as e:
+            row["error"] = str(e)
+        if amount is None and row["qris_string"] is None and row["bill_number"] is None:
+            continue
+        rows.append(row)
+    return rows
+
+
+def _candidate_query(agent_id=None, include_closed: bool = False):
+    """
+    include_closed: ikut memuat booking cancelled / completed, supaya row yang menunjuk
+    booking tersebut (reference / qris_string) bisa dilaporkan, bukan dianggap tidak ditemukan
+    """
+    query = select(Booking).where(Booking.payment_status.in_(RECONCILABLE_STATUSES))
+    if not include_closed:
+        query = query.where(Booking.status.notin_(CLOSED_BOOKING_STATUSES))
+    if agent_id:
+        query = query.join(Package, Booking.package_id == Package.id).where(Package.agent_id == agent_id)
+    return query
+
+
+def reconcile_settlements(session, rows: list, agent_id=None) -> dict:
+    """
+    Cocokkan row settlement dengan booking lalu verify pembayaran secara bulk
+
+    Aturan pencocokan:
+        1. Row dengan reference booking (tag 62 sub-tag 05 dari qris_string yang valid,
+           atau kolom bill_number): cocok dengan booking pemilik reference tersebut
+        2. Row dengan qris_string tanpa reference (QRIS lama): QRIS harus valid (CRC) dan
+           sama persis dengan booking.payment_qris_string
+        3. Row hanya amount: cocok jika tepat satu booking punya payment_amount
+           tersebut dan amount itu hanya muncul sekali di settlement (selain itu ambiguous)
+        Untuk aturan 1 dan 2, jika row punya amount, amount harus sama.
+        Booking cancelled / completed tidak pernah di-verify: aturan 1 dan 2 melaporkannya
+        sebagai unmatched (reason booking_cancelled / booking_completed), aturan 3 mengabaikannya.
+
+    Semua kandidat di-load dengan 3 query dan di-update dalam satu commit.
+
+    Args:
+        session: SQLAlchemy session
+        rows: Hasil parse_settlement_csv
+        agent_id: Jika diisi, hanya booking dari paket milik agent ini
+
+    Returns:
+        Dictionary {matched, unmatched, ambiguous} berisi detail per row
+    """
+    summary = {"matched": [], "unmatched": [], "ambiguous": []}
+    matched_ids = set()
+
+    # Baris yang gagal di-parse tidak ikut dicocokkan
+    for row in rows:
+        if row.get("error"):
+            summary["unmatched"].append({"line": row["line"], "reason": "invalid_amount", "error": row["error"]})
+    rows = [row for row in rows if not row.get("error")]
+
+    def mark_paid(row, booking, rule):
+        if booking.status in CLOSED_BOOKING_STATUSES:
+            summary["unmatched"].append({
+                "line": row["line"],
+                "reason": f"booking_{booking.status}",
+                "bookingId": str(booking.id),
+            })
+            return
+        booking.payment_status = "verified"
+        booking.payment_verified_at = datetime.now()
+        booking.status = "confirmed"
+        booking.payment_rejection_reason = None
+        booking.payment_reference = row["reference"]
+        matched_ids.add(booking.id)
+        summary["matched"].append({
+            "line": row["line"],
+            "bookingId": str(booking.id),
+            "amount": float(booking.payment_amount) if booking.payment_amount is not None else None,
+            "rule": rule,
+        })
+
+    # 1. Cocokkan berdasarkan reference booking
+    decoded_rows = {}
+    references = {}
+    for row in rows:
+        label = row["bill_number"]
+        if row["qris_string"]:
+            decoded = decoded_rows[row["line"]] = decode_qris_string(row["qris_string"])
+            if decoded["valid"]:
+                label = decoded["reference"] or label
+        try:
+            if label:
+                references[row["line"]] = (label.upper(), booking_id_range(label.upper()))
+        except ValueError:
+            pass
+    reference_rows = [row for row in rows if row["line"] in references]
+
+    if reference_rows:
+        by_reference = {}
+        candidates = session.execute(
+            _candidate_query(agent_id, include_closed=True).where(
+                or_(*(Booking.id.between(*id_range) for _, id_range in references.values()))
+            )
+        ).scalars().all()
+        for booking in candidates:
+            by_reference.setdefault(booking_qris_reference(booking.id), []).append(booking)
+
+        for row in reference_rows:
+            label = references[row["line"]][0]
+            bookings = [b for b in by_reference.get(label, []) if b.id not in matched_ids]
+            if not bookings:
+                summary["unmatched"].append({"line": row["line"], "reason": "reference_not_found"})
+                continue
+            if len(bookings) > 1:
+                summary["ambiguous"].append({"line": row["line"], "bookingIds": [str(b.id) for b in bookings]})
+                continue
+            booking = bookings[0]
+            if row["amount"] is not None and booking.payment_amount != row["amount"]:
+                summary["unmatched"].append({"line": row["line"], "reason": "amount_mismatch"})
+                continue
+            mark_paid(row, booking, "reference")
+    rows = [row for row in rows if row["line"] not in references]
+
+    # 2. Cocokkan berdasarkan QRIS string (tanpa reference)
+    qris_rows = [row for row in rows if row["qris_string"]]
+    if qris_rows:
+        by_string = {}
+        candidates = session.execute(
+            _candidate_query(agent_id, include_closed=True).where(
+                Booking.payment_qris_string.in_({row["qris_string"] for row in qris_rows})
+            )
+        ).scalars().all()
+        for booking in candidates:
+            by_string.setdefault(booking.payment_qris_string, []).append(booking)
+
+        for row in qris_rows:
+            decoded = decoded_rows[row["line"]]
+            bookings = [b for b in by_string.get(row["qris_string"], []) if b.id not in matched_ids]
+            if not decoded["valid"] or not bookings:
+                summary["unmatched"].append({"line": row["line"], "reason": "qris_not_found"})
+                continue
+            if len(bookings) > 1:
+                summary["ambiguous"].append({"line": row["line"], "bookingIds": [str(b.id) for b in bookings]})
+                continue
+            booking = bookings[0]
+            if row["amount"] is not None and booking.payment_amount != row["amount"]:
+                summary["unmatched"].append({"line": row["line"], "reason": "amount_mismatch"})
+                continue
+            mark_paid(row, booking, "qris_string")
+
+    # 3. Cocokkan berdasarkan amount unik
+    amount_rows = [row for row in rows if not row["qris_string"] and row["amount"] is not None]
+    if amount_rows:
+        amount_counts = {}
+        for row in amount_rows:
+            amount_counts[row["amount"]] = amount_counts.get(row["amount"], 0) + 1
+
+        by_amount = {}
+        candidates = session.execute(
+            _candidate_query(agent_id).where(Booking.payment_amount.in_(set(amount_counts)))
+        ).scalars().all()
+        for booking in candidates:
+            if booking.id not in matched_ids:
+                by_amount.setdefault(booking.payment_amount, []).append(booking)
+
+        for row in amount_rows:
+            bookings = by_amount.get(row["amount"], [])
+            if not bookings:
+                summary["unmatched"].append({"line": row["line"], "reason": "amount_not_found"})
+            elif len(bookings) > 1 or amount_counts[row["amount"]] > 1:
+                summary["ambiguous"].append({"line": row["line"], "bookingIds": [str(b.id) for b in bookings]})
+            else:
+                mark_paid(row, bookings[0], "amount")
+
+    session.commit()
+    return summary
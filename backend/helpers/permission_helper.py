@@ -0,0 +1,131 @@
+"""
+Permission Helper - Cek role dan kepemilikan data secara deklaratif
+Ownership dicek di query yang sama dengan fetch objek (JOIN + predicate), tanpa lazy-load relasi
+"""
+import os
+import uuid
+from functools import wraps
+from pyramid.response import Response
+from sqlalchemy import false, select
+
+from models.booking_model import Booking
+from models.package_model import Package
+
+
+# User id (UUID, dipisah koma) yang boleh mengakses endpoint admin / diagnostik.
+# Bukan email: email bisa didaftarkan / diganti sendiri oleh user tanpa verifikasi
+ADMIN_USER_IDS = {
+    user_id.strip().lower() for user_id in os.getenv("ADMIN_USER_IDS", "").split(",") if user_id.strip()
+}
+
+# Aturan kepemilikan per jenis objek:
+# - model: model yang di-fetch
+# - joins: tabel yang perlu di-join untuk mencapai kolom pemilik
+# - owner: kolom pemilik per role (role lain tidak pernah dianggap pemilik)
+OWNERSHIP_RULES = {
+    "booking": {
+        "model": Booking,
+        "joins": [(Package, Booking.package_id == Package.id)],
+        "owner": {
+            "agent": Package.agent_id,
+            "tourist": Booking.tourist_id,
+        },
+        "not_found": "Booking not found",
+    },
+}
+
+
+def load_owned(session, owns: str, object_id, claims: dict):
+    """
+    Fetch objek beserta flag kepemilikan dalam satu query
+
+    Args:
+        session: SQLAlchemy session
+        owns: nama aturan di OWNERSHIP_RULES (misal "booking")
+        object_id: UUID / string UUID objek
+        claims: JWT claims (sub, role)
+
+    Returns:
+        Tuple (objek, is_owner) atau (None, False) jika objek tidak ditemukan
+    """
+    rule = OWNERSHIP_RULES[owns]
+    model = rule["model"]
+
+    try:
+        object_uuid = object_id if isinstance(object_id, uuid.UUID) else uuid.UUID(str(object_id))
+        user_uuid = uuid.UUID(str(claims.get("sub")))
+    except ValueError:
+        return None, False
+
+    owner_column = rule["owner"].get(claims.get("role"))
+    is_owner = (owner_column == user_uuid) if owner_column is not None else false()
+
+    query = select(model, is_owner.label("is_owner"))
+    for target, onclause in rule["joins"]:
+        query = query.join(target, onclause)
+    query = query.where(model.id == object_uuid)
+
+    row = session.execute(query).first()
+    if row is None:
+        return None, False
+    return row[0], bool(row.is_owner)
+
+
+def is_admin(claims: dict) -> bool:
+    """True jika user id (claim sub) terdaftar di ADMIN_USER_IDS"""
+    return str(claims.get("sub", "")).lower() in ADMIN_USER_IDS
+
+
+def requires(role=None, owns: str = None, id_param: str = "id", role_error: str = None, admin: bool = False):
+    """
+    Decorator otorisasi untuk view (dipasang di bawah @jwt_validate)
+
+    Args:
+        role: role yang diizinkan (string atau list/tuple), None = semua role
+        owns: nama aturan OWNERSHIP_RULES, objek diambil dari request.matchdict[id_param]
+        id_param: nama parameter route berisi ID objek
+        role_error: pesan error 403 jika role tidak sesuai
+        admin: hanya user dengan id di ADMIN_USER_IDS
+
+    Objek yang lolos cek disimpan di request.owned_object (session bisa diambil
+    dengan sqlalchemy.orm.object_session). Session tidak meng-expire objek saat
+    commit, jadi serialisasi response tidak memicu query ulang.
+    """
+    roles = (role,) if isinstance(role, str) else role
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            claims = request.jwt_claims
+            if admin and not is_admin(claims):
+                return Response(json_body={"error": "Admin access required"}, status=403)
+            if roles and claims.get("role") not in roles:
+                return Response(
+                    json_body={"error": role_error or f"Only {' / '.join(roles)} can access this resource"},
+                    status=403,
+                )
+
+            if owns:
+                object_id = request.matchdict.get(id_param)
+                if not object_id:
+                    return Response(json_body={"error": "ID is required"}, status=400)
+
+                session = request.dbsession
+                session.expire_on_commit = False
+                try:
+                    obj, is_owner = load_owned(session, owns, object_id, claims)
+                except Exception as e:
+                    return Response(json_body={"error": f"Internal server error: {str(e)}"}, status=500)
+
+                if obj is None:
+                    return Response(json_body={"error": OWNERSHIP_RULES[owns]["not_found"]}, status=404)
+                if not is_owner:
+                    return Response(json_body={"error": "Forbidden"}, status=403)
+
+                request.owned_object = obj
+
+            return func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
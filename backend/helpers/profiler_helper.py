@@ -0,0 +1,140 @@
+"""
+Profiler Helper - Diagnosa hot path saat runtime
+- sample_stacks: sampling profiler statistik atas semua thread proses (waitress worker dsb),
+  output collapsed stack ("frame;frame;frame count") yang bisa langsung dibaca flamegraph.pl / speedscope
+- profile_tween_factory: ?profile=1 (hanya APP_DEBUG + JWT admin) mengganti response dengan statistik cProfile request tersebut
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pyramid.response import Response
+
+from helpers.jwt_validate_helper import verify_token
+from helpers.logging_helper import redact_query
+from helpers.metrics_helper import APP_DEBUG
+from helpers.permission_helper import is_admin
+
+
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+# Jumlah baris statistik cProfile untuk ?profile=1
+PROFILE_STATS_LIMIT = int(os.getenv("PROFILE_STATS_LIMIT", "50"))
+
+# Frame teratas thread yang sedang menunggu (idle), dibuang kecuali include_idle
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("wasyncore.py", "poll"),
+}
+
+# Satu sampling sekaligus per proses
+_sampling = threading.Lock()
+# Satu cProfile sekaligus per proses (Python >= 3.12: profiler kedua gagal dengan ValueError)
+_cprofile = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    """Sampling lain masih berjalan di proses ini"""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    # ";" adalah pemisah frame di format collapsed
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+def sample_stacks(seconds: float, interval: float = 0.005, include_idle: bool = False) -> dict:
+    """
+    Ambil stack semua thread setiap interval selama N detik
+
+    Args:
+        seconds: lama sampling (dibatasi PROFILE_MAX_SECONDS)
+        interval: jeda antar sample (detik)
+        include_idle: ikutkan thread yang sedang menunggu (lock, select, queue)
+
+    Returns:
+        Dictionary {samples, seconds, stacks: Counter {"thread;frame;...": jumlah}}
+
+    Raises:
+        ProfilerBusy: If sampling lain sedang berjalan
+    """
+    if not _sampling.acquire(blocking=False):
+        raise ProfilerBusy("Another profile is already running")
+    try:
+        seconds = min(max(seconds, 0.1), PROFILE_MAX_SECONDS)
+        interval = max(interval, 0.001)
+        own_id = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+        deadline = time.monotonic() + seconds
+
+        while time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                top = (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+                if not include_idle and top in IDLE_FRAMES:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)).replace(";", ":"))
+                stacks[";".join(reversed(labels))] += 1
+            samples += 1
+            time.sleep(interval)
+
+        return {"samples": samples, "seconds": seconds, "stacks": stacks}
+    finally:
+        _sampling.release()
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Format collapsed stack, satu baris per stack diurutkan dari yang paling sering"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def _is_admin_request(request) -> bool:
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return False
+    try:
+        return is_admin(verify_token(auth_header[7:]))
+    except Exception:
+        return False
+
+
+def profile_tween_factory(handler, registry):
+    if not APP_DEBUG:
+        return handler
+
+    def profile_tween(request):
+        # bukan admin: parameter profile diabaikan, request diproses seperti biasa
+        if request.GET.get("profile") != "1" or not _is_admin_request(request):
+            return handler(request)
+
+        if not _cprofile.acquire(blocking=False):
+            return Response(json_body={"error": "Another profile is already running"}, status=409)
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                response = handler(request)
+            finally:
+                profiler.disable()
+        finally:
+            _cprofile.release()
+
+        output = io.StringIO()
+        output.write(f"{request.method} {redact_query(request.path, request.query_string)} -> {response.status}\n\n")
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats("cumulative").print_stats(PROFILE_STATS_LIMIT)
+        return Response(text=output.getvalue(), content_type="text/plain", charset="utf-8")
+
+    return profile_tween
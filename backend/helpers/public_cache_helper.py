@@ -0,0 +1,89 @@
+"""
+Public Cache Helper - Fast path untuk GET publik (katalog package, destinasi, review)
+Response disimpan sebentar di memori, cache hit langsung dikembalikan tanpa routing,
+parsing auth, maupun membuka session / koneksi database
+"""
+import os
+import re
+import threading
+import time
+from pyramid.response import Response
+
+
+# Umur cache (detik), 0 = fast path dimatikan
+PUBLIC_CACHE_TTL = float(os.getenv("PUBLIC_CACHE_TTL", "5"))
+PUBLIC_CACHE_SIZE = int(os.getenv("PUBLIC_CACHE_SIZE", "1024"))
+
+# Path GET yang response-nya tidak bergantung pada user (view tanpa @jwt_validate)
+PUBLIC_GET_PATHS = [
+    re.compile(r"^/api/packages/?$"),
+    re.compile(r"^/api/packages/agent/[^/]+/?$"),
+    re.compile(r"^/api/packages/[^/]+/?$"),
+    re.compile(r"^/api/destinations/?$"),
+    re.compile(r"^/api/destinations/[^/]+/?$"),
+    re.compile(r"^/api/reviews/package/[^/]+/?$"),
+]
+
+# Request tulis (selain GET/HEAD/OPTIONS) ke path ini membuat cache dikosongkan,
+# write lain (login, refresh, booking, ...) tidak mengubah response publik
+INVALIDATING_PATHS = re.compile(r"^/api/(packages|destinations|reviews)(/|$)")
+
+# Header response yang ikut disimpan
+CACHED_HEADERS = ("Content-Type", "X-Total-Count", "X-Next-Cursor")
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_lock = threading.Lock()
+_cache = {}  # path?query -> (stored_at, status, headers, body)
+
+
+def _is_public(path: str) -> bool:
+    return any(pattern.match(path) for pattern in PUBLIC_GET_PATHS)
+
+
+def clear_public_cache():
+    """Kosongkan cache (dipanggil otomatis setelah request yang mengubah package / destinasi / review)"""
+    with _lock:
+        _cache.clear()
+
+
+def public_cache_tween_factory(handler, registry):
+    if PUBLIC_CACHE_TTL <= 0:
+        return handler
+
+    def public_cache_tween(request):
+        if request.method != "GET":
+            response = handler(request)
+            # Data katalog berubah, response publik yang tersimpan sudah tidak valid
+            if (
+                request.method not in SAFE_METHODS
+                and response.status_code < 400
+                and INVALIDATING_PATHS.match(request.path)
+            ):
+                clear_public_cache()
+            return response
+
+        if not _is_public(request.path):
+            return handler(request)
+
+        key = request.path_qs
+        now = time.monotonic()
+        entry = _cache.get(key)
+        if entry is not None and now - entry[0] < PUBLIC_CACHE_TTL:
+            stored_at, status, headers, body = entry
+            return Response(body=body, status=status, headerlist=list(headers))
+
+        response = handler(request)
+        if response.status_code == 200:
+            headers = [(name, value) for name, value in response.headerlist if name in CACHED_HEADERS]
+            with _lock:
+                if len(_cache) >= PUBLIC_CACHE_SIZE:
+                    # buang entry expired, kalau masih penuh kosongkan saja
+                    for stale in [k for k, v in _cache.items() if now - v[0] >= PUBLIC_CACHE_TTL]:
+                        del _cache[stale]
+                    if len(_cache) >= PUBLIC_CACHE_SIZE:
+                        _cache.clear()
+                _cache[key] = (now, response.status, tuple(headers), response.body)
+        return response
+
+    return public_cache_tween
@@ -0,0 +1,183 @@
+"""
+QR Image Helper - Decode QR code dari gambar upload dan render QR code ke PNG
+Pipeline decode bertahap: gambar kecil + grayscale dulu (kasus umum, cepat),
+baru fallback ke crop area QR, resolusi penuh, dan threshold kalau gagal
+pyzbar (butuh library zbar) hanya di-import saat decode, render QR tidak bergantung zbar
+"""
+import time
+from io import BytesIO
+from PIL import Image, ImageFilter, ImageOps
+import qrcode
+
+
+# Sisi terpanjang gambar untuk percobaan pertama (cukup untuk QR di foto HP)
+DECODE_MAX_SIDE = 1024
+
+# Ambang edge untuk mencari area yang kemungkinan berisi QR code
+EDGE_THRESHOLD = 64
+
+# Padding crop (persentase dari ukuran bounding box)
+CROP_PADDING = 0.08
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _decode_qr(image: Image.Image):
+    """Decode hanya simbol QR (lebih cepat daripada scan semua jenis barcode)"""
+    from pyzbar.pyzbar import decode, ZBarSymbol
+
+    return decode(image, symbols=[ZBarSymbol.QRCODE])
+
+
+def _downscale(image: Image.Image, max_side: int = DECODE_MAX_SIDE) -> Image.Image:
+    if max(image.size) <= max_side:
+        return image
+    scaled = image.copy()
+    scaled.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+    return scaled
+
+
+def _threshold(image: Image.Image) -> Image.Image:
+    """Normalisasi kontras lalu binarisasi (membantu foto gelap / silau)"""
+    stretched = ImageOps.autocontrast(image, cutoff=2)
+    return stretched.point(lambda p: 255 if p > 127 else 0)
+
+
+def _candidate_regions(small: Image.Image) -> list:
+    """
+    Cari area yang kemungkinan berisi QR code pada gambar kecil
+
+    Returns:
+        List of (left, top, right, bottom) dalam rasio 0..1 terhadap ukuran gambar
+    """
+    width, height = small.size
+    regions = []
+
+    # Area dengan edge padat (modul QR menghasilkan banyak edge)
+    edges = small.filter(ImageFilter.FIND_EDGES).point(
+        lambda p: 255 if p > EDGE_THRESHOLD else 0
+    )
+    # MaxFilter menyatukan edge yang rapat (area QR), MinFilter membuang edge tipis yang terisolasi
+    dense = edges.filter(ImageFilter.MaxFilter(5)).filter(ImageFilter.MinFilter(9))
+    bbox = dense.getbbox() or edges.getbbox()
+    if bbox:
+        left, top, right, bottom = bbox
+        pad_x = (right - left) * CROP_PADDING
+        pad_y = (bottom - top) * CROP_PADDING
+        regions.append((
+            max(0.0, (left - pad_x) / width),
+            max(0.0, (top - pad_y) / height),
+            min(1.0, (right + pad_x) / width),
+            min(1.0, (bottom + pad_y) / height),
+        ))
+
+    # Fallback: QR biasanya difoto di tengah frame
+    regions.append((0.2, 0.2, 0.8, 0.8))
+    return regions
+
+
+def _crop_ratio(image: Image.Image, region: tuple) -> Image.Image:
+    width, height = image.size
+    left, top, right, bottom = region
+    return image.crop((
+        int(left * width),
+        int(top * height),
+        int(right * width),
+        int(bottom * height),
+    ))
+
+
+def decode_qr_image(image_data: bytes) -> dict:
+    """
+    Decode QR code dari bytes gambar dengan beberapa strategi bertahap
+
+    Urutan strategi:
+        1. downscaled  - gambar diperkecil + grayscale (kasus umum, hitungan milidetik)
+        2. crop        - crop area yang kemungkinan berisi QR dari resolusi penuh, diperkecil
+        3. full        - resolusi penuh grayscale
+        4. threshold   - binarisasi pada gambar kecil dan hasil crop
+
+    Args:
+        image_data: Bytes file gambar (jpeg, png, gif)
+
+    Returns:
+        Dictionary berisi:
+        - data: string hasil decode (None jika gagal)
+        - strategy: nama strategi yang berhasil (None jika gagal)
+        - timings: waktu tiap tahap dalam milidetik
+
+    Raises:
+        PIL.UnidentifiedImageError: Jika bytes bukan gambar yang valid
+    """
+    timings = {}
+    result = {"data": None, "strategy": None, "timings": timings}
+
+    def attempt(name, images):
+        started = time.perf_counter()
+        try:
+            for candidate in images:
+                decoded = _decode_qr(candidate)
+                if decoded and decoded[0].data:
+                    result["data"] = decoded[0].data.decode("utf-8")
+                    result["strategy"] = name
+                    return True
+            return False
+        finally:
+            timings[name] = _elapsed_ms(started)
+
+    # Load: JPEG draft mode men-decode langsung di skala kecil (jauh lebih cepat untuk foto 12MP)
+    started = time.perf_counter()
+    small_source = Image.open(BytesIO(image_data))
+    small_source.draft("L", (DECODE_MAX_SIDE, DECODE_MAX_SIDE))
+    small = _downscale(ImageOps.grayscale(small_source))
+    timings["load"] = _elapsed_ms(started)
+
+    if attempt("downscaled", [small]):
+        return result
+
+    # Resolusi penuh hanya di-load kalau percobaan murah gagal
+    started = time.perf_counter()
+    full = ImageOps.grayscale(Image.open(BytesIO(image_data)))
+    timings["load_full"] = _elapsed_ms(started)
+
+    # Crop area QR dari resolusi penuh lalu diperkecil: QR kecil di foto besar tetap terbaca
+    regions = _candidate_regions(small)
+    crops = [_downscale(_crop_ratio(full, region)) for region in regions]
+    if attempt("crop", crops):
+        return result
+
+    if full.size != small.size and attempt("full", [full]):
+        return result
+
+    attempt("threshold", (_threshold(candidate) for candidate in [small] + crops))
+    return result
+
+
+def make_qr_image(data: str):
+    """
+    Render QR code dari string (format sama dengan QR yang dibuat di view QRIS)
+
+    Args:
+        data: Isi QR code (QRIS string)
+
+    Returns:
+        PIL image QR code hitam-putih
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.make_image(fill_color="black", back_color="white")
+
+
+def render_qr_png(data: str) -> bytes:
+    """Render QR code dari string langsung ke bytes PNG"""
+    buffer = BytesIO()
+    make_qr_image(data).save(buffer, format="PNG")
+    return buffer.getvalue()
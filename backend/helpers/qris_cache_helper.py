@@ -0,0 +1,85 @@
+"""
+QRIS Cache Helper - Cache process-local untuk konfigurasi QRIS merchant yang aktif
+Checkout tidak perlu memuat & parse ulang QRIS merchant, cukup cek id QRIS aktif
+sesekali (invalidate_active_qris hanya berlaku di proses ini, proses lain tahu lewat cek id)
+"""
+import os
+import threading
+import time
+from sqlalchemy import select
+
+from db import Session
+from models.qris_model import Qris
+from helpers.qris_helper import prepare_qris_template
+
+
+# Interval cek id QRIS aktif (detik). Row QRIS tidak pernah diubah di tempat (ganti = row baru),
+# jadi id yang sama berarti snapshot masih valid; proses lain ter-update paling lambat sebesar ini
+QRIS_CACHE_TTL = float(os.getenv("QRIS_CACHE_TTL", "5"))
+
+_lock = threading.Lock()
+_cache = {"checked_at": None, "value": None}
+
+
+def _build_snapshot(qris: Qris) -> dict:
+    return {
+        "id": qris.id,
+        "static_qris_string": qris.static_qris_string,
+        "foto_qr_path": qris.foto_qr_path,
+        "template": prepare_qris_template(qris.static_qris_string),
+        "fee_type": qris.fee_type,
+        "fee_value": float(qris.fee_value) if qris.fee_value else None,
+        "created_at": qris.created_at,
+    }
+
+
+def _load_active_qris() -> dict:
+    with Session() as session:
+        qris = session.execute(
+            select(Qris).where(Qris.is_active.is_(True))
+        ).scalar_one_or_none()
+        return _build_snapshot(qris) if qris else None
+
+
+def _active_qris_id():
+    # lewat partial index uq_qris_single_active, tanpa memuat string QRIS
+    with Session() as session:
+        return session.execute(select(Qris.id).where(Qris.is_active.is_(True))).scalar_one_or_none()
+
+
+def get_active_qris() -> dict:
+    """
+    Ambil konfigurasi QRIS merchant yang aktif (dari cache jika id QRIS aktif belum berubah)
+
+    Returns:
+        Dictionary snapshot QRIS aktif (id, static_qris_string, template,
+        fee_type, fee_value, created_at) atau None jika belum ada QRIS aktif
+    """
+    checked_at = _cache["checked_at"]
+    if checked_at is not None and time.monotonic() - checked_at < QRIS_CACHE_TTL:
+        return _cache["value"]
+
+    with _lock:
+        # Cek ulang, mungkin thread lain sudah mengisi cache
+        checked_at = _cache["checked_at"]
+        if checked_at is not None and time.monotonic() - checked_at < QRIS_CACHE_TTL:
+            return _cache["value"]
+
+        value = _cache["value"]
+        if checked_at is None:
+            value = _load_active_qris()
+        else:
+            active_id = _active_qris_id()
+            if active_id != (value["id"] if value else None):
+                value = _load_active_qris()
+
+        _cache["value"] = value
+        _cache["checked_at"] = time.monotonic()
+        return value
+
+
+def invalidate_active_qris():
+    """Hapus cache QRIS aktif di proses ini (dipanggil setelah QRIS dibuat atau dihapus)"""
+    with _lock:
+        _cache["value"] = None
+        _cache["checked_at"] = None
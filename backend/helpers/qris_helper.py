@@ -2,6 +2,14 @@
 QRIS Helper - Generate dan validasi dynamic QRIS string
 Mengikuti standard QRIS Indonesia
 """
+import logging
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+# Reference label (tag 62 sub-tag 05) maksimal 25 karakter
+REFERENCE_LABEL_LENGTH = 25
 
 
 def crc16(data: str) -> str:
@@ -28,23 +36,90 @@ def crc16(data: str) -> str:
     return hex_value
 
 
-def generate_dynamic_qris_string(
-    static_qris: str,
-    amount: float,
-    fee_type: str = None,
-    fee_value: float = None
-) -> str:
+def parse_qris_tlv(qris_string: str) -> dict:
     """
-    Generate dynamic QRIS string from static QRIS with amount and fee information
+    Parse top-level TLV (tag-length-value) dari QRIS string
+    
+    Args:
+        qris_string: QRIS string (statis atau dinamis)
+    
+    Returns:
+        Dictionary tag -> value, contoh {"00": "01", "01": "11", "58": "ID", ...}
+    
+    Raises:
+        ValueError: If TLV structure is malformed
+    """
+    tags = {}
+    idx = 0
+    while idx < len(qris_string):
+        tag = qris_string[idx : idx + 2]
+        length_str = qris_string[idx + 2 : idx + 4]
+        if len(tag) != 2 or not length_str.isdigit():
+            raise ValueError(f"Format TLV QRIS tidak valid pada posisi {idx}.")
+        length = int(length_str)
+        value = qris_string[idx + 4 : idx + 4 + length]
+        if len(value) != length:
+            raise ValueError(f"Panjang value tag {tag} tidak sesuai.")
+        tags[tag] = value
+        idx += 4 + length
+    return tags
+
+
+def _build_tlv(tags: dict) -> str:
+    """Susun ulang dictionary tag -> value menjadi TLV (urut berdasarkan tag)"""
+    parts = []
+    for tag, value in sorted(tags.items()):
+        if len(value) > 99:
+            raise ValueError(f"Value tag {tag} melebihi 99 karakter.")
+        parts.append(f"{tag}{len(value):02d}{value}")
+    return "".join(parts)
+
+
+def booking_qris_reference(booking_id) -> str:
+    """
+    Reference label QRIS untuk booking (25 digit hex pertama dari UUID booking)
+
+    Args:
+        booking_id: UUID booking
+
+    Returns:
+        Reference label uppercase, contoh "3F2A9C0E1B7D4E5F8A6B2C1D0"
+    """
+    return uuid.UUID(str(booking_id)).hex[:REFERENCE_LABEL_LENGTH].upper()
+
+
+def booking_id_range(reference: str) -> tuple:
+    """
+    Rentang UUID booking yang reference label-nya sama dengan reference
+
+    Args:
+        reference: Hasil booking_qris_reference
+
+    Returns:
+        Tuple (UUID terkecil, UUID terbesar), dipakai untuk query BETWEEN pada primary key
+
+    Raises:
+        ValueError: If reference bukan hex 25 karakter
+    """
+    if len(reference) != REFERENCE_LABEL_LENGTH:
+        raise ValueError("Reference label QRIS tidak valid.")
+    return uuid.UUID(reference.ljust(32, "0")), uuid.UUID(reference.ljust(32, "f"))
+
+
+def prepare_qris_template(static_qris: str) -> dict:
+    """
+    Siapkan template dari static QRIS supaya generate dynamic QRIS
+    cukup dengan menyambung string + hitung CRC (tanpa parsing ulang)
     
     Args:
         static_qris: Static QRIS string (dari scan/upload QR)
-        amount: Amount to be paid in rupiah
-        fee_type: Fee type ('persentase' or 'rupiah'), optional
-        fee_value: Fee value, optional
     
     Returns:
-        Dynamic QRIS string with amount info (atau static QRIS jika format tidak bisa dikonversi)
+        Dictionary berisi:
+        - prefix: payload sebelum tag country code (sudah diubah ke dynamic 010212)
+        - suffix: payload mulai setelah "5802ID" (tanpa CRC)
+        - suffix_tags: TLV suffix (tanpa tag 63), untuk menyisipkan reference di tag 62
+        Nilai prefix/suffix None jika format QRIS non-standard
     
     Raises:
         ValueError: If QRIS format is invalid
@@ -53,20 +128,53 @@ def generate_dynamic_qris_string(
     if not static_qris or len(static_qris) < 4:
         raise ValueError("Data QRIS statis tidak valid.")
     
+    # Remove CRC from static QRIS (last 4 chars)
+    qris_without_crc = static_qris[:-4]
+    
+    # Convert static to dynamic (010211 -> 010212)
+    step1 = qris_without_crc.replace("010211", "010212")
+    
+    # Split by country code
+    parts = step1.split("5802ID")
+    if len(parts) != 2:
+        return {"static_qris": static_qris, "prefix": None, "suffix": None, "suffix_tags": None}
+    
+    suffix = parts[1]
+    try:
+        suffix_tags = parse_qris_tlv(suffix[:-4] if suffix.endswith("6304") else suffix)
+    except ValueError:
+        suffix_tags = None
+    
+    return {"static_qris": static_qris, "prefix": parts[0], "suffix": suffix, "suffix_tags": suffix_tags}
+
+
+def build_dynamic_qris_string(
+    template: dict,
+    amount: float,
+    fee_type: str = None,
+    fee_value: float = None,
+    reference: str = None
+) -> str:
+    """
+    Generate dynamic QRIS string dari template hasil prepare_qris_template
+    
+    Args:
+        template: Template dari prepare_qris_template
+        amount: Amount to be paid in rupiah
+        fee_type: Fee type ('persentase' or 'rupiah'), optional
+        fee_value: Fee value, optional
+        reference: Reference label (tag 62 sub-tag 05), optional. Dengan reference,
+            dua booking dengan total yang sama tetap mendapat QRIS berbeda
+    
+    Returns:
+        Dynamic QRIS string with amount info (atau static QRIS jika format tidak bisa dikonversi)
+    """
+    if template["prefix"] is None:
+        # Jika format tidak sesuai, return static QRIS dengan info amount di note
+        # Ini untuk QRIS format yang non-standard
+        return template["static_qris"]
+    
     try:
-        # Remove CRC from static QRIS (last 4 chars)
-        qris_without_crc = static_qris[:-4]
-        
-        # Convert static to dynamic (010211 -> 010212)
-        step1 = qris_without_crc.replace("010211", "010212")
-        
-        # Split by country code
-        parts = step1.split("5802ID")
-        if len(parts) != 2:
-            # Jika format tidak sesuai, return static QRIS dengan info amount di note
-            # Ini untuk QRIS format yang non-standard
-            return static_qris
-        
         # Generate amount tag
         amount_int = int(amount)
         amount_str = str(amount_int)
@@ -87,8 +195,17 @@ def generate_dynamic_qris_string(
                 fee_length = str(len(fee_str)).zfill(2)
                 fee_tag = f"55020357{fee_length}{fee_str}"
         
+        # Sisipkan reference ke additional data (tag 62), tag lain tetap urut
+        suffix = template["suffix"]
+        if reference and template.get("suffix_tags") is not None:
+            tags = dict(template["suffix_tags"])
+            additional = parse_qris_tlv(tags.get("62", ""))
+            additional["05"] = reference[:REFERENCE_LABEL_LENGTH]
+            tags["62"] = _build_tlv(additional)
+            suffix = _build_tlv(tags) + "6304"
+        
         # Construct final payload
-        payload = f"{parts[0]}{amount_tag}{fee_tag}5802ID{parts[1]}"
+        payload = f"{template['prefix']}{amount_tag}{fee_tag}5802ID{suffix}"
         
         # Calculate and append CRC
         final_crc = crc16(payload)
@@ -96,9 +213,56 @@ def generate_dynamic_qris_string(
         return payload + final_crc
     
     except Exception as e:
-        print(f"Warning: Could not generate dynamic QRIS: {str(e)}. Returning static QRIS.")
+        logger.warning(f"Could not generate dynamic QRIS: {str(e)}. Returning static QRIS.")
         # Fallback: return static QRIS if conversion fails
-        return static_qris
+        return template["static_qris"]
+
+
+def generate_dynamic_qris_string(
+    static_qris: str,
+    amount: float,
+    fee_type: str = None,
+    fee_value: float = None,
+    reference: str = None
+) -> str:
+    """
+    Generate dynamic QRIS string from static QRIS with amount and fee information
+    
+    Args:
+        static_qris: Static QRIS string (dari scan/upload QR)
+        amount: Amount to be paid in rupiah
+        fee_type: Fee type ('persentase' or 'rupiah'), optional
+        fee_value: Fee value, optional
+        reference: Reference label (tag 62 sub-tag 05), optional
+    
+    Returns:
+        Dynamic QRIS string with amount info (atau static QRIS jika format tidak bisa dikonversi)
+    
+    Raises:
+        ValueError: If QRIS format is invalid
+    """
+    template = prepare_qris_template(static_qris)
+    return build_dynamic_qris_string(template, amount, fee_type, fee_value, reference)
+
+
+def calculate_total_amount(amount: float, fee_type: str = None, fee_value: float = None) -> float:
+    """
+    Hitung total pembayaran (amount + fee)
+    
+    Args:
+        amount: Amount in rupiah
+        fee_type: Fee type ('persentase' or 'rupiah'), optional
+        fee_value: Fee value, optional
+    
+    Returns:
+        Total amount termasuk fee
+    """
+    total_amount = amount
+    if fee_type == "rupiah" and fee_value:
+        total_amount += float(fee_value)
+    elif fee_type == "persentase" and fee_value:
+        total_amount += (amount * float(fee_value) / 100)
+    return total_amount
 
 
 def decode_qris_string(qris_string: str) -> dict:
@@ -119,6 +283,7 @@ def decode_qris_string(qris_string: str) -> dict:
         "amount": None,
         "merchant_name": None,
         "city_code": None,
+        "reference": None,
     }
     
     if not qris_string or len(qris_string) < 4:
@@ -140,15 +305,25 @@ def decode_qris_string(qris_string: str) -> dict:
     elif "010211" in qris_string:
         result["is_static"] = True
     
-    # Extract amount (tag 54)
-    if "54" in qris_string:
+    # Extract amount (tag 54), merchant name (59) dan kota (60) dari TLV
+    try:
+        tags = parse_qris_tlv(qris_string)
+    except ValueError:
+        tags = {}
+    
+    if "54" in tags:
+        try:
+            result["amount"] = float(tags["54"])
+        except ValueError:
+            pass
+    result["merchant_name"] = tags.get("59")
+    result["city_code"] = tags.get("60")
+    
+    # Reference label (sub-tag 05) dari additional data (tag 62)
+    if "62" in tags:
         try:
-            idx = qris_string.find("54")
-            if idx != -1:
-                length = int(qris_string[idx + 2 : idx + 4])
-                amount_str = qris_string[idx + 4 : idx + 4 + length]
-                result["amount"] = float(amount_str)
-        except (ValueError, IndexError):
+            result["reference"] = parse_qris_tlv(tags["62"]).get("05")
+        except ValueError:
             pass
     
     return result
@@ -0,0 +1,301 @@
+"""
+Rate Limit Helper - Token bucket per IP dan per akun untuk endpoint auth & upload
+Backend memory (satu proses) atau SQLite (bucket dibagi antar proses/worker)
+"""
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from pyramid.response import Response
+
+from helpers.jwt_validate_helper import verify_token
+
+
+logger = logging.getLogger(__name__)
+
+
+# memory | sqlite | off
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_SQLITE_PATH = os.getenv("RATE_LIMIT_SQLITE_PATH", "storage/rate_limit.sqlite3")
+
+# Ambil IP client dari X-Forwarded-For (hanya jika di belakang reverse proxy yang dipercaya)
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "0") == "1"
+
+
+def _budget(env_name: str, default: str):
+    """Baca budget "jumlah/detik" dari env, misal RATE_LIMIT_LOGIN_IP=20/60"""
+    count, seconds = os.getenv(env_name, default).split("/")
+    return int(count), float(seconds)
+
+
+# Budget per route: (method, pola path, budget per IP, budget per akun, budget per email)
+# Akun = email dari body + IP (login) atau claim sub JWT (upload).
+# per_email (login): budget email lintas IP, lebih longgar dari per_account supaya rotasi IP
+# tidak memberi budget baru untuk brute force, tapi spam dari IP lain tidak langsung mengunci pemilik akun
+RATE_LIMIT_RULES = [
+    {
+        "name": "login",
+        "method": "POST",
+        "path": re.compile(r"^/api/auth/login/?$"),
+        "per_ip": _budget("RATE_LIMIT_LOGIN_IP", "20/60"),
+        "per_account": _budget("RATE_LIMIT_LOGIN_ACCOUNT", "5/60"),
+        "per_email": _budget("RATE_LIMIT_LOGIN_EMAIL", "30/900"),
+        "account": "email",
+    },
+    {
+        "name": "register",
+        "method": "POST",
+        "path": re.compile(r"^/api/auth/register/?$"),
+        "per_ip": _budget("RATE_LIMIT_REGISTER_IP", "10/600"),
+        "per_account": None,
+        "account": None,
+    },
+    {
+        "name": "refresh",
+        "method": "POST",
+        "path": re.compile(r"^/api/auth/refresh/?$"),
+        "per_ip": _budget("RATE_LIMIT_REFRESH_IP", "60/60"),
+        "per_account": None,
+        "account": None,
+    },
+    {
+        "name": "qris_upload",
+        "method": "POST",
+        "path": re.compile(r"^/api/qris/?$"),
+        "per_ip": _budget("RATE_LIMIT_UPLOAD_IP", "20/60"),
+        "per_account": _budget("RATE_LIMIT_UPLOAD_ACCOUNT", "10/60"),
+        "account": "jwt",
+    },
+    {
+        "name": "payment_proof_upload",
+        "method": "POST",
+        "path": re.compile(r"^/api/bookings/[^/]+/payment-proof/?$"),
+        "per_ip": _budget("RATE_LIMIT_UPLOAD_IP", "20/60"),
+        "per_account": _budget("RATE_LIMIT_UPLOAD_ACCOUNT", "10/60"),
+        "account": "jwt",
+    },
+]
+
+
+# Bucket yang tidak disentuh selama periode terpanjang pasti sudah penuh lagi (sama dengan tidak ada)
+MAX_PERIOD = max(
+    budget[1]
+    for rule in RATE_LIMIT_RULES
+    for budget in (rule["per_ip"], rule["per_account"], rule.get("per_email"))
+    if budget
+)
+PRUNE_INTERVAL = 60
+
+
+def _refill(tokens: float, updated_at: float, now: float, capacity: int, period: float) -> float:
+    return min(capacity, tokens + max(0.0, now - updated_at) * capacity / period)
+
+
+def _decide(levels: list) -> float:
+    """
+    levels: list (tokens setelah refill, capacity, period) semua bucket request ini
+
+    Returns:
+        0 jika semua bucket punya token (semua didebit), selain itu Retry-After (tidak ada yang didebit)
+    """
+    return max(
+        ((1 - tokens) * period / capacity for tokens, capacity, period in levels if tokens < 1),
+        default=0.0,
+    )
+
+
+class MemoryBackend:
+    """Bucket disimpan di dict proses ini (cukup untuk satu proses waitress)"""
+
+    def __init__(self):
+        self._buckets = {}  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+        self._pruned_at = time.monotonic()
+
+    def take_all(self, buckets: list) -> float:
+        """
+        Ambil satu token dari setiap bucket, hanya jika semua bucket masih punya token
+
+        Args:
+            buckets: list (key, capacity, period)
+
+        Returns:
+            0 jika diizinkan, selain itu detik sampai request boleh dicoba lagi
+        """
+        now = time.monotonic()
+        with self._lock:
+            levels = []
+            for key, capacity, period in buckets:
+                tokens, updated_at = self._buckets.get(key, (capacity, now))
+                levels.append((_refill(tokens, updated_at, now, capacity, period), capacity, period))
+
+            retry_after = _decide(levels)
+            debit = 1 if retry_after == 0 else 0
+            for (key, _, _), (tokens, _, _) in zip(buckets, levels):
+                self._buckets[key] = (tokens - debit, now)
+
+            if now - self._pruned_at > PRUNE_INTERVAL:
+                self._prune(now)
+        return retry_after
+
+    def _prune(self, now: float):
+        self._pruned_at = now
+        stale = [key for key, (_, updated_at) in self._buckets.items() if now - updated_at > MAX_PERIOD]
+        for key in stale:
+            del self._buckets[key]
+
+
+class SQLiteBackend:
+    """Bucket disimpan di file SQLite, dipakai bersama oleh semua proses di host yang sama"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+        self._pruned_at = time.time()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def take_all(self, buckets: list) -> float:
+        """Sama dengan MemoryBackend.take_all, atomik antar proses"""
+        now = time.time()
+        conn = self._connect()
+        # BEGIN IMMEDIATE: read-modify-write atomik antar proses
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            levels = []
+            for key, capacity, period in buckets:
+                row = conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated_at = row if row else (capacity, now)
+                levels.append((_refill(tokens, updated_at, now, capacity, period), capacity, period))
+
+            retry_after = _decide(levels)
+            debit = 1 if retry_after == 0 else 0
+            conn.executemany(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                [(key, tokens - debit, now) for (key, _, _), (tokens, _, _) in zip(buckets, levels)],
+            )
+            if now - self._pruned_at > PRUNE_INTERVAL:
+                self._pruned_at = now
+                conn.execute("DELETE FROM rate_limit_buckets WHERE updated_at < ?", (now - MAX_PERIOD,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return retry_after
+
+
+def create_backend(name: str = RATE_LIMIT_BACKEND):
+    """Buat backend rate limit sesuai RATE_LIMIT_BACKEND (None jika off)"""
+    if name == "off":
+        return None
+    if name == "sqlite":
+        return SQLiteBackend(RATE_LIMIT_SQLITE_PATH)
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {name}")
+
+
+def get_client_ip(request) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("X-Forwarded-For")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.remote_addr or "unknown"
+
+
+def _login_email(request):
+    """Email dari body JSON (lowercase), None jika tidak ada"""
+    try:
+        email = request.json_body.get("email")
+    except Exception:
+        return None
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return email.strip().lower()
+
+
+def _account_key(request, kind: str):
+    """Identitas akun untuk budget per akun, None jika tidak bisa ditentukan"""
+    if kind == "email":
+        email = _login_email(request)
+        # email + IP untuk budget ketat, budget lintas IP ada di per_email
+        return f"{email}|{get_client_ip(request)}" if email else None
+
+    if kind == "jwt":
+        auth_header = request.headers.get("Authorization", "")
+        if not auth_header.startswith("Bearer "):
+            return None
+        try:
+            # token invalid dibiarkan lewat, view akan mengembalikan 401
+            return verify_token(auth_header[7:]).get("sub")
+        except Exception:
+            return None
+    return None
+
+
+def too_many_requests(retry_after: float) -> Response:
+    """Response 429 dengan header Retry-After (detik, dibulatkan ke atas)"""
+    return Response(
+        json_body={"error": "Terlalu banyak request, silakan coba lagi nanti"},
+        status=429,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def rate_limit_tween_factory(handler, registry):
+    backend = create_backend()
+    if backend is None:
+        return handler
+
+    def rate_limit_tween(request):
+        rule = next(
+            (
+                rule for rule in RATE_LIMIT_RULES
+                if rule["method"] == request.method and rule["path"].match(request.path)
+            ),
+            None,
+        )
+        if rule is None:
+            return handler(request)
+
+        try:
+            buckets = [(f"{rule['name']}:ip:{get_client_ip(request)}", *rule["per_ip"])]
+            if rule["per_account"]:
+                account = _account_key(request, rule["account"])
+                if account:
+                    buckets.append((f"{rule['name']}:account:{account}", *rule["per_account"]))
+            if rule.get("per_email"):
+                email = _login_email(request)
+                if email:
+                    buckets.append((f"{rule['name']}:email:{email}", *rule["per_email"]))
+
+            # semua bucket dicek dulu, token hanya diambil jika request diizinkan
+            retry_after = backend.take_all(buckets)
+        except Exception:
+            # rate limiter bermasalah tidak boleh menjatuhkan request
+            logger.exception("Rate limit error")
+            return handler(request)
+
+        if retry_after > 0:
+            return too_many_requests(retry_after)
+        return handler(request)
+
+    return rate_limit_tween
@@ -0,0 +1,189 @@
+"""
+Slow Query Helper - Log query yang melewati batas waktu (opt-in, SLOW_QUERY_MS)
+Setiap entry berisi statement, parameter, route & request id asal dan durasi dalam format JSON per baris,
+sebagian query (sampling) dilengkapi plan EXPLAIN yang diambil di background thread
+dengan koneksi terpisah, jadi request tidak ikut menunggu. ANALYZE (menjalankan ulang query)
+hanya untuk SELECT biasa; SELECT ... FOR UPDATE / SHARE, SELECT INTO, fungsi yang mengubah
+state dan DML cukup EXPLAIN tanpa ANALYZE
+"""
+import datetime
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from sqlalchemy import event
+
+from helpers.logging_helper import current_request_id
+from helpers.metrics_helper import current_route
+
+
+# Batas durasi (ms), 0 = dimatikan
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+# Peluang (0-1) slow query ikut di-EXPLAIN
+SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE", "0.1"))
+# {pid} diganti pid worker: RotatingFileHandler tidak aman dipakai bersama beberapa proses (prefork)
+SLOW_QUERY_LOG_PATH = os.getenv("SLOW_QUERY_LOG_PATH", "storage/logs/slow_query-{pid}.log")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "5"))
+
+# Panjang maksimal statement & tiap parameter di log
+MAX_STATEMENT_CHARS = 4000
+MAX_PARAM_CHARS = 200
+
+# Statement yang boleh di-EXPLAIN, dan SELECT yang aman dijalankan ulang dengan ANALYZE
+EXPLAINABLE_PATTERN = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+PLAIN_SELECT_PATTERN = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+SIDE_EFFECT_PATTERN = re.compile(
+    r"\bFOR\s+(UPDATE|NO\s+KEY\s+UPDATE|SHARE|KEY\s+SHARE)\b|\bINTO\b|\b(nextval|setval|pg_advisory\w*)\s*\(",
+    re.IGNORECASE,
+)
+
+_explain_queue = queue.Queue(maxsize=100)
+_worker = None
+_worker_lock = threading.Lock()
+_logger = None
+_logger_pid = None
+
+
+def _get_logger() -> logging.Logger:
+    global _logger, _logger_pid
+    # worker hasil fork membuka file sendiri, handler milik parent dilepas
+    if _logger is None or _logger_pid != os.getpid():
+        with _worker_lock:
+            if _logger is None or _logger_pid != os.getpid():
+                path = SLOW_QUERY_LOG_PATH.format(pid=os.getpid())
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                handler = RotatingFileHandler(
+                    path,
+                    maxBytes=SLOW_QUERY_LOG_MAX_BYTES,
+                    backupCount=SLOW_QUERY_LOG_BACKUPS,
+                    encoding="utf-8",
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger = logging.getLogger("slow_query")
+                for old in list(logger.handlers):
+                    logger.removeHandler(old)
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                _logger = logger
+                _logger_pid = os.getpid()
+    return _logger
+
+
+def _shorten(value, limit: int):
+    text = value if isinstance(value, str) else repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _format_params(parameters):
+    if isinstance(parameters, dict):
+        return {key: _shorten(value, MAX_PARAM_CHARS) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_shorten(value, MAX_PARAM_CHARS) for value in parameters]
+    return _shorten(parameters, MAX_PARAM_CHARS)
+
+
+def _write(entry: dict):
+    _get_logger().info(json.dumps(entry, ensure_ascii=False, default=str))
+
+
+def _explain_worker(engine):
+    while True:
+        entry, statement, parameters = _explain_queue.get()
+        try:
+            # ANALYZE menjalankan ulang query: hanya SELECT biasa, transaksi selalu di-rollback
+            options = "ANALYZE, BUFFERS, FORMAT JSON" if entry["analyzed"] else "FORMAT JSON"
+            with engine.connect() as conn:
+                with conn.begin() as trans:
+                    result = conn.exec_driver_sql(f"EXPLAIN ({options}) " + statement, parameters)
+                    entry["plan"] = result.scalar()
+                    trans.rollback()
+        except Exception as e:
+            entry["planError"] = str(e)
+        _write(entry)
+        _explain_queue.task_done()
+
+
+def _queue_explain(engine, entry, statement, parameters) -> bool:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(
+                    target=_explain_worker, args=(engine,), name="slow-query-explain", daemon=True
+                )
+                _worker.start()
+    try:
+        _explain_queue.put_nowait((entry, statement, parameters))
+        return True
+    except queue.Full:
+        return False
+
+
+def flush_slow_query_log(timeout: float = 5.0):
+    """Tunggu antrian EXPLAIN habis (maksimal timeout detik), dipanggil saat shutdown"""
+    deadline = time.monotonic() + timeout
+    while _worker is not None and _explain_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("slow_query_started")
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    if elapsed_ms < SLOW_QUERY_MS:
+        return
+
+    entry = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "durationMs": round(elapsed_ms, 2),
+        "route": current_route(),
+        "requestId": current_request_id(),
+        "statement": _shorten(statement, MAX_STATEMENT_CHARS),
+        "parameters": _format_params(parameters),
+        "rowCount": cursor.rowcount,
+    }
+
+    # query EXPLAIN dari worker sendiri tidak di-explain lagi
+    explainable = (
+        not executemany
+        and threading.current_thread() is not _worker
+        and conn.engine.dialect.name == "postgresql"
+        and EXPLAINABLE_PATTERN.match(statement)
+        and random.random() < SLOW_QUERY_EXPLAIN_SAMPLE
+    )
+    if explainable:
+        entry["analyzed"] = bool(PLAIN_SELECT_PATTERN.match(statement)) and not SIDE_EFFECT_PATTERN.search(statement)
+        if _queue_explain(conn.engine, entry, statement, parameters):
+            return
+        del entry["analyzed"]
+    _write(entry)
+
+
+def _handle_error(context):
+    # query gagal: after_cursor_execute tidak terpanggil, buang waktu mulai-nya
+    started = context.connection.info.get("slow_query_started") if context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_slow_queries(engine):
+    """Pasang hook slow query ke engine (tidak melakukan apa-apa jika SLOW_QUERY_MS = 0)"""
+    if SLOW_QUERY_MS <= 0:
+        return
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "handle_error", _handle_error)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,124 @@
+"""
+Static File Helper - Penyajian file upload (qris, payment_proofs, destinations, packages)
+- STATIC_SENDFILE=x-accel / x-sendfile: app hanya membalas header, file dikirim nginx / apache
+- default: FileResponse lewat wsgi.file_wrapper (waitress mengirim file dari thread I/O,
+  worker thread langsung bebas), Range & conditional request (ETag / Last-Modified) didukung
+"""
+import functools
+import mimetypes
+import os
+import re
+import time
+import jwt
+from pyramid.response import FileResponse, Response
+
+from helpers.jwt_key_helper import decode_token, sign_token
+
+
+# "" (dilayani app) | x-accel (nginx) | x-sendfile (apache mod_xsendfile / lighttpd)
+STATIC_SENDFILE = os.getenv("STATIC_SENDFILE", "").lower()
+# Prefix location internal nginx, misal: location /_protected/ { internal; alias /app/storage/; }
+STATIC_ACCEL_PREFIX = os.getenv("STATIC_ACCEL_PREFIX", "/_protected").rstrip("/")
+STATIC_ROOT = os.path.abspath(os.getenv("STATIC_ROOT", "storage"))
+
+# area URL -> folder di bawah STATIC_ROOT
+STATIC_AREAS = {
+    "qris": "qris",
+    "payment_proofs": "payment_proofs",
+    "destinations": "destinations",
+    "packages": "packages",
+}
+# Area yang hanya boleh dilihat pemilik booking / agent package
+PRIVATE_AREAS = {"payment_proofs"}
+
+# Umur signed URL file private (detik). URL yang sama dipakai selama satu window supaya
+# cache browser tetap kena, jadi URL berlaku antara PROOF_URL_SECONDS dan 2x PROOF_URL_SECONDS
+PROOF_URL_SECONDS = int(os.getenv("PROOF_URL_SECONDS", "600"))
+
+# Nama file berisi UUID tidak pernah ditimpa (upload baru = nama baru), aman di-cache permanen
+IMMUTABLE_NAME = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# File bernama tetap (misal qris/qris_code.png) bisa diganti, revalidasi via ETag
+MUTABLE_MAX_AGE = int(os.getenv("STATIC_MUTABLE_MAX_AGE", "60"))
+
+
+def resolve_path(area: str, filename: str):
+    """
+    Path absolut file upload, None jika area tidak dikenal / nama file tidak valid / file tidak ada
+
+    Nama file tidak boleh berisi separator path, jadi tidak bisa keluar dari folder area
+    """
+    folder = STATIC_AREAS.get(area)
+    if folder is None or not filename or filename.startswith(".") or "/" in filename or "\\" in filename:
+        return None
+    path = os.path.join(STATIC_ROOT, folder, filename)
+    if not os.path.isfile(path):
+        return None
+    return path
+
+
+@functools.lru_cache(maxsize=4096)
+def _sign_path(path: str, expires_at: int) -> str:
+    # aud berisi path: token hanya berlaku untuk file ini dan ditolak verify_token (tidak ada iat / aud)
+    return sign_token({"aud": f"file:{path}", "exp": expires_at})
+
+
+def signed_file_url(path):
+    """
+    URL file upload untuk response API, file private mendapat ?sig= (JWT pendek khusus file tersebut)
+
+    <img> tidak bisa mengirim header Authorization, dengan sig access token tidak perlu masuk URL.
+    Panggil hanya setelah request sudah dicek boleh melihat file tersebut.
+
+    Args:
+        path: Path file dari database (misal "/payment_proofs/<booking_id>_<uuid>.jpg"), boleh None
+
+    Returns:
+        Path dengan query sig untuk area private, path lain dikembalikan apa adanya
+    """
+    if not path or path.lstrip("/").split("/", 1)[0] not in PRIVATE_AREAS:
+        return path
+    expires_at = (int(time.time()) // PROOF_URL_SECONDS + 2) * PROOF_URL_SECONDS
+    return f"{path}?sig={_sign_path(path, expires_at)}"
+
+
+def verify_file_signature(area: str, filename: str, sig: str) -> bool:
+    """True jika sig dibuat signed_file_url untuk file ini dan belum expired"""
+    try:
+        decode_token(sig, audience=f"file:/{area}/{filename}", options={"require": ["exp", "aud"]})
+    except jwt.InvalidTokenError:
+        return False
+    return True
+
+
+def cache_control(area: str, filename: str) -> str:
+    if area in PRIVATE_AREAS:
+        return f"private, max-age={IMMUTABLE_MAX_AGE}, immutable" if IMMUTABLE_NAME.search(filename) else "private, no-cache"
+    if IMMUTABLE_NAME.search(filename):
+        return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    return f"public, max-age={MUTABLE_MAX_AGE}"
+
+
+def file_response(request, area: str, filename: str, path: str) -> Response:
+    """Response file sesuai STATIC_SENDFILE (header untuk proxy, atau file wrapper + Range)"""
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    if STATIC_SENDFILE in ("x-accel", "x-sendfile"):
+        response = Response(content_type=content_type)
+        if STATIC_SENDFILE == "x-accel":
+            response.headers["X-Accel-Redirect"] = f"{STATIC_ACCEL_PREFIX}/{STATIC_AREAS[area]}/{filename}"
+        else:
+            response.headers["X-Sendfile"] = path
+        # body kosong, content-length diisi proxy
+        del response.headers["Content-Length"]
+    else:
+        # file_wrapper hanya untuk full response, Range butuh FileIter (bisa seek)
+        use_wrapper = request if request.range is None else None
+        response = FileResponse(path, request=use_wrapper, content_type=content_type)
+        stat = os.stat(path)
+        response.etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        response.accept_ranges = "bytes"
+        response.conditional_response = True
+
+    response.headers["Cache-Control"] = cache_control(area, filename)
+    return response
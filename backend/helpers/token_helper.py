@@ -0,0 +1,167 @@
+"""
+Token Helper - Access token (JWT pendek) dan refresh token (rotasi, disimpan hashed)
+Refresh token menerbitkan access token baru tanpa bcrypt, cukup satu lookup index
+"""
+import datetime
+import hashlib
+import os
+import secrets
+import uuid
+from sqlalchemy import delete, select, update
+
+from helpers.jwt_key_helper import sign_token
+from helpers.jwt_validate_helper import revoke_user_tokens
+from models.refresh_token_model import RefreshToken
+from models.user_model import User
+
+
+# Umur access token (menit) dan refresh token (hari)
+ACCESS_TOKEN_MINUTES = int(os.getenv("ACCESS_TOKEN_MINUTES", "15"))
+REFRESH_TOKEN_DAYS = int(os.getenv("REFRESH_TOKEN_DAYS", "14"))
+
+# Jumlah row refresh token expired yang dihapus per batch (satu transaksi per batch)
+REFRESH_TOKEN_PRUNE_BATCH = int(os.getenv("REFRESH_TOKEN_PRUNE_BATCH", "5000"))
+
+
+class InvalidRefreshToken(Exception):
+    """Refresh token tidak dikenal, sudah expired, atau sudah dipakai"""
+
+
+def _utcnow() -> datetime.datetime:
+    # kolom DateTime di database tanpa timezone, disimpan sebagai UTC naive
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def create_access_token(user_id, email: str, role: str) -> str:
+    """Buat JWT access token (claims sub, email, role, exp, iat) dengan key aktif"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return sign_token({
+        "sub": str(user_id),
+        "email": email,
+        "role": role,
+        "exp": now + datetime.timedelta(minutes=ACCESS_TOKEN_MINUTES),
+        "iat": now,
+    })
+
+
+def issue_refresh_token(session, user_id, family_id=None) -> str:
+    """
+    Buat refresh token baru untuk user (belum di-commit)
+
+    Args:
+        session: SQLAlchemy session
+        user_id: UUID user
+        family_id: family token asal (rotasi), None untuk login baru
+
+    Returns:
+        Refresh token mentah (hanya dikirim ke client, database menyimpan sha256)
+    """
+    token = secrets.token_urlsafe(48)
+    session.add(RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_token(token),
+        family_id=family_id or uuid.uuid4(),
+        expires_at=_utcnow() + datetime.timedelta(days=REFRESH_TOKEN_DAYS),
+    ))
+    return token
+
+
+def rotate_refresh_token(session, token: str) -> dict:
+    """
+    Tukar refresh token dengan access token + refresh token baru
+
+    Token lama langsung di-revoke. Jika token yang sudah di-revoke dipakai lagi
+    (kemungkinan dicuri), seluruh family token tersebut ikut di-revoke, begitu juga
+    access token user yang sudah terbit (di proses ini).
+
+    Args:
+        session: SQLAlchemy session
+        token: Refresh token mentah dari client
+
+    Returns:
+        Dictionary {user, token, refreshToken, expiresIn}
+
+    Raises:
+        InvalidRefreshToken: If token tidak dikenal, expired, atau reuse terdeteksi
+    """
+    now = _utcnow()
+    row = session.execute(
+        select(RefreshToken, User.email, User.role)
+        .join(User, RefreshToken.user_id == User.id)
+        .where(RefreshToken.token_hash == _hash_token(token))
+        .with_for_update(of=RefreshToken)
+    ).first()
+
+    if row is None:
+        raise InvalidRefreshToken("Invalid refresh token")
+
+    refresh_token, email, role = row
+    if refresh_token.revoked_at is not None:
+        session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == refresh_token.family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        session.commit()
+        revoke_user_tokens(refresh_token.user_id)
+        raise InvalidRefreshToken("Refresh token reuse detected")
+
+    if refresh_token.expires_at <= now:
+        raise InvalidRefreshToken("Refresh token expired")
+
+    refresh_token.revoked_at = now
+    new_token = issue_refresh_token(session, refresh_token.user_id, refresh_token.family_id)
+    session.commit()
+
+    return {
+        "user": {"id": str(refresh_token.user_id), "email": email, "role": role},
+        "token": create_access_token(refresh_token.user_id, email, role),
+        "refreshToken": new_token,
+        "expiresIn": ACCESS_TOKEN_MINUTES * 60,
+    }
+
+
+def revoke_user_refresh_tokens(session, user_id):
+    """Revoke semua refresh token aktif milik user (belum di-commit), misal setelah ganti password"""
+    session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_utcnow())
+    )
+
+
+def prune_refresh_tokens(session, batch_size: int = REFRESH_TOKEN_PRUNE_BATCH) -> int:
+    """
+    Hapus refresh token yang sudah expired, per batch supaya lock & WAL tetap kecil
+
+    Token yang di-revoke ikut terhapus setelah expired (paling lama REFRESH_TOKEN_DAYS
+    sejak dibuat), sampai saat itu row-nya tetap ada untuk deteksi reuse.
+
+    Args:
+        session: SQLAlchemy session
+        batch_size: Jumlah row maksimal per DELETE
+
+    Returns:
+        Jumlah row yang dihapus
+    """
+    now = _utcnow()
+    total = 0
+    while True:
+        # pakai ix_refresh_tokens_expires_at, DELETE ... LIMIT tidak ada di PostgreSQL
+        batch = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        deleted = session.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch)).execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
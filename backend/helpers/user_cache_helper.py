@@ -0,0 +1,77 @@
+"""
+User Cache Helper - Cache process-local profil user (id, name, email, role)
+/api/auth/me dipanggil di setiap perpindahan halaman, cukup lookup dict by user id
+"""
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from db import Session
+from models.user_model import User
+
+
+# Batas umur cache (detik), supaya perubahan dari proses lain tetap ter-update
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "300"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+
+_lock = threading.Lock()
+_cache = OrderedDict()  # user_id -> (loaded_at, profile)
+
+
+def _to_profile(user: User) -> dict:
+    return {
+        "id": str(user.id),
+        "name": user.name,
+        "email": user.email,
+        "role": user.role,
+    }
+
+
+def set_user_profile(user: User) -> dict:
+    """Simpan profil user ke cache (dipanggil setelah login / update profile)"""
+    profile = _to_profile(user)
+    with _lock:
+        _cache[profile["id"]] = (time.monotonic(), profile)
+        _cache.move_to_end(profile["id"])
+        while len(_cache) > USER_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return profile
+
+
+def get_user_profile(user_id: str) -> dict:
+    """
+    Ambil profil user berdasarkan id (dari cache, atau primary key lookup jika miss)
+
+    Args:
+        user_id: UUID user (claim "sub" dari JWT)
+
+    Returns:
+        Dictionary {id, name, email, role} atau None jika user tidak ada
+    """
+    user_id = str(user_id)
+    with _lock:
+        entry = _cache.get(user_id)
+        if entry is not None:
+            if time.monotonic() - entry[0] < USER_CACHE_TTL:
+                _cache.move_to_end(user_id)
+                return entry[1]
+            del _cache[user_id]
+
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        return None
+
+    with Session() as session:
+        user = session.get(User, user_uuid)
+        if user is None:
+            return None
+        return set_user_profile(user)
+
+
+def invalidate_user_profile(user_id: str):
+    """Hapus profil user dari cache (dipanggil setelah profil / password berubah)"""
+    with _lock:
+        _cache.pop(str(user_id), None)
@@ -0,0 +1,25 @@
+"""
+Prune expired refresh tokens (batch job)
+Hapus refresh token yang sudah expired supaya tabel refresh_tokens tidak tumbuh terus
+Jalankan berkala, misal cron harian: python -m jobs.prune_refresh_tokens
+Usage: python -m jobs.prune_refresh_tokens [--batch-size 5000]
+"""
+import argparse
+
+from db import Session
+from helpers.token_helper import REFRESH_TOKEN_PRUNE_BATCH, prune_refresh_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete expired refresh tokens")
+    parser.add_argument("--batch-size", type=int, default=REFRESH_TOKEN_PRUNE_BATCH, help="Row per DELETE")
+    args = parser.parse_args()
+
+    with Session() as session:
+        deleted = prune_refresh_tokens(session, batch_size=args.batch_size)
+
+    print(f"Deleted {deleted} expired refresh tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Reconcile booking payments from a settlement CSV (batch job)
+Cocokkan settlement QRIS dengan booking dan verify pembayaran secara otomatis
+Usage: python -m jobs.reconcile_payments settlement.csv [--agent-id <uuid>]
+"""
+import argparse
+import json
+
+from db import Session
+from helpers.payment_reconcile_helper import parse_settlement_csv, reconcile_settlements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile booking payments from settlement CSV")
+    parser.add_argument("csv_path", help="Path file CSV settlement")
+    parser.add_argument("--agent-id", help="Hanya booking dari paket milik agent ini")
+    args = parser.parse_args()
+
+    with open(args.csv_path, encoding="utf-8-sig") as f:
+        rows = parse_settlement_csv(f.read())
+
+    with Session() as session:
+        summary = reconcile_settlements(session, rows, agent_id=args.agent_id)
+
+    print(json.dumps(summary, indent=2))
+    print(
+        f"Matched {len(summary['matched'])}, unmatched {len(summary['unmatched'])}, "
+        f"ambiguous {len(summary['ambiguous'])} of {len(rows)} rows"
+    )
+
+
+if __name__ == "__main__":
+    main()
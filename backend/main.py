@@ -1,15 +1,32 @@
 import hupper
 import json
+import logging
+import os
+import time
 from waitress import serve
 from pyramid.config import Configurator
+from pyramid.decorator import reify
 from pyramid.request import Request
 from pyramid.response import Response
 from pyramid.renderers import JSON
-from db import Session
+from db import Session, engine
+from helpers.logging_helper import setup_logging
+from helpers.metrics_helper import instrument_engine
+from helpers.slow_query_helper import instrument_slow_queries
+from routes import include_routes
+from routes.manifest import add_views
+
+
+# manifest | eager | scan
+VIEW_REGISTRATION = os.getenv("VIEW_REGISTRATION", "manifest")
+
+logger = logging.getLogger(__name__)
 
 
 class DBRequest(Request):
-    @property
+    # reify: session dibuat sekali per request dan hanya jika diakses,
+    # koneksi database baru diambil dari pool saat query pertama
+    @reify
     def dbsession(self):
         session = Session()
         def cleanup(request):
@@ -18,6 +35,16 @@ class DBRequest(Request):
         return session
 
 
+# Dipakai juga oleh handler async di asgi.py
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, PATCH, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Origin, Content-Type, Accept, Authorization, X-Requested-With',
+    'Access-Control-Expose-Headers': 'X-Total-Count, X-Next-Cursor, Retry-After, X-Request-ID',
+    'Access-Control-Max-Age': '3600',
+}
+
+
 # Intercept all request from client and change the response header to allow cors, not the best practice imo but it is what it is
 def cors_tween_factory(handler, registry):
     def cors_tween(request):
@@ -28,21 +55,52 @@ def cors_tween_factory(handler, registry):
             response = handler(request)
         
         # Add CORS headers to ALL responses
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, PATCH, DELETE, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Origin, Content-Type, Accept, Authorization, X-Requested-With'
-        response.headers['Access-Control-Max-Age'] = '3600'
+        response.headers.update(CORS_HEADERS)
         
         return response
     
     return cors_tween
 
 
-def main():
-    with Configurator() as config:
-        # Intercept all request
+def _log_startup_report(total_ms, timings, view_stats):
+    report = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items())
+    logger.info(f"Startup ({VIEW_REGISTRATION}) {total_ms:.1f} ms: {report}")
+    if view_stats:
+        slowest = sorted(view_stats["import_ms"].items(), key=lambda item: item[1], reverse=True)[:3]
+        logger.info(
+            f"Views: {view_stats['eager']} eager, {view_stats['lazy']} lazy; slowest imports: "
+            + ", ".join(f"{module} {ms:.1f} ms" for module, ms in slowest)
+        )
+
+
+def make_app(settings=None):
+    """Buat WSGI app (dipakai dev server di bawah dan launcher produksi serve.py)"""
+    setup_logging()
+    started_at = time.perf_counter()
+    timings = {}
+    with Configurator(settings=settings) as config:
+        # Token bucket per IP / akun untuk login, register dan upload (429 + Retry-After)
+        config.add_tween('helpers.rate_limit_helper.rate_limit_tween_factory')
+        
+        # Fast path GET publik (katalog): cache hit tidak menyentuh router maupun database
+        config.add_tween('helpers.public_cache_helper.public_cache_tween_factory')
+        
+        # APP_DEBUG: ?profile=1 mengembalikan statistik cProfile request tersebut
+        config.add_tween('helpers.profiler_helper.profile_tween_factory')
+        
+        # Intercept all request, di luar rate limit / public cache / profiler supaya 429,
+        # cache hit dan output ?profile=1 juga mendapat header CORS
         config.add_tween('main.cors_tween_factory')
         
+        # Latency, ukuran response & jumlah query SQL per route (GET /metrics), paling luar
+        instrument_engine(engine)
+        # Opt-in (SLOW_QUERY_MS): query lambat + EXPLAIN sampling ke storage/logs/slow_query-{pid}.log
+        instrument_slow_queries(engine)
+        config.add_tween('helpers.metrics_helper.metrics_tween_factory')
+        
+        # Request id (X-Request-ID) untuk semua log request + access log JSON, paling luar
+        config.add_tween('helpers.logging_helper.request_id_tween_factory')
+        
         # Set custom request factory
         config.set_request_factory(DBRequest)
         
@@ -56,69 +114,34 @@ def main():
         )
         config.add_renderer('json', json_renderer)
         
-        # route
-        ## auth
-        config.add_route("register", "/api/auth/register")
-        config.add_route("login", "/api/auth/login")
-        config.add_route("me", "/api/auth/me")
-        config.add_route("update_profile", "/api/auth/profile")
-        config.add_route("change_password", "/api/auth/change-password")
-
-        ## packages
-        config.add_route("packages", "/api/packages")
-        config.add_route("package_detail", "/api/packages/{id}")
-        config.add_route("package_agent", "/api/packages/agent/{agentId}")
-
-        ## destinations
-        config.add_route("destinations", "/api/destinations")
-        config.add_route("destination_detail", "/api/destinations/{id}")
-
-        ## qris
-        config.add_route("qris", "/api/qris")
-        config.add_route("qris_detail", "/api/qris/{id}")
-        config.add_route("qris_preview", "/api/qris/preview")
-        
-        ## payment
-        config.add_route("payment_generate", "/api/payment/generate")
-        
-        ## bookings
-        config.add_route("bookings", "/api/bookings")
-        config.add_route("booking_detail", "/api/bookings/{id}")
-        config.add_route("booking_status", "/api/bookings/{id}/status")
-        config.add_route("booking_payment_upload", "/api/bookings/{id}/payment-proof")
-        config.add_route("booking_payment_verify", "/api/bookings/{id}/payment-verify")
-        config.add_route("booking_payment_reject", "/api/bookings/{id}/payment-reject")
-        config.add_route("booking_by_tourist", "/api/bookings/tourist/{touristId}")
-        config.add_route("booking_by_package", "/api/bookings/package/{packageId}")
-        config.add_route("booking_payment_pending", "/api/bookings/payment/pending")
-        
-        ## reviews
-        config.add_route("reviews", "/api/reviews")
-        config.add_route("review_by_package", "/api/reviews/package/{packageId}")
-        config.add_route("review_by_tourist", "/api/reviews/tourist/{touristId}")
+        # route (urutan & daftar lengkap di routes/manifest.py)
+        started = time.perf_counter()
+        include_routes(config)
+        timings["routes"] = time.perf_counter() - started
         
-        ## analytics
-        config.add_route("analytics_agent_stats", "/api/analytics/agent/stats")
-        config.add_route("analytics_agent_package_performance", "/api/analytics/agent/package-performance")
-        config.add_route("analytics_tourist_stats", "/api/analytics/tourist/stats")
-        
-        # Static file serving untuk QRIS storage dan payment proofs
-        config.add_static_view(name='qris', path='storage/qris', cache_max_age=3600)
-        config.add_static_view(name='payment_proofs', path='storage/payment_proofs', cache_max_age=3600)
-        config.add_static_view(name='destinations', path='storage/destinations', cache_max_age=3600)
-        config.add_static_view(name='packages', path='storage/packages', cache_max_age=3600)
+        # view: manifest (default, modul QR di-load saat dipakai), eager, atau scan (venusian)
+        started = time.perf_counter()
+        if VIEW_REGISTRATION == "scan":
+            config.scan("views")
+            config.scan("views.assignments")
+            view_stats = None
+        else:
+            view_stats = add_views(config, lazy=VIEW_REGISTRATION != "eager")
+        timings["views"] = time.perf_counter() - started
 
-        #assignment_routes
-        config.add_route("assignment_create", "/api/assignments")
-        config.add_route("assignment_list", "/api/assignments")
-        config.add_route("assignment_status", "/api/assignments/{id}/status")
+        started = time.perf_counter()
+        config.commit()
+        app = config.make_wsgi_app()
+        timings["commit"] = time.perf_counter() - started
 
+    _log_startup_report((time.perf_counter() - started_at) * 1000, timings, view_stats)
+    return app
 
-        config.scan("views")
-        config.scan("views.assignments")
-        app = config.make_wsgi_app()
 
-    print("Server running on http://0.0.0.0:6543 (Hot Reload Active)")
+def main():
+    # Dev server (hupper reload); produksi pakai: python serve.py
+    app = make_app()
+    logger.info("Server running on http://0.0.0.0:6543 (Hot Reload Active)")
     serve(app, host="0.0.0.0", port=6543)
 
 
@@ -7,3 +7,4 @@ from .package_model import Package
 from .review_model import Review
 from .qris_model import Qris
 from .tour_guide_assignment_model import TourGuideAssignment
+from .refresh_token_model import RefreshToken
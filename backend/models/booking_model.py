@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Enum,
+    func,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -37,7 +38,13 @@ class Booking(Base):
         default="pending",
         index=True,
     )
-    created_at = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
+    )
     completed_at = Column(DateTime, nullable=True)
     has_reviewed = Column(Boolean, default=False)
 
@@ -60,6 +67,11 @@ class Booking(Base):
     payment_verified_at = Column(DateTime, nullable=True)
     payment_rejection_reason = Column(Text, nullable=True)
 
+    # Dynamic QRIS per booking (amount = total_price + fee) untuk rekonsiliasi otomatis
+    payment_qris_string = Column(String(500), nullable=True, index=True)
+    payment_amount = Column(Numeric(12, 2), nullable=True, index=True)
+    payment_reference = Column(String(100), nullable=True)
+
     # Relationships
     package = relationship("Package", back_populates="bookings")
     tourist = relationship("User", back_populates="bookings", foreign_keys=[tourist_id])
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Text, Integer, Numeric, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, Integer, Numeric, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 
@@ -25,7 +25,12 @@ class Package(Base):
     contact_phone = Column(String(20), nullable=False)
     images = Column(ARRAY(String), nullable=False)  # PostgreSQL array of image URLs
 
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
     updated_at = Column(
         DateTime,
         default=datetime.now(timezone.utc),
@@ -6,6 +6,10 @@ from sqlalchemy import (
     DateTime,
     Numeric,
     Enum,
+    Boolean,
+    Index,
+    false,
+    func,
 )
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -33,5 +37,23 @@ class Qris(Base):
     )
     fee_value = Column(Numeric(10, 2), nullable=True)
     
+    # QRIS merchant yang dipakai untuk checkout (hanya boleh satu yang aktif)
+    is_active = Column(Boolean, nullable=False, default=False, server_default=false())
+    
     # Timestamps
-    created_at = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_qris_single_active",
+            "is_active",
+            unique=True,
+            postgresql_where=is_active,
+        ),
+    )
@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, ForeignKey, String, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from .base import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    # sha256 hex dari token, token asli tidak pernah disimpan
+    token_hash = Column(String(64), nullable=False, unique=True)
+    # semua token hasil rotasi dari satu login berbagi family_id (untuk deteksi reuse)
+    family_id = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    user = relationship("User", back_populates="refresh_tokens")
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_expires_at", "user_id", "expires_at"),
+        # pruning row expired (jobs.prune_refresh_tokens)
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
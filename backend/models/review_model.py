@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Text, Integer, ForeignKey, CheckConstraint
+from sqlalchemy import Column, DateTime, Text, Integer, ForeignKey, CheckConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -22,7 +22,13 @@ class Review(Base):
     )
     rating = Column(Integer, nullable=False)  # 1–5
     comment = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
+    )
 
     # Relationships
     package = relationship("Package", back_populates="reviews")
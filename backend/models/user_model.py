@@ -27,3 +27,6 @@ class User(Base):
     packages = relationship("Package", back_populates="agent")
     reviews = relationship("Review", back_populates="tourist")
     guide_tasks = relationship("TourGuideAssignment", back_populates="guide")
+    refresh_tokens = relationship(
+        "RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
@@ -0,0 +1,269 @@
+"""
+Route & view manifest - Satu sumber untuk route table dan registrasi view
+Menggantikan config.scan("views"): modul view didaftarkan langsung dari daftar ini,
+modul berat (qrcode / PIL / pyzbar) baru di-import saat request pertama (lazy)
+Cek sinkron dengan @view_config: python -m routes.manifest
+"""
+import ast
+import glob
+import importlib
+import os
+import sys
+import threading
+import time
+
+
+# Urutan = urutan pencocokan route (route pertama yang cocok dipakai Pyramid),
+# path statis harus di atas path dengan placeholder yang bisa menelannya
+ROUTES = [
+    ## auth
+    ("register", "/api/auth/register"),
+    ("login", "/api/auth/login"),
+    ("me", "/api/auth/me"),
+    ("update_profile", "/api/auth/profile"),
+    ("change_password", "/api/auth/change-password"),
+    ("refresh", "/api/auth/refresh"),
+    ("jwks", "/.well-known/jwks.json"),
+
+    ## system
+    ("healthz", "/healthz"),
+    ("readyz", "/readyz"),
+    ("metrics", "/metrics"),
+    ("admin_profile", "/api/admin/profile"),
+
+    ## packages
+    ("packages", "/api/packages"),
+    ("package_detail", "/api/packages/{id}"),
+    ("package_agent", "/api/packages/agent/{agentId}"),
+
+    ## destinations
+    ("destinations", "/api/destinations"),
+    ("destination_detail", "/api/destinations/{id}"),
+
+    ## qris (preview sebelum {id}, kalau tidak POST /api/qris/preview tertangkap qris_detail)
+    ("qris", "/api/qris"),
+    ("qris_preview", "/api/qris/preview"),
+    ("qris_detail", "/api/qris/{id}"),
+
+    ## payment
+    ("payment_generate", "/api/payment/generate"),
+    ("payment_generate_batch", "/api/payment/generate/batch"),
+
+    ## bookings
+    ("bookings", "/api/bookings"),
+    ("booking_detail", "/api/bookings/{id}"),
+    ("booking_status", "/api/bookings/{id}/status"),
+    ("booking_payment_upload", "/api/bookings/{id}/payment-proof"),
+    ("booking_payment_verify", "/api/bookings/{id}/payment-verify"),
+    ("booking_payment_reject", "/api/bookings/{id}/payment-reject"),
+    ("booking_by_tourist", "/api/bookings/tourist/{touristId}"),
+    ("booking_by_package", "/api/bookings/package/{packageId}"),
+    ("booking_payment_pending", "/api/bookings/payment/pending"),
+    ("booking_payment_qris", "/api/bookings/{id}/payment-qris"),
+    ("booking_payment_reconcile", "/api/bookings/payment/reconcile"),
+
+    ## reviews
+    ("reviews", "/api/reviews"),
+    ("review_by_package", "/api/reviews/package/{packageId}"),
+    ("review_by_tourist", "/api/reviews/tourist/{touristId}"),
+
+    ## analytics
+    ("analytics_agent_stats", "/api/analytics/agent/stats"),
+    ("analytics_agent_package_performance", "/api/analytics/agent/package-performance"),
+    ("analytics_tourist_stats", "/api/analytics/tourist/stats"),
+
+    ## assignments
+    ("assignment_create", "/api/assignments"),
+    ("assignment_list", "/api/assignments"),
+    ("assignment_status", "/api/assignments/{id}/status"),
+
+    ## files (upload di storage/, paling akhir)
+    ("static_file", "/{area:qris|payment_proofs|destinations|packages}/{filename}"),
+]
+
+# Modul view yang meng-import stack gambar QR (qrcode, PIL, pyzbar)
+LAZY_MODULES = {
+    "views.qris.qris_create_view",
+    "views.qris.qris_detail_view",
+    "views.qris.qris_preview_view",
+    "views.qris.payment_generate_view",
+    "views.qris.payment_generate_batch_view",
+    "views.bookings.booking_payment_qris_view",
+    "views.bookings.booking_payment_upload_view",
+}
+
+# (route_name, request_method, "modul:fungsi"), semua renderer json
+VIEWS = [
+    ## auth
+    ("register", "POST", "views.auth.register_view:register"),
+    ("login", "POST", "views.auth.login_view:login"),
+    ("me", "GET", "views.auth.me_view:me"),
+    ("update_profile", "PUT", "views.auth.update_profile_view:update_profile"),
+    ("change_password", "POST", "views.auth.update_profile_view:change_password"),
+    ("refresh", "POST", "views.auth.refresh_view:refresh"),
+    ("jwks", "GET", "views.auth.jwks_view:jwks"),
+
+    ## system
+    ("healthz", "GET", "views.system.health_view:healthz"),
+    ("readyz", "GET", "views.system.health_view:readyz"),
+    ("metrics", "GET", "views.system.metrics_view:metrics"),
+    ("admin_profile", "GET", "views.system.profile_view:admin_profile"),
+
+    ## packages
+    ("packages", "GET", "views.packages.packages_view:get_packages"),
+    ("packages", "POST", "views.packages.packages_view:create_package"),
+    ("package_detail", "GET", "views.packages.packages_detail_view:package_detail"),
+    ("package_detail", "PUT", "views.packages.packages_detail_view:update_package"),
+    ("package_detail", "DELETE", "views.packages.packages_detail_view:delete_package"),
+    ("package_agent", "GET", "views.packages.package_agent_view:get_package_by_agent"),
+
+    ## destinations
+    ("destinations", "GET", "views.destinations.destinations_view:destinations"),
+    ("destinations", "POST", "views.destinations.destinations_view:create_destination"),
+    ("destination_detail", "GET", "views.destinations.destinations_view:destination_detail"),
+    ("destination_detail", "PUT", "views.destinations.destinations_view:update_destination"),
+    ("destination_detail", "DELETE", "views.destinations.destinations_view:delete_destination"),
+
+    ## qris
+    ("qris", "GET", "views.qris.qris_list_view:qris_list"),
+    ("qris", "POST", "views.qris.qris_create_view:qris_create"),
+    ("qris_preview", "POST", "views.qris.qris_preview_view:qris_preview"),
+    ("qris_detail", "GET", "views.qris.qris_detail_view:qris_detail"),
+    ("qris_detail", "DELETE", "views.qris.qris_detail_view:qris_delete"),
+
+    ## payment
+    ("payment_generate", "POST", "views.qris.payment_generate_view:payment_generate"),
+    ("payment_generate_batch", "POST", "views.qris.payment_generate_batch_view:payment_generate_batch"),
+
+    ## bookings
+    ("bookings", "GET", "views.bookings.booking_list_view:bookings_list"),
+    ("bookings", "POST", "views.bookings.booking_create_view:booking_create"),
+    ("booking_detail", "GET", "views.bookings.booking_detail_view:booking_detail"),
+    ("booking_status", "PUT", "views.bookings.booking_status_view:booking_update_status"),
+    ("booking_payment_upload", "POST", "views.bookings.booking_payment_upload_view:booking_payment_upload"),
+    ("booking_payment_verify", "PUT", "views.bookings.booking_payment_verify_view:booking_payment_verify"),
+    ("booking_payment_reject", "PUT", "views.bookings.booking_payment_reject_view:booking_payment_reject"),
+    ("booking_by_tourist", "GET", "views.bookings.booking_by_tourist_view:booking_by_tourist"),
+    ("booking_by_package", "GET", "views.bookings.booking_by_package_view:booking_by_package"),
+    ("booking_payment_pending", "GET", "views.bookings.booking_payment_pending_view:booking_payment_pending"),
+    ("booking_payment_qris", "POST", "views.bookings.booking_payment_qris_view:booking_payment_qris"),
+    ("booking_payment_reconcile", "POST", "views.bookings.booking_payment_reconcile_view:booking_payment_reconcile"),
+
+    ## reviews
+    ("reviews", "POST", "views.reviews.review_create_view:review_create"),
+    ("review_by_package", "GET", "views.reviews.review_by_package_view:review_by_package"),
+    ("review_by_tourist", "GET", "views.reviews.review_by_tourist_view:review_by_tourist"),
+
+    ## analytics
+    ("analytics_agent_stats", "GET", "views.analytics.agent_stats_view:analytics_agent_stats"),
+    ("analytics_agent_package_performance", "GET", "views.analytics.agent_package_performance_view:analytics_agent_package_performance"),
+    ("analytics_tourist_stats", "GET", "views.analytics.tourist_stats_view:analytics_tourist_stats"),
+
+    ## assignments
+    ("assignment_create", "POST", "views.assignments.assignment_create_view:assignment_create"),
+    ("assignment_status", "PATCH", "views.assignments.assignment_status_view:assignment_status_update"),
+
+    ## files
+    ("static_file", "GET", "views.files.static_file_view:static_file"),
+]
+
+
+def _import_view(dotted: str):
+    module_name, func_name = dotted.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+class LazyView:
+    """View callable yang meng-import modul aslinya saat dipanggil pertama kali"""
+
+    def __init__(self, dotted: str):
+        self.dotted = dotted
+        self.__name__ = dotted
+        self._view = None
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        if self._view is None:
+            with self._lock:
+                if self._view is None:
+                    self._view = _import_view(self.dotted)
+        return self._view
+
+    def __call__(self, request):
+        return self.resolve()(request)
+
+
+def add_routes(config):
+    """Daftarkan seluruh route sesuai urutan ROUTES"""
+    for name, pattern in ROUTES:
+        config.add_route(name, pattern)
+
+
+def add_views(config, lazy: bool = True) -> dict:
+    """
+    Daftarkan seluruh view dari VIEWS
+
+    Args:
+        config: Pyramid Configurator
+        lazy: jika False, modul LAZY_MODULES ikut di-import saat startup
+
+    Returns:
+        Dictionary statistik {eager, lazy, import_ms: {modul: ms}}
+    """
+    stats = {"eager": 0, "lazy": 0, "import_ms": {}}
+    for route_name, method, dotted in VIEWS:
+        module_name = dotted.split(":")[0]
+        if lazy and module_name in LAZY_MODULES:
+            view = LazyView(dotted)
+            stats["lazy"] += 1
+        else:
+            started = time.perf_counter()
+            already_loaded = module_name in sys.modules
+            view = _import_view(dotted)
+            if not already_loaded:
+                stats["import_ms"][module_name] = (time.perf_counter() - started) * 1000
+            stats["eager"] += 1
+        config.add_view(view, route_name=route_name, request_method=method, renderer="json")
+    return stats
+
+
+def find_decorated_views(views_dir: str = "views") -> set:
+    """Baca semua @view_config di folder views (tanpa import, via AST)"""
+    found = set()
+    for path in glob.glob(os.path.join(views_dir, "**", "*.py"), recursive=True):
+        module_name = os.path.splitext(path)[0].replace(os.sep, ".")
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in tree.body:
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call) and getattr(decorator.func, "id", None) == "view_config":
+                    options = {kw.arg: ast.literal_eval(kw.value) for kw in decorator.keywords}
+                    found.add((options.get("route_name"), options.get("request_method"), f"{module_name}:{node.name}"))
+    return found
+
+
+def main():
+    # Cek manifest vs @view_config (dijalankan dari folder backend)
+    declared = set(VIEWS)
+    decorated = find_decorated_views()
+    route_names = {name for name, _ in ROUTES}
+
+    problems = []
+    for entry in sorted(decorated - declared, key=str):
+        problems.append(f"missing in VIEWS: {entry}")
+    for entry in sorted(declared - decorated, key=str):
+        problems.append(f"not decorated with @view_config: {entry}")
+    for route_name, _, dotted in VIEWS:
+        if route_name not in route_names:
+            problems.append(f"unknown route {route_name} for {dotted}")
+
+    for problem in problems:
+        print(problem)
+    print(f"{len(VIEWS)} views, {len(ROUTES)} routes, {len(problems)} problems")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
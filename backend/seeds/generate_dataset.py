@@ -0,0 +1,403 @@
+"""
+Generate synthetic dataset for load / scale testing
+Users (tourist, agent, guide), destinations, packages, bookings, reviews dan
+tour guide assignments, dimuat lewat PostgreSQL COPY per batch (memori tetap kecil
+walaupun 10 juta baris). Seed yang sama selalu menghasilkan data (termasuk UUID) yang sama
+Usage: python -m seeds.generate_dataset --rows 100000 [--seed 42] [--truncate]
+"""
+import argparse
+import csv
+import datetime
+import hashlib
+import io
+import random
+import time
+import uuid
+
+from db import engine
+from helpers.password_helper import hash_password
+
+
+# Proporsi baris per tabel dari --rows (reviews & assignments menyusul dari bookings)
+RATIOS = {
+    "users": 0.10,
+    "destinations": 0.002,
+    "packages": 0.04,
+    "bookings": 0.50,
+}
+ROLE_WEIGHTS = {"tourist": 0.85, "agent": 0.10, "guide": 0.05}
+# Tanggal acuan default (tetap, bukan hari ini) supaya seed yang sama = data yang sama di hari apa pun
+DEFAULT_TODAY = datetime.date(2026, 1, 1)
+# Probabilitas booking completed diberi review / booking confirmed-completed diberi guide
+REVIEW_RATE = 0.6
+ASSIGNMENT_RATE = 0.4
+RATING_WEIGHTS = [4, 6, 15, 30, 45]
+
+FIRST_NAMES = [
+    "Adi", "Agus", "Ayu", "Bagus", "Budi", "Citra", "Dewi", "Dimas", "Eka", "Fajar",
+    "Fitri", "Gilang", "Hendra", "Indah", "Joko", "Kartika", "Lestari", "Made", "Nadia", "Nur",
+    "Putri", "Rani", "Rizky", "Sari", "Siti", "Taufik", "Wahyu", "Wayan", "Yoga", "Yuni",
+]
+LAST_NAMES = [
+    "Pratama", "Saputra", "Wijaya", "Santoso", "Hidayat", "Kusuma", "Nugroho", "Siregar", "Lubis",
+    "Setiawan", "Utami", "Permata", "Wulandari", "Gunawan", "Halim", "Simanjuntak", "Sinaga", "Tanjung",
+]
+PLACES = [
+    ("Bali", "Indonesia"), ("Yogyakarta", "Indonesia"), ("Raja Ampat", "Indonesia"),
+    ("Lombok", "Indonesia"), ("Komodo Island", "Indonesia"), ("Bandung", "Indonesia"),
+    ("Bromo", "Indonesia"), ("Lake Toba", "Indonesia"), ("Labuan Bajo", "Indonesia"),
+    ("Belitung", "Indonesia"), ("Wakatobi", "Indonesia"), ("Tana Toraja", "Indonesia"),
+    ("Dieng", "Indonesia"), ("Bunaken", "Indonesia"), ("Derawan", "Indonesia"),
+    ("Phuket", "Thailand"), ("Chiang Mai", "Thailand"), ("Langkawi", "Malaysia"),
+    ("Penang", "Malaysia"), ("Singapore", "Singapore"), ("Da Nang", "Vietnam"),
+    ("Ha Long Bay", "Vietnam"), ("Siem Reap", "Cambodia"), ("Palawan", "Philippines"),
+    ("Kyoto", "Japan"), ("Seoul", "South Korea"),
+]
+PACKAGE_THEMES = [
+    "Adventure", "Culture", "Honeymoon", "Family", "Backpacker", "Diving", "Culinary",
+    "Photography", "Hiking", "Island Hopping", "Heritage", "Wellness",
+]
+ACTIVITIES = [
+    "city tour", "temple visit", "snorkeling", "sunrise trekking", "local market visit",
+    "cooking class", "beach time", "waterfall hike", "museum visit", "boat trip",
+    "cultural performance", "free time",
+]
+WORDS = [
+    "beautiful", "friendly", "guide", "hotel", "clean", "trip", "amazing", "food", "view",
+    "schedule", "recommended", "price", "experience", "comfortable", "memorable", "transport",
+    "organized", "family", "helpful", "relaxing",
+]
+IMAGE_BASE = "https://images.unsplash.com/photo-"
+
+
+def plan(rows: int, overrides: dict) -> dict:
+    """Jumlah baris per tabel dari total --rows, bisa ditimpa per tabel"""
+    counts = {table: max(1, int(rows * ratio)) for table, ratio in RATIOS.items()}
+    counts["destinations"] = max(counts["destinations"], min(len(PLACES), 8))
+    counts["users"] = max(counts["users"], len(ROLE_WEIGHTS))
+    counts.update({table: value for table, value in overrides.items() if value is not None})
+    return counts
+
+
+def make_uuid(seed: int, kind: str, index: int) -> uuid.UUID:
+    """UUID v4 deterministik: tersebar acak seperti uuid4, tapi bisa dihitung ulang dari index"""
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=digest, version=4)
+
+
+def role_ranges(total: int) -> dict:
+    """Index user per role: tourist [0, a), agent [a, b), guide [b, total)"""
+    tourists = max(1, int(total * ROLE_WEIGHTS["tourist"]))
+    agents = max(1, int(total * ROLE_WEIGHTS["agent"]))
+    guides = max(1, total - tourists - agents)
+    tourists = total - agents - guides
+    return {
+        "tourist": range(0, tourists),
+        "agent": range(tourists, tourists + agents),
+        "guide": range(tourists + agents, total),
+    }
+
+
+def skewed(rng: random.Random, size: int) -> int:
+    """Index 0..size-1 dengan distribusi condong ke index kecil (paket / user populer)"""
+    return min(size - 1, int(size * rng.random() ** 2))
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+class CopyLoader:
+    """Tulis baris ke buffer CSV, kirim COPY ... FROM STDIN setiap batch_size baris"""
+
+    def __init__(self, cursor, table: str, columns: list, batch_size: int):
+        self.cursor = cursor
+        self.table = table
+        self.sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        self.batch_size = batch_size
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, lineterminator="\n")
+        self.pending = 0
+        self.total = 0
+
+    def add(self, row):
+        # None ditulis sebagai field kosong tanpa quote = NULL di COPY csv
+        self.writer.writerow(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        self.buffer.seek(0)
+        self.cursor.copy_expert(self.sql, self.buffer)
+        self.total += self.pending
+        self.pending = 0
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+
+def load_destinations(cursor, args, counts, now):
+    rng = random.Random(f"{args.seed}:destinations")
+    loader = CopyLoader(
+        cursor, "destinations",
+        ["id", "name", "description", "photo_url", "country", "created_at", "updated_at"],
+        args.batch_size,
+    )
+    for i in range(counts["destinations"]):
+        place, country = PLACES[i % len(PLACES)]
+        name = place if i < len(PLACES) else f"{place} {i // len(PLACES) + 1}"
+        created = now - datetime.timedelta(days=rng.randint(args.days, args.days + 365))
+        loader.add([
+            make_uuid(args.seed, "destination", i), name,
+            f"{name}: {sentence(rng, 12)}",
+            f"{IMAGE_BASE}{rng.randint(10 ** 12, 10 ** 13 - 1)}?w=800", country,
+            created, created,
+        ])
+    loader.flush()
+    return loader.total
+
+
+def load_users(cursor, args, counts, roles, now):
+    rng = random.Random(f"{args.seed}:users")
+    # bcrypt sekali, semua user memakai password yang sama (--password)
+    password_hash = hash_password(args.password)
+    loader = CopyLoader(
+        cursor, "users",
+        ["id", "name", "email", "password_hash", "role", "created_at", "updated_at"],
+        args.batch_size,
+    )
+    for role, indexes in roles.items():
+        for n, i in enumerate(indexes):
+            created = now - datetime.timedelta(seconds=rng.randint(0, (args.days + 365) * 86400))
+            loader.add([
+                make_uuid(args.seed, "user", i),
+                f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                f"{role}{n}@{args.email_domain}", password_hash, role, created, created,
+            ])
+    loader.flush()
+    return loader.total
+
+
+def load_packages(cursor, args, counts, roles, now):
+    """Returns list (price, max_travelers) per package, dipakai saat generate bookings"""
+    rng = random.Random(f"{args.seed}:packages")
+    loader = CopyLoader(
+        cursor, "packages",
+        [
+            "id", "agent_id", "destination_id", "name", "duration", "price", "itinerary",
+            "max_travelers", "contact_phone", "images", "created_at", "updated_at",
+        ],
+        args.batch_size,
+    )
+    agents = roles["agent"]
+    packages = []
+    for i in range(counts["packages"]):
+        agent = agents[skewed(rng, len(agents))]
+        destination = rng.randrange(counts["destinations"])
+        place = PLACES[destination % len(PLACES)][0]
+        duration = rng.randint(2, 10)
+        price = rng.randrange(500_000, 9_500_000, 50_000)
+        max_travelers = rng.randint(2, 10)
+        itinerary = "\n".join(
+            f"Day {day}: {rng.choice(ACTIVITIES).capitalize()}, {rng.choice(ACTIVITIES)}"
+            for day in range(1, duration + 1)
+        )
+        images = ",".join(
+            f'"{IMAGE_BASE}{rng.randint(10 ** 12, 10 ** 13 - 1)}?w=800"' for _ in range(rng.randint(1, 4))
+        )
+        created = now - datetime.timedelta(seconds=rng.randint(0, (args.days + 180) * 86400))
+        loader.add([
+            make_uuid(args.seed, "package", i), make_uuid(args.seed, "user", agent),
+            make_uuid(args.seed, "destination", destination),
+            f"{place} {rng.choice(PACKAGE_THEMES)} {duration}D{duration - 1}N",
+            duration, price, itinerary, max_travelers,
+            f"+62812{rng.randint(10_000_000, 99_999_999)}", "{" + images + "}",
+            created, created,
+        ])
+        packages.append((price, max_travelers))
+    loader.flush()
+    return packages
+
+
+def booking_state(rng: random.Random, travel_date: datetime.date, today: datetime.date):
+    """(status, payment_status) yang konsisten dengan tanggal perjalanan"""
+    if travel_date < today:
+        status = rng.choices(["completed", "cancelled", "confirmed"], [80, 15, 5])[0]
+    else:
+        status = rng.choices(["pending", "confirmed", "cancelled"], [45, 45, 10])[0]
+    if status in ("completed", "confirmed"):
+        return status, "verified"
+    if status == "cancelled":
+        return status, rng.choices(["unpaid", "rejected"], [70, 30])[0]
+    return status, rng.choices(["unpaid", "pending_verification", "rejected"], [50, 40, 10])[0]
+
+
+def load_bookings(cursor, args, counts, roles, packages, now):
+    """Bookings + reviews + assignments dalam satu pass (baris anak di-flush setelah batch booking)"""
+    rng = random.Random(f"{args.seed}:bookings")
+    bookings = CopyLoader(
+        cursor, "bookings",
+        [
+            "id", "package_id", "tourist_id", "travel_date", "travelers_count", "total_price",
+            "status", "created_at", "completed_at", "has_reviewed", "payment_status",
+            "payment_proof_url", "payment_proof_uploaded_at", "payment_verified_at",
+            "payment_rejection_reason", "payment_amount", "payment_reference",
+        ],
+        args.batch_size,
+    )
+    reviews = CopyLoader(
+        cursor, "reviews",
+        ["id", "package_id", "tourist_id", "booking_id", "rating", "comment", "created_at"],
+        args.batch_size,
+    )
+    assignments = CopyLoader(
+        cursor, "tour_guide_assignments",
+        ["id", "booking_id", "guide_id", "status", "assigned_at"],
+        args.batch_size,
+    )
+    tourists, guides = roles["tourist"], roles["guide"]
+    today = now.date()
+
+    for i in range(counts["bookings"]):
+        package = skewed(rng, len(packages))
+        tourist = tourists[skewed(rng, len(tourists))]
+        price, max_travelers = packages[package]
+        travelers = rng.randint(1, max_travelers)
+        total = price * travelers
+        created = now - datetime.timedelta(seconds=rng.randint(0, args.days * 86400))
+        travel_date = created.date() + datetime.timedelta(days=rng.randint(3, 120))
+        status, payment_status = booking_state(rng, travel_date, today)
+
+        booking_id = make_uuid(args.seed, "booking", i)
+        package_id = make_uuid(args.seed, "package", package)
+        tourist_id = make_uuid(args.seed, "user", tourist)
+        uploaded = created + datetime.timedelta(hours=rng.randint(1, 48))
+        has_proof = payment_status in ("pending_verification", "verified", "rejected")
+        completed_at = None
+        if status == "completed":
+            completed_at = min(
+                datetime.datetime.combine(travel_date, datetime.time(18)) + datetime.timedelta(days=1), now
+            )
+        reviewed = status == "completed" and rng.random() < REVIEW_RATE
+
+        bookings.add([
+            booking_id, package_id, tourist_id, travel_date, travelers, total, status, created,
+            completed_at, "t" if reviewed else "f", payment_status,
+            # <booking_id>_<uuid> seperti upload view, static_file_view membaca pemilik dari prefix
+            f"/payment_proofs/{booking_id}_{make_uuid(args.seed, 'proof', i)}.jpg" if has_proof else None,
+            uploaded if has_proof else None,
+            uploaded + datetime.timedelta(hours=rng.randint(1, 24)) if payment_status == "verified" else None,
+            "Nominal transfer tidak sesuai" if payment_status == "rejected" else None,
+            total if has_proof else None,
+            f"LT{i:010d}" if payment_status == "verified" else None,
+        ])
+
+        if reviewed:
+            reviews.add([
+                make_uuid(args.seed, "review", i), package_id, tourist_id, booking_id,
+                rng.choices(range(1, 6), RATING_WEIGHTS)[0], sentence(rng, rng.randint(6, 30)),
+                min(completed_at + datetime.timedelta(days=rng.randint(0, 14)), now),
+            ])
+        if status in ("confirmed", "completed") and rng.random() < ASSIGNMENT_RATE:
+            assignment_status = "completed" if status == "completed" else rng.choice(["assigned", "on_duty"])
+            assignments.add([
+                make_uuid(args.seed, "assignment", i), booking_id,
+                make_uuid(args.seed, "user", guides[rng.randrange(len(guides))]),
+                assignment_status, uploaded + datetime.timedelta(days=1),
+            ])
+
+        # Baris anak butuh booking-nya sudah ada (foreign key)
+        if bookings.pending == 0:
+            reviews.flush()
+            assignments.flush()
+        if (i + 1) % (args.batch_size * 10) == 0:
+            print(f"  bookings: {i + 1:,} / {counts['bookings']:,}")
+
+    bookings.flush()
+    reviews.flush()
+    assignments.flush()
+    return bookings.total, reviews.total, assignments.total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic dataset (PostgreSQL COPY)")
+    parser.add_argument("--rows", type=int, default=10_000, help="Perkiraan total baris (1k - 10M)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed random, hasil sama untuk seed yang sama")
+    parser.add_argument("--users", type=int, help="Timpa jumlah users")
+    parser.add_argument("--destinations", type=int, help="Timpa jumlah destinations")
+    parser.add_argument("--packages", type=int, help="Timpa jumlah packages")
+    parser.add_argument("--bookings", type=int, help="Timpa jumlah bookings")
+    parser.add_argument("--days", type=int, default=730, help="Rentang tanggal booking ke belakang (hari)")
+    parser.add_argument(
+        "--today", type=datetime.date.fromisoformat, default=DEFAULT_TODAY,
+        help=f"Tanggal acuan YYYY-MM-DD, data dibuat sampai tanggal ini (default {DEFAULT_TODAY})",
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Baris per COPY")
+    parser.add_argument("--password", default="password123", help="Password semua user hasil generate")
+    parser.add_argument("--email-domain", default="loadtest.local", help="Email user: <role><n>@<domain>")
+    parser.add_argument(
+        "--truncate", action="store_true",
+        help="Kosongkan tabel users, destinations, packages, bookings, reviews, assignments dulu",
+    )
+    args = parser.parse_args()
+
+    counts = plan(args.rows, {
+        "users": args.users, "destinations": args.destinations,
+        "packages": args.packages, "bookings": args.bookings,
+    })
+    roles = role_ranges(counts["users"])
+    # Waktu acuan (bukan jam sekarang), seed + --today yang sama = data yang sama persis
+    now = datetime.datetime.combine(args.today, datetime.time(12))
+    print(f"Generating (seed {args.seed}, today {args.today}): " + ", ".join(f"{table} {count:,}" for table, count in counts.items()))
+
+    started = time.perf_counter()
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if args.truncate:
+            print("Truncating existing data...")
+            cursor.execute(
+                "TRUNCATE tour_guide_assignments, reviews, bookings, packages, destinations, "
+                "refresh_tokens, users CASCADE"
+            )
+
+        totals = {}
+        table_started = time.perf_counter()
+        totals["destinations"] = load_destinations(cursor, args, counts, now)
+        totals["users"] = load_users(cursor, args, counts, roles, now)
+        packages = load_packages(cursor, args, counts, roles, now)
+        totals["packages"] = len(packages)
+        print(
+            f"  destinations: {totals['destinations']:,}, users: {totals['users']:,}, "
+            f"packages: {totals['packages']:,} rows ({time.perf_counter() - table_started:.1f}s)"
+        )
+
+        table_started = time.perf_counter()
+        totals["bookings"], totals["reviews"], totals["tour_guide_assignments"] = load_bookings(
+            cursor, args, counts, roles, packages, now
+        )
+        print(
+            f"  bookings: {totals['bookings']:,}, reviews: {totals['reviews']:,}, "
+            f"assignments: {totals['tour_guide_assignments']:,} rows ({time.perf_counter() - table_started:.1f}s)"
+        )
+
+        connection.commit()
+        # Statistik planner untuk data baru (tanpa ini EXPLAIN / benchmark menyesatkan)
+        cursor.execute("ANALYZE users, destinations, packages, bookings, reviews, tour_guide_assignments")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - started
+    total_rows = sum(totals.values())
+    print(f"Done: {total_rows:,} rows in {elapsed:.1f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    print(f"Login: <role><n>@{args.email_domain} / {args.password} (e.g. tourist0@{args.email_domain})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Production server launcher (tanpa hupper reloader)
+Waitress dengan thread pool, batas koneksi, timeout dan backlog yang bisa dikonfigurasi,
+opsional pre-fork beberapa proses yang berbagi satu listening socket
+SIGTERM / SIGINT: berhenti menerima koneksi, tunggu request yang sedang berjalan selesai
+(maksimal SHUTDOWN_TIMEOUT detik), lalu flush antrian log & tutup pool database.
+Sinyal kedua langsung menghentikan server
+Usage: python serve.py [--workers 4] [--threads 8] [--port 6543]
+"""
+import _thread
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from waitress import create_server
+from waitress.channel import HTTPChannel
+from waitress.server import BaseWSGIServer
+
+from helpers.health_helper import register_task_dispatcher, set_draining
+from helpers.logging_helper import setup_logging, stop_logging
+from helpers.slow_query_helper import flush_slow_query_log
+
+
+logger = logging.getLogger(__name__)
+
+# Batas waktu menunggu request yang sedang berjalan saat shutdown (detik)
+SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", "30"))
+# Jeda antara /readyz 503 dan berhenti menerima koneksi, beri waktu load balancer melepas instance
+SHUTDOWN_GRACE = float(os.getenv("SHUTDOWN_GRACE", "0"))
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Pyramid API with waitress (production)")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=_env_int("PORT", 6543))
+    parser.add_argument(
+        "--workers", type=int, default=_env_int("WEB_WORKERS", 1),
+        help="Jumlah proses (pre-fork), 1 = satu proses tanpa fork",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=_env_int("WAITRESS_THREADS", 8),
+        help="Thread waitress per proses",
+    )
+    parser.add_argument(
+        "--connection-limit", type=int, default=_env_int("WAITRESS_CONNECTION_LIMIT", 1000),
+        help="Maksimal koneksi terbuka per proses",
+    )
+    parser.add_argument(
+        "--channel-timeout", type=int, default=_env_int("WAITRESS_CHANNEL_TIMEOUT", 60),
+        help="Detik sebelum koneksi idle ditutup",
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=_env_int("WAITRESS_BACKLOG", 2048),
+        help="Panjang antrian listen() socket",
+    )
+    return parser.parse_args(argv)
+
+
+def _serve(args, sockets=None):
+    # Batas bcrypt bersamaan (password_helper) diturunkan dari jumlah thread, set sebelum app di-import
+    os.environ["WAITRESS_THREADS"] = str(args.threads)
+    # Import di sini supaya app (dan engine database) dibuat di dalam proses worker
+    from main import make_app
+
+    app = make_app()
+    options = {
+        "threads": args.threads,
+        "connection_limit": args.connection_limit,
+        "channel_timeout": args.channel_timeout,
+        "backlog": args.backlog,
+        "ident": "uas-pengweb",
+    }
+    if sockets:
+        server = create_server(app, sockets=sockets, **options)
+    else:
+        server = create_server(app, host=args.host, port=args.port, **options)
+    # /readyz membaca panjang antrian task waitress
+    register_task_dispatcher(server.task_dispatcher)
+
+    previous = _install_drain_handlers(server)
+    try:
+        # KeyboardInterrupt ditangkap run(), lalu thread pool waitress dihentikan
+        server.run()
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        _release_resources()
+
+
+def _server_map(server) -> dict:
+    # MultiSocketServer menyimpan socket di .map, server tunggal di ._map
+    return getattr(server, "map", None) or server._map
+
+
+def _in_flight(server) -> int:
+    """Jumlah request yang masih antri / diproses / responsenya belum selesai dikirim"""
+    dispatcher = server.task_dispatcher
+    busy = len(dispatcher.queue) + dispatcher.active_count
+    for channel in list(_server_map(server).values()):
+        if isinstance(channel, HTTPChannel) and (
+            channel.requests or channel.request is not None or channel.total_outbufs_len
+        ):
+            busy += 1
+    return busy
+
+
+def _drain(server):
+    set_draining()
+    if SHUTDOWN_GRACE > 0:
+        time.sleep(SHUTDOWN_GRACE)
+
+    # readable() listener bernilai False -> loop asyncore tidak memanggil accept() lagi
+    for listener in list(_server_map(server).values()):
+        if isinstance(listener, BaseWSGIServer):
+            listener.accepting = False
+
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    while time.monotonic() < deadline:
+        if _in_flight(server) == 0:
+            logger.info("All in-flight requests finished")
+            break
+        time.sleep(0.1)
+    else:
+        logger.warning(f"Shutdown timeout ({SHUTDOWN_TIMEOUT:g}s), {_in_flight(server)} requests still in flight")
+
+    # Dikirim sebagai SIGINT ke main thread, handler di bawah melempar KeyboardInterrupt
+    _thread.interrupt_main()
+
+
+def _install_drain_handlers(server) -> dict:
+    drain_thread = None
+
+    def handle(signum, frame):
+        nonlocal drain_thread
+        if drain_thread is not None:
+            # sinyal kedua (atau drain selesai): hentikan loop server sekarang
+            raise KeyboardInterrupt
+        logger.info(f"Received {signal.Signals(signum).name}, draining connections (timeout {SHUTDOWN_TIMEOUT:g}s)")
+        drain_thread = threading.Thread(target=_drain, args=(server,), name="shutdown-drain", daemon=True)
+        drain_thread.start()
+
+    previous = {}
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        previous[signum] = signal.signal(signum, handle)
+    return previous
+
+
+def _release_resources():
+    """Flush antrian background (EXPLAIN slow query) lalu tutup koneksi pool database"""
+    flush_slow_query_log()
+    from db import engine
+    engine.dispose()
+    logger.info("Server stopped")
+
+
+def _bind_socket(args) -> socket.socket:
+    family = socket.AF_INET6 if ":" in args.host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(args.backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn(args, sock) -> int:
+    pid = os.fork()
+    if pid == 0:
+        # Worker: handler master tidak dipakai, _serve memasang handler drain sendiri
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        try:
+            _serve(args, sockets=[sock])
+        finally:
+            # os._exit melewati atexit, flush antrian log dulu
+            stop_logging()
+            os._exit(0)
+    return pid
+
+
+def run_prefork(args):
+    """Master bind socket sekali, fork N worker, worker yang mati di-spawn ulang"""
+    sock = _bind_socket(args)
+    workers = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(args.workers):
+        pid = _spawn(args, sock)
+        workers[pid] = time.monotonic()
+
+    logger.info(
+        f"Server running on http://{args.host}:{args.port} "
+        f"({args.workers} workers x {args.threads} threads)"
+    )
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        started_at = workers.pop(pid, None)
+        if stopping or started_at is None:
+            continue
+
+        logger.warning(f"Worker {pid} exited with status {status}, respawning")
+        # Hindari respawn loop yang terlalu cepat jika worker langsung crash
+        if time.monotonic() - started_at < 1:
+            time.sleep(1)
+        new_pid = _spawn(args, sock)
+        workers[new_pid] = time.monotonic()
+
+    sock.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging()
+    if args.workers > 1:
+        if not hasattr(os, "fork"):
+            sys.exit("Pre-fork mode requires a POSIX platform (os.fork)")
+        run_prefork(args)
+    else:
+        logger.info(f"Server running on http://{args.host}:{args.port} ({args.threads} threads)")
+        _serve(args)
+
+
+if __name__ == "__main__":
+    main()
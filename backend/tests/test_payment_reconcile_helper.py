@@ -0,0 +1,101 @@
+"""
+Test parsing CSV settlement dan aturan pencocokan reconcile_settlements
+Session diganti stub (kandidat booking di memori), query yang dikirim tetap dicatat
+"""
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from helpers.payment_reconcile_helper import _normalize_amount, parse_settlement_csv, reconcile_settlements
+from helpers.qris_helper import booking_qris_reference
+
+
+class StubSession:
+    """Kembalikan semua booking untuk setiap query (filter status diperiksa lewat SQL yang dicatat)"""
+
+    def __init__(self, bookings):
+        self.bookings = bookings
+        self.statements = []
+        self.committed = False
+
+    def execute(self, query):
+        self.statements.append(str(query.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.bookings)))
+
+    def commit(self):
+        self.committed = True
+
+
+def booking(status="pending", payment_status="unpaid", amount="8000.00"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        status=status,
+        payment_status=payment_status,
+        payment_amount=Decimal(amount),
+        payment_qris_string=None,
+        payment_verified_at=None,
+        payment_rejection_reason=None,
+        payment_reference=None,
+    )
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("Rp 8.000", "8000.00"),
+    ("1.010", "1010.00"),
+    ("1,010,000", "1010000.00"),
+    ("1.010.000,50", "1010000.50"),
+    ("7229.85", "7229.85"),
+    ("1010000.50", "1010000.50"),
+    ("IDR 25.000", "25000.00"),
+])
+def test_normalize_amount(value, expected):
+    assert _normalize_amount(value) == Decimal(expected)
+
+
+@pytest.mark.parametrize("value", ["abc", "1.01.5", "1,0100", "1.010.000.5"])
+def test_normalize_amount_rejects_unknown_format(value):
+    with pytest.raises(ValueError):
+        _normalize_amount(value)
+
+
+def test_invalid_amount_is_rejected_per_row():
+    rows = parse_settlement_csv("amount,ref\nRp 8.000,a\nabc,b\n7229.85,c\n")
+
+    assert [row.get("error") for row in rows] == [None, "Invalid amount: abc", None]
+    assert rows[2]["amount"] == Decimal("7229.85")
+
+
+def test_dot_decimal_amount_matches_fractional_payment_amount():
+    target = booking(amount="7229.85")
+    session = StubSession([target])
+
+    summary = reconcile_settlements(session, parse_settlement_csv("amount,ref\n7229.85,RRN1\n"))
+
+    assert [match["bookingId"] for match in summary["matched"]] == [str(target.id)]
+    assert target.payment_status == "verified"
+    assert target.payment_reference == "RRN1"
+
+
+@pytest.mark.parametrize("status", ["cancelled", "completed"])
+def test_closed_booking_is_reported_not_reopened(status):
+    closed = booking(status=status, payment_status="rejected")
+    session = StubSession([closed])
+    content = f"amount,bill_number\n8.000,{booking_qris_reference(closed.id)}\n"
+
+    summary = reconcile_settlements(session, parse_settlement_csv(content))
+
+    assert summary["matched"] == []
+    assert summary["unmatched"] == [{"line": 2, "reason": f"booking_{status}", "bookingId": str(closed.id)}]
+    assert closed.status == status
+    assert closed.payment_status == "rejected"
+
+
+def test_amount_rule_excludes_closed_bookings():
+    session = StubSession([])
+
+    reconcile_settlements(session, parse_settlement_csv("amount\n8.000\n"))
+
+    assert "bookings.status NOT IN" in session.statements[-1]
@@ -0,0 +1,90 @@
+"""
+Test pipeline decode_qr_image: setiap tahap (downscaled, crop, fallback) dengan QR hasil generate
+Butuh pyzbar + library zbar, di-skip jika zbar tidak terpasang
+"""
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+pytest.importorskip("pyzbar.pyzbar", reason="zbar shared library is not installed", exc_type=ImportError)
+
+from helpers.qr_image_helper import DECODE_MAX_SIDE, decode_qr_image, make_qr_image
+
+
+QRIS = (
+    "00020101021126570011ID.DANA.WWW011893600915300000000102090000000010303UMI"
+    "51440014ID.CO.QRIS.WWW0215ID10200000000010303UMI5204549953033605802ID"
+    "5911TOKO WISATA6007JAKARTA61051234062070703A016304B1F3"
+)
+
+# QR versi tinggi (modul kecil): tidak terbaca setelah foto besar diperkecil ke DECODE_MAX_SIDE
+LONG_DATA = QRIS * 4
+
+ALL_STAGES = {"load", "downscaled", "load_full", "crop", "full", "threshold"}
+
+
+def to_bytes(image: Image.Image, format: str = "PNG") -> bytes:
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def qr(data: str = QRIS, side: int = None) -> Image.Image:
+    image = make_qr_image(data).get_image().convert("L")
+    if side:
+        image = image.resize((side, side), Image.Resampling.NEAREST)
+    return image
+
+
+def on_canvas(image: Image.Image, size: tuple, position: tuple) -> Image.Image:
+    """Tempel QR di foto besar berlatar putih (seperti foto HP dengan QR kecil di tengah)"""
+    canvas = Image.new("L", size, 255)
+    canvas.paste(image, position)
+    return canvas
+
+
+@pytest.mark.parametrize("side", [200, 600, 1000])
+@pytest.mark.parametrize("angle", [0, 90, 180, 270])
+def test_small_clear_qr_decodes_on_first_stage(side, angle):
+    image = qr(side=side).rotate(angle, expand=True)
+
+    result = decode_qr_image(to_bytes(image))
+
+    assert result["data"] == QRIS
+    assert result["strategy"] == "downscaled"
+    assert set(result["timings"]) == {"load", "downscaled"}
+
+
+@pytest.mark.parametrize("angle", [0, 90])
+def test_large_photo_is_decoded_downscaled(angle):
+    # QR memenuhi foto 12MP: cukup besar setelah diperkecil, resolusi penuh tidak perlu di-load
+    image = on_canvas(qr(side=2600), (4000, 3000), (700, 200)).rotate(angle, expand=True)
+
+    result = decode_qr_image(to_bytes(image, "JPEG"))
+
+    assert result["data"] == QRIS
+    assert result["strategy"] == "downscaled"
+    assert "load_full" not in result["timings"]
+
+
+@pytest.mark.parametrize("angle", [0, 90, 180, 270])
+def test_small_qr_in_large_photo_needs_crop(angle):
+    image = on_canvas(qr(LONG_DATA, side=480), (4800, 3600), (3000, 2400)).rotate(angle, expand=True)
+    assert max(image.size) > DECODE_MAX_SIDE * 4
+
+    result = decode_qr_image(to_bytes(image))
+
+    assert result["data"] == LONG_DATA
+    assert result["strategy"] == "crop"
+    assert set(result["timings"]) == {"load", "downscaled", "load_full", "crop"}
+
+
+def test_image_without_qr_runs_every_stage():
+    image = Image.new("L", (2000, 1500), 200)
+
+    result = decode_qr_image(to_bytes(image))
+
+    assert result["data"] is None
+    assert result["strategy"] is None
+    assert set(result["timings"]) == ALL_STAGES
@@ -0,0 +1,105 @@
+from sqlalchemy import select, func
+
+from models.booking_model import Booking
+from models.package_model import Package
+from models.review_model import Review
+
+
+def agent_stats(session, user_id):
+    """
+    Hitung statistik dashboard agent
+    Dipakai view sync (analytics_agent_stats) dan handler async (asgi.py)
+
+    Args:
+        session: SQLAlchemy session (sync, atau sync facade dari AsyncSession.run_sync)
+        user_id: UUID agent
+
+    Returns:
+        Dictionary statistik agent
+    """
+    # Total packages
+    query_total_packages = select(func.count(Package.id)).where(Package.agent_id == user_id)
+    total_packages = session.execute(query_total_packages).scalar() or 0
+    
+    # Get all bookings for agent's packages
+    query_bookings = select(Booking).join(Package).where(Package.agent_id == user_id)
+    bookings = session.execute(query_bookings).scalars().all()
+    
+    total_bookings = len(bookings)
+    pending_bookings = len([b for b in bookings if b.status == "pending"])
+    confirmed_bookings = len([b for b in bookings if b.status == "confirmed"])
+    completed_bookings = len([b for b in bookings if b.status == "completed"])
+    cancelled_bookings = len([b for b in bookings if b.status == "cancelled"])
+    
+    # Total revenue (confirmed + completed)
+    total_revenue = sum(
+        float(b.total_price) for b in bookings 
+        if b.status in ["confirmed", "completed"]
+    )
+    
+    # Average rating
+    query_avg_rating = select(func.avg(Review.rating)).select_from(Review).join(
+        Package
+    ).where(Package.agent_id == user_id)
+    avg_rating = session.execute(query_avg_rating).scalar()
+    avg_rating = float(avg_rating) if avg_rating else 0
+    
+    # Pending payment verifications
+    pending_payments = len([b for b in bookings if b.payment_status == "pending_verification"])
+    
+    return {
+        "totalPackages": total_packages,
+        "totalBookings": total_bookings,
+        "pendingBookings": pending_bookings,
+        "confirmedBookings": confirmed_bookings,
+        "completedBookings": completed_bookings,
+        "cancelledBookings": cancelled_bookings,
+        "totalRevenue": round(total_revenue, 2),
+        "averageRating": round(avg_rating, 2),
+        "pendingPaymentVerifications": pending_payments
+    }
+
+
+def tourist_stats(session, user_id):
+    """
+    Hitung statistik dashboard tourist
+    Dipakai view sync (analytics_tourist_stats) dan handler async (asgi.py)
+
+    Args:
+        session: SQLAlchemy session (sync, atau sync facade dari AsyncSession.run_sync)
+        user_id: UUID tourist
+
+    Returns:
+        Dictionary statistik tourist
+    """
+    # Get all bookings for tourist
+    query_bookings = select(Booking).where(Booking.tourist_id == user_id)
+    bookings = session.execute(query_bookings).scalars().all()
+    
+    total_bookings = len(bookings)
+    confirmed_bookings = len([b for b in bookings if b.status == "confirmed"])
+    pending_bookings = len([b for b in bookings if b.status == "pending"])
+    completed_bookings = len([b for b in bookings if b.status == "completed"])
+    cancelled_bookings = len([b for b in bookings if b.status == "cancelled"])
+    
+    # Total spent
+    total_spent = sum(float(b.total_price) for b in bookings if b.status in ["confirmed", "completed"])
+    
+    # Reviews given
+    query_reviews = select(func.count(Review.id)).where(Review.tourist_id == user_id)
+    reviews_given = session.execute(query_reviews).scalar() or 0
+    
+    # TODO: Implement wishlist if needed
+    # For now, returning 0 as wishlist is not in the database model
+    wishlist_count = 0
+    
+    return {
+        "totalBookings": total_bookings,
+        "confirmedBookings": confirmed_bookings,
+        "pendingBookings": pending_bookings,
+        "completedBookings": completed_bookings,
+        "cancelledBookings": cancelled_bookings,
+        "totalSpent": round(total_spent, 2),
+        "reviewsGiven": reviews_given,
+        "wishlistCount": wishlist_count
+    }
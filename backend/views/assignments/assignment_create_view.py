@@ -1,3 +1,4 @@
+import logging
 from pyramid.response import Response
 from pyramid.view import view_config
 from sqlalchemy import select, and_
@@ -6,9 +7,14 @@ from models.tour_guide_assignment_model import TourGuideAssignment
 from models.booking_model import Booking
 from models.user_model import User
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.permission_helper import load_owned
 from pydantic import BaseModel, ValidationError
 import uuid
 
+
+logger = logging.getLogger(__name__)
+
+
 class AssignmentRequest(BaseModel):
     bookingId: str
     guideId: str
@@ -17,7 +23,6 @@ class AssignmentRequest(BaseModel):
 @jwt_validate
 def assignment_create(request):
     try:
-        user_id = request.jwt_claims.get("sub")
         user_role = request.jwt_claims.get("role")
         
         if user_role != "agent":
@@ -31,14 +36,13 @@ def assignment_create(request):
             return Response(json_body={"error": "Format ID tidak valid"}, status=400)
 
         with Session() as session:
-            booking = session.execute(
-                select(Booking).where(Booking.id == booking_uuid)
-            ).scalar_one_or_none()
+            # booking + cek kepemilikan (package.agent_id) dalam satu query
+            booking, is_owner = load_owned(session, "booking", booking_uuid, request.jwt_claims)
 
             if not booking or booking.status != "confirmed":
                 return Response(json_body={"error": "Booking tidak ditemukan atau belum dikonfirmasi"}, status=404)
 
-            if str(booking.package.agent_id) != user_id:
+            if not is_owner:
                 return Response(json_body={"error": "Anda tidak memiliki akses ke booking ini"}, status=403)
             
             #validasi guide 
@@ -81,6 +85,6 @@ def assignment_create(request):
                 "guideName": guide.name
             }
                 
-    except Exception as e:
-        print(f"CRITICAL ERROR: {e}")
+    except Exception:
+        logger.exception("Error creating assignment")
         return Response(json_body={"error": "Internal Server Error"}, status=500)
@@ -0,0 +1,31 @@
+import logging
+from pyramid.response import Response
+from pyramid.view import view_config
+from helpers.jwt_key_helper import get_jwks
+
+
+logger = logging.getLogger(__name__)
+
+
+@view_config(route_name="jwks", request_method="GET", renderer="json")
+def jwks(request):
+    """
+    GET /.well-known/jwks.json
+    Public key untuk verifikasi JWT (RS256 / EdDSA), dipakai edge proxy & worker lain
+
+    Response (200 OK):
+    {
+        "keys": [
+            {"kty": "OKP", "crv": "Ed25519", "x": "...", "kid": "2026-10", "use": "sig", "alg": "EdDSA"}
+        ]
+    }
+    """
+    try:
+        key_set = get_jwks()
+    except Exception:
+        logger.exception("Error building JWKS")
+        return Response(json_body={"error": "Internal Server Error"}, status=500)
+
+    # key set jarang berubah, boleh di-cache proxy / client
+    request.response.cache_control = "public, max-age=300"
+    return key_set
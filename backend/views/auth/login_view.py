@@ -1,13 +1,27 @@
-import bcrypt
-import jwt
-import datetime
+import logging
 from pyramid.response import Response
 from pyramid.view import view_config
 from pydantic import BaseModel, ValidationError
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import NoResultFound
 from db import Session
 from models.user_model import User
+from helpers.password_helper import (
+    PasswordHasherBusy,
+    busy_response,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+from helpers.user_cache_helper import set_user_profile
+from helpers.token_helper import (
+    ACCESS_TOKEN_MINUTES,
+    create_access_token,
+    issue_refresh_token,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class LoginRequest(BaseModel):
@@ -29,28 +43,45 @@ def login(request):
             result = session.execute(stmt).scalars().one()
         except NoResultFound:
             return Response(json_body={"message": "User tidak ditemukan"}, status=401)
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error fetching user")
             return Response(json_body={"error": "Internal Server Error"}, status=500)
 
-    # check the password with the hash in the db
-    bytes = req_data.password.encode("utf-8")
-    is_valid = bcrypt.checkpw(bytes, result.password_hash.encode("utf-8"))
+    # check the password with the hash in the db (bcrypt di thread request, slot BoundedSemaphore
+    # diambil tanpa menunggu: semua slot terpakai -> PasswordHasherBusy -> 503 + Retry-After)
+    try:
+        is_valid = verify_password(req_data.password, result.password_hash)
+    except PasswordHasherBusy:
+        return busy_response()
 
     if is_valid == True:
-        # making jwt token
-        encoded = jwt.encode(
-            {
-                "sub": str(result.id),
-                "email": result.email,
-                "role": result.role,
-                "exp": datetime.datetime.now(datetime.timezone.utc)
-                + datetime.timedelta(minutes=30),
-                "iat": datetime.datetime.now(datetime.timezone.utc),
-            },
-            "secret",
-            algorithm="HS256",
-        )
+        # rehash transparan jika BCRYPT_ROUNDS berubah sejak password terakhir di-hash
+        if needs_rehash(result.password_hash):
+            try:
+                new_hash = hash_password(req_data.password)
+                with Session() as session:
+                    session.execute(
+                        update(User).where(User.id == result.id).values(password_hash=new_hash)
+                    )
+                    session.commit()
+            except PasswordHasherBusy:
+                pass  # coba lagi di login berikutnya
+            except Exception:
+                logger.exception("Error rehashing password")
+
+        # profil disimpan ke cache, /api/auth/me setelah login tidak perlu query
+        set_user_profile(result)
+
+        # access token pendek + refresh token (disimpan hashed) untuk /api/auth/refresh
+        encoded = create_access_token(result.id, result.email, result.role)
+        try:
+            with Session() as session:
+                refresh_token = issue_refresh_token(session, result.id)
+                session.commit()
+        except Exception:
+            logger.exception("Error issuing refresh token")
+            return Response(json_body={"error": "Internal Server Error"}, status=500)
+
         return {
             "message": "User login",
             "user": {
@@ -60,6 +91,8 @@ def login(request):
                 "role": result.role,
             },
             "token": encoded,
+            "refreshToken": refresh_token,
+            "expiresIn": ACCESS_TOKEN_MINUTES * 60,
         }
 
     return {"message": "Password salah"}
@@ -0,0 +1,55 @@
+import logging
+from pyramid.response import Response
+from pyramid.view import view_config
+from pydantic import BaseModel, ValidationError
+from db import Session
+from helpers.token_helper import InvalidRefreshToken, rotate_refresh_token
+
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshRequest(BaseModel):
+    refreshToken: str
+
+
+@view_config(route_name="refresh", request_method="POST", renderer="json")
+def refresh(request):
+    """
+    POST /api/auth/refresh
+    Tukar refresh token dengan access token baru (tanpa bcrypt), refresh token ikut dirotasi
+
+    Request (JSON):
+    {
+        "refreshToken": "..."
+    }
+
+    Response (200 OK):
+    {
+        "token": "jwt-access-token",
+        "refreshToken": "refresh-token-baru",
+        "expiresIn": 900
+    }
+    """
+    # request validation
+    try:
+        req_data = RefreshRequest(**request.json_body)
+    except ValidationError as err:
+        return Response(json_body={"error": str(err.errors())}, status=400)
+    except ValueError:
+        return Response(json_body={"error": "Invalid JSON body"}, status=400)
+
+    with Session() as session:
+        try:
+            result = rotate_refresh_token(session, req_data.refreshToken)
+        except InvalidRefreshToken as e:
+            return Response(json_body={"error": str(e)}, status=401)
+        except Exception:
+            logger.exception("Error refreshing token")
+            return Response(json_body={"error": "Internal Server Error"}, status=500)
+
+    return {
+        "token": result["token"],
+        "refreshToken": result["refreshToken"],
+        "expiresIn": result["expiresIn"],
+    }
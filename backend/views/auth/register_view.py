@@ -1,4 +1,3 @@
-import bcrypt
 from pyramid.response import Response
 from pyramid.view import view_config
 from pydantic import BaseModel, ValidationError
@@ -6,6 +5,7 @@ from sqlalchemy.exc import IntegrityError
 from db import Session
 from enum import Enum
 from models.user_model import User
+from helpers.password_helper import PasswordHasherBusy, busy_response, hash_password
 
 
 class UserRole(str, Enum):
@@ -29,10 +29,12 @@ def register(request):
     except ValidationError as err:
         return Response(json_body={"error": str(err.errors())}, status=400)
 
-    # hash the password
-    bytes = req_data.password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hash = bcrypt.hashpw(bytes, salt).decode("utf-8")
+    # hash the password (bcrypt di thread request, slot BoundedSemaphore diambil tanpa menunggu:
+    # semua slot terpakai -> PasswordHasherBusy -> 503 + Retry-After)
+    try:
+        hash = hash_password(req_data.password)
+    except PasswordHasherBusy:
+        return busy_response()
 
     user_id = None
     with Session() as session:
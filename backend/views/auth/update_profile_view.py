@@ -1,5 +1,4 @@
 """Update user profile"""
-import bcrypt
 from pyramid.response import Response
 from pyramid.view import view_config
 from pydantic import BaseModel, ValidationError
@@ -7,7 +6,15 @@ from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound
 
 from models.user_model import User
-from helpers.jwt_validate_helper import jwt_validate
+from helpers.jwt_validate_helper import jwt_validate, revoke_user_tokens
+from helpers.password_helper import (
+    PasswordHasherBusy,
+    busy_response,
+    hash_password,
+    verify_password,
+)
+from helpers.user_cache_helper import invalidate_user_profile
+from helpers.token_helper import revoke_user_refresh_tokens
 
 
 class UpdateProfileRequest(BaseModel):
@@ -53,6 +60,7 @@ def update_profile(request):
         
         db_session.commit()
         db_session.refresh(user)
+        invalidate_user_profile(user.id)
         
         return {
             "message": "Profile updated successfully",
@@ -89,25 +97,29 @@ def change_password(request):
         except NoResultFound:
             return Response(json_body={"error": "User not found"}, status=404)
         
-        # Verify current password
-        current_password_bytes = req_data.currentPassword.encode("utf-8")
-        is_valid = bcrypt.checkpw(current_password_bytes, user.password_hash.encode("utf-8"))
-        
-        if not is_valid:
-            return Response(json_body={"error": "Current password is incorrect"}, status=400)
-        
         # Validate new password length
         if len(req_data.newPassword) < 6:
             return Response(json_body={"error": "New password must be at least 6 characters"}, status=400)
         
-        # Hash new password
-        new_password_bytes = req_data.newPassword.encode("utf-8")
-        salt = bcrypt.gensalt()
-        new_password_hash = bcrypt.hashpw(new_password_bytes, salt).decode("utf-8")
+        try:
+            # Verify current password
+            is_valid = verify_password(req_data.currentPassword, user.password_hash)
+            
+            if not is_valid:
+                return Response(json_body={"error": "Current password is incorrect"}, status=400)
+            
+            # Hash new password
+            new_password_hash = hash_password(req_data.newPassword)
+        except PasswordHasherBusy:
+            return busy_response()
         
         # Update password
         user.password_hash = new_password_hash
+        # sesi lain harus login ulang dengan password baru
+        revoke_user_refresh_tokens(db_session, user.id)
         db_session.commit()
+        revoke_user_tokens(user.id)
+        invalidate_user_profile(user.id)
         
         return {"message": "Password changed successfully"}
         
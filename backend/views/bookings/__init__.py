@@ -0,0 +1,100 @@
+from sqlalchemy import select, and_
+from sqlalchemy.orm import selectinload
+
+from models.booking_model import Booking
+from helpers.pagination_helper import get_pagination_params, paginate
+from helpers.static_file_helper import signed_file_url
+
+
+def serialize_booking(b):
+    """Serialisasi booking untuk list (package & tourist ringkas)"""
+    return {
+        "id": str(b.id),
+        "packageId": str(b.package_id),
+        "touristId": str(b.tourist_id),
+        "travelDate": b.travel_date.isoformat(),
+        "travelersCount": b.travelers_count,
+        "totalPrice": float(b.total_price),
+        "status": b.status,
+        "createdAt": b.created_at.isoformat() if b.created_at else None,
+        "completedAt": b.completed_at.isoformat() if b.completed_at else None,
+        "hasReviewed": b.has_reviewed,
+        "paymentStatus": b.payment_status,
+        "paymentProofUrl": signed_file_url(b.payment_proof_url),
+        "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
+        "paymentVerifiedAt": b.payment_verified_at.isoformat() if b.payment_verified_at else None,
+        "paymentRejectionReason": b.payment_rejection_reason,
+        "package": {
+            "id": str(b.package.id),
+            "name": b.package.name,
+            "images": b.package.images[:1] if b.package.images else []
+        } if b.package else None,
+        "tourist": {
+            "id": str(b.tourist.id),
+            "name": b.tourist.name,
+            "email": b.tourist.email
+        } if b.tourist else None
+    }
+
+
+def list_bookings(session, params, claims):
+    """
+    Query booking dengan filter & pagination opsional
+    Dipakai view sync (bookings_list) dan handler async (asgi.py)
+
+    Args:
+        session: SQLAlchemy session (sync, atau sync facade dari AsyncSession.run_sync)
+        params: query parameter (tourist_id, package_id, status, payment_status, page, limit, after, count)
+        claims: JWT claims (tourist hanya melihat booking miliknya)
+
+    Returns:
+        Tuple (list booking terserialisasi, meta pagination atau None)
+
+    Raises:
+        ValueError: If parameter pagination / cursor invalid
+    """
+    # package & tourist di-load sekaligus, bukan lazy load per baris
+    query = select(Booking).options(selectinload(Booking.package), selectinload(Booking.tourist))
+
+    # Apply filters
+    filters = []
+
+    # Role-based access
+    if claims.get("role") == "tourist":
+        filters.append(Booking.tourist_id == claims.get("sub"))
+
+    # Optional filters
+    tourist_id = params.get("tourist_id")
+    if tourist_id:
+        filters.append(Booking.tourist_id == tourist_id)
+
+    package_id = params.get("package_id")
+    if package_id:
+        filters.append(Booking.package_id == package_id)
+
+    status = params.get("status")
+    if status:
+        filters.append(Booking.status == status)
+
+    payment_status = params.get("payment_status")
+    if payment_status:
+        filters.append(Booking.payment_status == payment_status)
+
+    if filters:
+        query = query.where(and_(*filters))
+
+    pagination = get_pagination_params(params, required=False)
+
+    meta = None
+    if pagination:
+        bookings, meta = paginate(
+            session,
+            query,
+            pagination,
+            sort_column=Booking.created_at,
+            id_column=Booking.id,
+            descending=True,
+        )
+    else:
+        bookings = session.execute(query).scalars().all()
+    return [serialize_booking(b) for b in bookings], meta
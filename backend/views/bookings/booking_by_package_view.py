@@ -4,6 +4,7 @@ from sqlalchemy import select
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.static_file_helper import signed_file_url
 
 
 @view_config(route_name="booking_by_package", request_method="GET", renderer="json")
@@ -73,7 +74,7 @@ def booking_by_package(request):
                 "completedAt": b.completed_at.isoformat() if b.completed_at else None,
                 "hasReviewed": b.has_reviewed,
                 "paymentStatus": b.payment_status,
-                "paymentProofUrl": b.payment_proof_url,
+                "paymentProofUrl": signed_file_url(b.payment_proof_url),
                 "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
                 "paymentVerifiedAt": b.payment_verified_at.isoformat() if b.payment_verified_at else None,
                 "paymentRejectionReason": b.payment_rejection_reason
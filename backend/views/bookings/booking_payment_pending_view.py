@@ -4,6 +4,7 @@ from sqlalchemy import select
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.static_file_helper import signed_file_url
 
 
 @view_config(route_name="booking_payment_pending", request_method="GET", renderer="json")
@@ -75,7 +76,7 @@ def booking_payment_pending(request):
                 "status": b.status,
                 "createdAt": b.created_at.isoformat() if b.created_at else None,
                 "paymentStatus": b.payment_status,
-                "paymentProofUrl": b.payment_proof_url,
+                "paymentProofUrl": signed_file_url(b.payment_proof_url),
                 "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
                 "package": {
                     "id": str(b.package.id),
@@ -0,0 +1,106 @@
+"""Generate dynamic QRIS bound to a booking"""
+import base64
+from decimal import Decimal
+from pyramid.view import view_config
+from sqlalchemy import select
+
+from models.booking_model import Booking
+from helpers.jwt_validate_helper import jwt_validate
+from helpers.qr_image_helper import render_qr_png
+from helpers.qris_helper import booking_qris_reference, build_dynamic_qris_string, calculate_total_amount
+from helpers.qris_cache_helper import get_active_qris
+
+
+@view_config(route_name="booking_payment_qris", request_method="POST", renderer="json")
+@jwt_validate
+def booking_payment_qris(request):
+    """
+    POST /api/bookings/{id}/payment-qris
+    Generate (atau ambil ulang) dynamic QRIS untuk booking (Tourist only)
+    Amount = total_price + fee QRIS aktif, disimpan di booking untuk rekonsiliasi otomatis
+    Reference booking disisipkan di tag 62, jadi QRIS unik per booking walau totalnya sama
+    
+    Response (200 OK):
+    {
+        "bookingId": "uuid",
+        "qrisId": "uuid-of-active-qris",
+        "amount": 7000.0,
+        "feeType": "rupiah",
+        "feeValue": 1000,
+        "totalAmount": 8000.0,
+        "dynamicQrisString": "00020101021226...",
+        "base64Qr": "iVBORw0KGgoAAAANSUhEUgAA...",
+        "paymentStatus": "unpaid"
+    }
+    """
+    try:
+        user_id = request.jwt_claims.get("sub")
+        user_role = request.jwt_claims.get("role")
+        
+        # Only tourists can pay bookings
+        if user_role != "tourist":
+            request.response.status = 403
+            return {"error": "Only tourists can generate booking payment QRIS"}
+        
+        booking_id = request.matchdict.get("id")
+        db_session = request.dbsession
+        
+        if not booking_id:
+            request.response.status = 400
+            return {"error": "ID is required"}
+        
+        # Get booking
+        query = select(Booking).where(Booking.id == booking_id)
+        result = db_session.execute(query)
+        booking = result.scalar_one_or_none()
+        
+        if not booking:
+            request.response.status = 404
+            return {"error": "Booking not found"}
+        
+        # Authorization check - tourist can only pay own bookings
+        if str(booking.tourist_id) != user_id:
+            request.response.status = 403
+            return {"error": "Forbidden"}
+        
+        if booking.payment_status not in ["unpaid", "rejected"]:
+            request.response.status = 400
+            return {"error": "Booking payment is already being processed"}
+        
+        qris = get_active_qris()
+        
+        if not qris:
+            request.response.status = 404
+            return {"error": "QRIS not found. Silakan upload QRIS terlebih dahulu."}
+        
+        amount = float(booking.total_price)
+        total_amount = calculate_total_amount(amount, qris["fee_type"], qris["fee_value"])
+        dynamic_qris_string = build_dynamic_qris_string(
+            qris["template"],
+            amount,
+            qris["fee_type"],
+            qris["fee_value"],
+            reference=booking_qris_reference(booking.id),
+        )
+        
+        # Simpan hanya jika berubah (QRIS aktif / fee diganti sejak generate terakhir)
+        if booking.payment_qris_string != dynamic_qris_string:
+            booking.payment_qris_string = dynamic_qris_string
+            booking.payment_amount = Decimal(str(total_amount)).quantize(Decimal("0.01"))
+            db_session.commit()
+        
+        return {
+            "bookingId": str(booking.id),
+            "qrisId": str(qris["id"]),
+            "amount": amount,
+            "feeType": qris["fee_type"],
+            "feeValue": qris["fee_value"],
+            "totalAmount": total_amount,
+            "dynamicQrisString": dynamic_qris_string,
+            "base64Qr": base64.b64encode(render_qr_png(dynamic_qris_string)).decode("utf-8"),
+            "paymentStatus": booking.payment_status,
+        }
+    
+    except Exception as e:
+        request.response.status = 500
+        return {"error": f"Internal server error: {str(e)}"}
@@ -0,0 +1,57 @@
+"""Reconcile booking payments against a settlement CSV"""
+from pyramid.view import view_config
+
+from helpers.jwt_validate_helper import jwt_validate
+from helpers.payment_reconcile_helper import parse_settlement_csv, reconcile_settlements
+
+MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+
+
+@view_config(route_name="booking_payment_reconcile", request_method="POST", renderer="json")
+@jwt_validate
+def booking_payment_reconcile(request):
+    """
+    POST /api/bookings/payment/reconcile
+    Import settlement CSV dan verify pembayaran booking yang cocok secara otomatis (Agent only)
+    
+    Request (multipart/form-data):
+    - settlement: file CSV dengan header, kolom amount dan/atau qris_string, opsional reference
+    
+    Response (200 OK):
+    {
+        "matched": [{"line": 2, "bookingId": "uuid", "amount": 8000.0, "rule": "qris_string"}],
+        "unmatched": [{"line": 3, "reason": "amount_not_found"}],
+        "ambiguous": [{"line": 4, "bookingIds": ["uuid", "uuid"]}]
+    }
+    """
+    try:
+        user_id = request.jwt_claims.get("sub")
+        user_role = request.jwt_claims.get("role")
+        
+        # Only agents can reconcile payments
+        if user_role != "agent":
+            request.response.status = 403
+            return {"error": "Only agents can reconcile payments"}
+        
+        settlement_file = request.POST.get("settlement")
+        if not hasattr(settlement_file, "file"):
+            request.response.status = 400
+            return {"error": "settlement CSV file is required"}
+        
+        content = settlement_file.file.read(MAX_FILE_SIZE + 1)
+        if len(content) > MAX_FILE_SIZE:
+            request.response.status = 400
+            return {"error": "settlement file size must be <= 5MB"}
+        
+        try:
+            rows = parse_settlement_csv(content.decode("utf-8-sig"))
+        except (ValueError, UnicodeDecodeError) as e:
+            request.response.status = 400
+            return {"error": f"Invalid settlement CSV: {str(e)}"}
+        
+        # Agent hanya bisa me-reconcile booking dari paket miliknya
+        return reconcile_settlements(request.dbsession, rows, agent_id=user_id)
+    
+    except Exception as e:
+        request.response.status = 500
+        return {"error": f"Internal server error: {str(e)}"}
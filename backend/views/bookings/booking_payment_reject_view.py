@@ -1,14 +1,16 @@
 """Reject payment proof"""
 from pyramid.view import view_config
-from sqlalchemy import select
+from sqlalchemy.orm import object_session
 import json
 
-from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.permission_helper import requires
+from helpers.static_file_helper import signed_file_url
 
 
 @view_config(route_name="booking_payment_reject", request_method="PUT", renderer="json")
 @jwt_validate
+@requires(role="agent", owns="booking", role_error="Only agents can reject payments")
 def booking_payment_reject(request):
     """
     PUT /api/bookings/{id}/payment-reject
@@ -39,20 +41,9 @@ def booking_payment_reject(request):
     }
     """
     try:
-        user_id = request.jwt_claims.get("sub")
-        user_role = request.jwt_claims.get("role")
-        
-        # Only agents can reject payments
-        if user_role != "agent":
-            request.response.status = 403
-            return {"error": "Only agents can reject payments"}
-        
-        booking_id = request.matchdict.get("id")
-        db_session = request.dbsession
-        
-        if not booking_id:
-            request.response.status = 400
-            return {"error": "ID is required"}
+        # Role & kepemilikan sudah dicek @requires (satu query JOIN package)
+        booking = request.owned_object
+        db_session = object_session(booking)
         
         # Parse request body
         try:
@@ -66,20 +57,6 @@ def booking_payment_reject(request):
             request.response.status = 400
             return {"error": "Rejection reason is required"}
         
-        # Get booking
-        query = select(Booking).where(Booking.id == booking_id)
-        result = db_session.execute(query)
-        booking = result.scalar_one_or_none()
-        
-        if not booking:
-            request.response.status = 404
-            return {"error": "Booking not found"}
-        
-        # Authorization check - agent can only reject own package bookings
-        if str(booking.package.agent_id) != user_id:
-            request.response.status = 403
-            return {"error": "Forbidden"}
-        
         # Check booking payment status
         if booking.payment_status != "pending_verification":
             request.response.status = 400
@@ -104,7 +81,7 @@ def booking_payment_reject(request):
             "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
             "hasReviewed": booking.has_reviewed,
             "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
+            "paymentProofUrl": signed_file_url(booking.payment_proof_url),
             "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
             "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
             "paymentRejectionReason": booking.payment_rejection_reason
@@ -9,6 +9,7 @@ from io import BytesIO
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.static_file_helper import signed_file_url
 
 # Storage configuration
 STORAGE_DIR = "storage/payment_proofs"
@@ -151,7 +152,7 @@ def booking_payment_upload(request):
             "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
             "hasReviewed": booking.has_reviewed,
             "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
+            "paymentProofUrl": signed_file_url(booking.payment_proof_url),
             "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
             "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
             "paymentRejectionReason": booking.payment_rejection_reason
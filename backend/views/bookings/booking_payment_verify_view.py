@@ -1,14 +1,16 @@
 """Verify payment proof"""
 from pyramid.view import view_config
-from sqlalchemy import select
+from sqlalchemy.orm import object_session
 from datetime import datetime
 
-from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.permission_helper import requires
+from helpers.static_file_helper import signed_file_url
 
 
 @view_config(route_name="booking_payment_verify", request_method="PUT", renderer="json")
 @jwt_validate
+@requires(role="agent", owns="booking", role_error="Only agents can verify payments")
 def booking_payment_verify(request):
     """
     PUT /api/bookings/{id}/payment-verify
@@ -34,34 +36,9 @@ def booking_payment_verify(request):
     }
     """
     try:
-        user_id = request.jwt_claims.get("sub")
-        user_role = request.jwt_claims.get("role")
-        
-        # Only agents can verify payments
-        if user_role != "agent":
-            request.response.status = 403
-            return {"error": "Only agents can verify payments"}
-        
-        booking_id = request.matchdict.get("id")
-        db_session = request.dbsession
-        
-        if not booking_id:
-            request.response.status = 400
-            return {"error": "ID is required"}
-        
-        # Get booking
-        query = select(Booking).where(Booking.id == booking_id)
-        result = db_session.execute(query)
-        booking = result.scalar_one_or_none()
-        
-        if not booking:
-            request.response.status = 404
-            return {"error": "Booking not found"}
-        
-        # Authorization check - agent can only verify own package bookings
-        if str(booking.package.agent_id) != user_id:
-            request.response.status = 403
-            return {"error": "Forbidden"}
+        # Role & kepemilikan sudah dicek @requires (satu query JOIN package)
+        booking = request.owned_object
+        db_session = object_session(booking)
         
         # Check booking payment status
         if booking.payment_status != "pending_verification":
@@ -89,7 +66,7 @@ def booking_payment_verify(request):
             "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
             "hasReviewed": booking.has_reviewed,
             "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
+            "paymentProofUrl": signed_file_url(booking.payment_proof_url),
             "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
             "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
             "paymentRejectionReason": booking.payment_rejection_reason
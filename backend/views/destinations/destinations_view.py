@@ -1,3 +1,4 @@
+import logging
 from db import Session
 from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound, IntegrityError
@@ -12,6 +13,9 @@ import uuid
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
 class DestinationFilterRequest(BaseModel):
     country: Optional[str] = None
     name: Optional[str] = None
@@ -42,39 +46,39 @@ def destinations(request):
         return Response(json_body={"error": str(err.errors())}, status=400)
 
     # get destination from db
-    with Session() as session:
-        stmt = select(
-            Destination
-        )  # building the query step by step if the url have some parameters
-        if req_data.country is not None:
-            stmt = stmt.where(Destination.country == req_data.country)
-        if req_data.name is not None:
-            stmt = stmt.where(Destination.name == req_data.name)
+    session = request.dbsession
+    stmt = select(
+        Destination
+    )  # building the query step by step if the url have some parameters
+    if req_data.country is not None:
+        stmt = stmt.where(Destination.country == req_data.country)
+    if req_data.name is not None:
+        stmt = stmt.where(Destination.name == req_data.name)
 
-        try:
-            result = (
-                session.execute(stmt).scalars().all()
-            )  # agar kembalikan semua, atau tidak sama sekali (imo gitu sih, cmiiw)
-            return [
-                serialization_data(dest) for dest in result
-            ]  # serialisasikan semua destinasi yang ada dari .all()
-        except Exception as e:
-            print(e)
-            return Response(json_body={"error": "Internal Server Error"}, status=500)
+    try:
+        result = (
+            session.execute(stmt).scalars().all()
+        )  # agar kembalikan semua, atau tidak sama sekali (imo gitu sih, cmiiw)
+        return [
+            serialization_data(dest) for dest in result
+        ]  # serialisasikan semua destinasi yang ada dari .all()
+    except Exception:
+        logger.exception("Error fetching destinations")
+        return Response(json_body={"error": "Internal Server Error"}, status=500)
 
 
 @view_config(route_name="destination_detail", request_method="GET", renderer="json")
 def destination_detail(request):
     dest_id = request.matchdict.get("id")
-    with Session() as session:
-        stmt = select(Destination).where(Destination.id == dest_id)
-        try:
-            result = session.execute(stmt).scalars().one()  # tampilkan 1 data
-            return serialization_data(result)  # serialisasikan
-        except NoResultFound:
-            return Response(json_body={"error": "Destination not found"}, status=404)
-        except Exception as e:
-            return Response(json_body={"error": "Invalid ID or server error"}, status=400)
+    session = request.dbsession
+    stmt = select(Destination).where(Destination.id == dest_id)
+    try:
+        result = session.execute(stmt).scalars().one()  # tampilkan 1 data
+        return serialization_data(result)  # serialisasikan
+    except NoResultFound:
+        return Response(json_body={"error": "Destination not found"}, status=404)
+    except Exception as e:
+        return Response(json_body={"error": "Invalid ID or server error"}, status=400)
 
 @view_config(route_name="destinations", request_method="POST", renderer="json")
 @jwt_validate
@@ -118,8 +122,8 @@ def create_destination(request):
                     status=409,
                 )
 
-    except Exception as e:
-        print(f"Error creating destination: {e}")
+    except Exception:
+        logger.exception("Error creating destination")
         return Response(json_body={"error": "Internal server error"}, status=500)
 
 
@@ -168,8 +172,8 @@ def update_destination(request):
                 session.rollback()
                 return Response(json_body={"error": str(err)}, status=500)
                 
-    except Exception as e:
-        print(f"Error updating destination: {e}")
+    except Exception:
+        logger.exception("Error updating destination")
         return Response(json_body={"error": "Internal server error"}, status=500)
 
 
@@ -197,6 +201,6 @@ def delete_destination(request):
                 session.rollback()
                 return Response(json_body={"error": str(err)}, status=500)
                 
-    except Exception as e:
-        print(f"Error deleting destination: {e}")
+    except Exception:
+        logger.exception("Error deleting destination")
         return Response(json_body={"error": "Internal server error"}, status=500)
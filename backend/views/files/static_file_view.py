@@ -0,0 +1,48 @@
+from pyramid.response import Response
+from pyramid.view import view_config
+from helpers.jwt_validate_helper import verify_token
+from helpers.permission_helper import load_owned
+from helpers.static_file_helper import PRIVATE_AREAS, resolve_path, file_response, verify_file_signature
+
+
+def _can_view_payment_proof(request, area: str, filename: str) -> bool:
+    # <img> tidak bisa kirim header Authorization: URL dari API membawa ?sig= khusus file ini
+    sig = request.params.get("sig")
+    if sig:
+        return verify_file_signature(area, filename, sig)
+
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return False
+    try:
+        claims = verify_token(auth_header[7:])
+    except Exception:
+        return False
+
+    # nama file: <booking_id>_<uuid>.<ext>, hanya tourist pemilik & agent package yang boleh lihat
+    booking_id = filename.split("_", 1)[0]
+    booking, is_owner = load_owned(request.dbsession, "booking", booking_id, claims)
+    return booking is not None and is_owner
+
+
+@view_config(route_name="static_file", request_method="GET", renderer="json")
+def static_file(request):
+    """
+    GET /{qris|payment_proofs|destinations|packages}/{filename}
+    File upload; payment_proofs butuh JWT di header Authorization atau ?sig= dari paymentProofUrl
+
+    Response (200 OK / 206 Partial Content / 304 Not Modified): isi file,
+    atau header X-Accel-Redirect / X-Sendfile jika STATIC_SENDFILE diaktifkan
+    """
+    area = request.matchdict["area"]
+    filename = request.matchdict["filename"]
+
+    path = resolve_path(area, filename)
+    if path is None:
+        return Response(json_body={"error": "File not found"}, status=404)
+
+    if area in PRIVATE_AREAS and not _can_view_payment_proof(request, area, filename):
+        # 404, bukan 403: jangan bocorkan keberadaan file
+        return Response(json_body={"error": "File not found"}, status=404)
+
+    return file_response(request, area, filename, path)
@@ -1,3 +1,11 @@
+import uuid
+from sqlalchemy import select, asc, desc
+from sqlalchemy.orm import selectinload
+
+from models.package_model import Package
+from helpers.pagination_helper import get_pagination_params, paginate
+
+
 def serialization_data(pkg):
     return {
         "id": str(pkg.id),
@@ -15,3 +23,74 @@ def serialization_data(pkg):
         "destinationName": pkg.destination.name if pkg.destination else None,
         "country": pkg.destination.country if pkg.destination else None,
     }
+
+
+def list_packages(session, params):
+    """
+    Query katalog package (filter, sort, pagination opsional)
+    Dipakai view sync (get_packages) dan handler async (asgi.py)
+
+    Args:
+        session: SQLAlchemy session (sync, atau sync facade dari AsyncSession.run_sync)
+        params: query parameter (request.params atau dict)
+
+    Returns:
+        Tuple (list package terserialisasi, meta pagination atau None)
+
+    Raises:
+        ValueError: If filter harga / parameter pagination invalid
+    """
+    destination_id = params.get("destination")
+    search_query = params.get("q") or params.get("search")
+    min_price = params.get("minPrice")
+    max_price = params.get("maxPrice")
+    sort_by = params.get("sortBy")
+    order = params.get("order", "asc")
+
+    # Pagination opsional: tanpa page/limit/after semua package dikembalikan
+    pagination = get_pagination_params(params, default_limit=12, required=False)
+
+    # destination di-load sekaligus (serialization_data butuh nama & negara)
+    stmt = select(Package).options(selectinload(Package.destination))
+
+    if destination_id and destination_id != "all":
+        try:
+            uuid.UUID(destination_id)
+            stmt = stmt.where(Package.destination_id == destination_id)
+        except ValueError:
+            pass
+
+    if search_query:
+        stmt = stmt.where(Package.name.ilike(f"%{search_query}%"))
+
+    if min_price:
+        stmt = stmt.where(Package.price >= float(min_price))
+
+    if max_price:
+        stmt = stmt.where(Package.price <= float(max_price))
+
+    if sort_by == "price":
+        sort_column = Package.price
+    elif sort_by == "duration":
+        sort_column = Package.duration
+    else:
+        sort_column = Package.created_at
+
+    if order == "desc":
+        stmt = stmt.order_by(desc(sort_column))
+    else:
+        stmt = stmt.order_by(asc(sort_column))
+
+    meta = None
+    if pagination:
+        results, meta = paginate(
+            session,
+            stmt,
+            pagination,
+            sort_column=sort_column,
+            id_column=Package.id,
+            descending=order == "desc",
+        )
+    else:
+        results = session.execute(stmt).scalars().all()
+    return [serialization_data(pkg) for pkg in results], meta
@@ -1,3 +1,4 @@
+import logging
 from pyramid.response import Response
 from pyramid.view import view_config
 from sqlalchemy import select
@@ -10,6 +11,9 @@ from typing import Optional, List
 from . import serialization_data
 
 
+logger = logging.getLogger(__name__)
+
+
 class PackageUpdateRequest(BaseModel):
     name: Optional[str] = None
     duration: Optional[int] = None
@@ -24,18 +28,18 @@ class PackageUpdateRequest(BaseModel):
 def package_detail(request):
     pkg_id = request.matchdict.get("id")
 
-    with Session() as session:
-        try:
-            stmt = select(Package).where(Package.id == pkg_id)
-            pkg = session.execute(stmt).scalars().one()
-            return serialization_data(pkg)
-        except NoResultFound:
-            return Response(json_body={"message": "Package not found"}, status=404)
-        except Exception as e:
-            print(f"Error detail package: {e}")
-            return Response(
-                json_body={"error": "Invalid ID or Server Error"}, status=400
-            )
+    session = request.dbsession
+    try:
+        stmt = select(Package).where(Package.id == pkg_id)
+        pkg = session.execute(stmt).scalars().one()
+        return serialization_data(pkg)
+    except NoResultFound:
+        return Response(json_body={"message": "Package not found"}, status=404)
+    except Exception:
+        logger.exception("Error detail package")
+        return Response(
+            json_body={"error": "Invalid ID or Server Error"}, status=400
+        )
 
 
 @view_config(route_name="package_detail", request_method="PUT", renderer="json")
@@ -78,9 +82,9 @@ def update_package(request):
             session.commit()
             session.refresh(pkg)
             return serialization_data(pkg)
-        except Exception as e:
+        except Exception:
             session.rollback()
-            print(e)
+            logger.exception("Error updating package")
             return Response(json_body={"error": "Update failed"}, status=500)
 
 
@@ -110,9 +114,9 @@ def delete_package(request):
             session.delete(pkg)
             session.commit()
             return {"message": "Package Successfully Deleted"}
-        except Exception as e:
+        except Exception:
             session.rollback()
-            print(f"failed delete packged: {e}")
+            logger.exception("Failed deleting package")
             return Response(
                 json_body={
                     "error": "Cannot delete package, it might have booking sesssion"
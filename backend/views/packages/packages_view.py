@@ -1,19 +1,24 @@
+import logging
 from pyramid.response import Response
 from pyramid.view import view_config
-from sqlalchemy import select, asc, desc
+from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound, IntegrityError
 from db import Session
 from models.package_model import Package
 from models.destination_model import Destination
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.pagination_helper import set_pagination_headers
 from pydantic import BaseModel, Field, ValidationError
 from typing import List
-from . import serialization_data
+from . import serialization_data, list_packages
 import uuid
 import json
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
 class PackageRequest(BaseModel):
     destinationId: str
     name: str
@@ -27,50 +32,18 @@ class PackageRequest(BaseModel):
 
 @view_config(route_name="packages", request_method="GET", renderer="json")
 def get_packages(request):
-    destination_id = request.params.get("destination")
-    search_query = request.params.get("q") or request.params.get("search")
-    min_price = request.params.get("minPrice")
-    max_price = request.params.get("maxPrice")
-    sort_by = request.params.get("sortBy")
-    order = request.params.get("order", "asc")
-
-    with Session() as session:
-        stmt = select(Package)
-
-        if destination_id and destination_id != "all":
-            try:
-                uuid.UUID(destination_id)
-                stmt = stmt.where(Package.destination_id == destination_id)
-            except ValueError:
-                pass
-
-        if search_query:
-            stmt = stmt.where(Package.name.ilike(f"%{search_query}%"))
-
-        if min_price:
-            stmt = stmt.where(Package.price >= float(min_price))
-
-        if max_price:
-            stmt = stmt.where(Package.price <= float(max_price))
-
-        if sort_by == "price":
-            sort_column = Package.price
-        elif sort_by == "duration":
-            sort_column = Package.duration
-        else:
-            sort_column = Package.created_at
-
-        if order == "desc":
-            stmt = stmt.order_by(desc(sort_column))
-        else:
-            stmt = stmt.order_by(asc(sort_column))
+    session = request.dbsession
+    try:
+        packages, meta = list_packages(session, request.params)
+    except ValueError as err:
+        return Response(json_body={"error": str(err)}, status=400)
+    except Exception:
+        logger.exception("Error fetching packages")
+        return Response(json_body={"error": "Internal server error"}, status=500)
 
-        try:
-            results = session.execute(stmt).scalars().all()
-            return [serialization_data(pkg) for pkg in results]
-        except Exception as e:
-            print(f"Error fetching packages : {e}")
-            return Response(json_body={"error": "Internal server error"}, status=500)
+    if meta:
+        set_pagination_headers(request.response, meta)
+    return packages
 
 
 @view_config(route_name="packages", request_method="POST", renderer="json")
@@ -177,9 +150,9 @@ def create_package(request):
                 return Response(json_body={"error": str(err.orig)}, status=409)
             except Exception as e:
                 session.rollback()
-                print(f"CRITICAL ERROR: {e}")
+                logger.exception("Error saving package")
                 return Response(json_body={"error": f"Internal Server Error: {str(e)}"}, status=500)
                 
-    except Exception as e:
-        print(f"Error creating package: {e}")
+    except Exception:
+        logger.exception("Error creating package")
         return Response(json_body={"error": "Internal server error"}, status=500)
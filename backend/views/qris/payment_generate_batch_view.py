@@ -0,0 +1,199 @@
+"""Generate many payment QRIS in one request (bulk invoicing)"""
+import json
+import os
+import uuid
+import zipfile
+from io import BytesIO
+from pyramid.view import view_config
+from pyramid.response import Response
+from sqlalchemy import select
+
+from helpers.qr_image_helper import make_qr_image, render_qr_png
+from helpers.qris_helper import build_dynamic_qris_string, calculate_total_amount
+from helpers.qris_cache_helper import get_active_qris
+from helpers.jwt_validate_helper import jwt_validate
+from models.booking_model import Booking
+from models.package_model import Package
+
+# Storage path untuk generated QR codes
+STORAGE_DIR = "storage/qris"
+MAX_BATCH_SIZE = 100
+
+
+def _parse_amounts(raw_amounts):
+    """Validasi list amount, return (items, error)"""
+    items = []
+    for index, amount in enumerate(raw_amounts):
+        try:
+            amount = float(amount)
+            if amount <= 0:
+                raise ValueError("amount must be > 0")
+        except (ValueError, TypeError):
+            return None, f"amounts[{index}] must be a valid number > 0"
+        items.append({"bookingId": None, "amount": amount})
+    return items, None
+
+
+def _load_booking_amounts(request, booking_ids):
+    """Ambil total_price booking sekaligus (1 query), return (items, status, error)"""
+    user_id = request.jwt_claims.get("sub")
+    user_role = request.jwt_claims.get("role")
+
+    try:
+        booking_uuids = [uuid.UUID(str(booking_id)) for booking_id in booking_ids]
+    except ValueError:
+        return None, 400, "bookingIds must contain valid UUIDs"
+
+    query = (
+        select(Booking.id, Booking.total_price, Booking.tourist_id, Package.agent_id)
+        .join(Package, Booking.package_id == Package.id)
+        .where(Booking.id.in_(booking_uuids))
+    )
+    rows = {row.id: row for row in request.dbsession.execute(query)}
+
+    items = []
+    for booking_uuid in booking_uuids:
+        row = rows.get(booking_uuid)
+        if row is None:
+            return None, 404, f"Booking {booking_uuid} not found"
+
+        # Agent hanya boleh booking paket miliknya, tourist hanya booking miliknya
+        owner_id = row.agent_id if user_role == "agent" else row.tourist_id
+        if str(owner_id) != user_id:
+            return None, 403, f"Forbidden: booking {booking_uuid}"
+
+        items.append({"bookingId": str(booking_uuid), "amount": float(row.total_price)})
+    return items, None, None
+
+
+@view_config(route_name="payment_generate_batch", request_method="POST", renderer="json")
+@jwt_validate
+def payment_generate_batch(request):
+    """
+    POST /api/payment/generate/batch
+    Generate banyak custom QRIS payment sekaligus (template QRIS aktif di-parse sekali)
+
+    Request (JSON), pilih salah satu "amounts" atau "bookingIds":
+    {
+        "amounts": [1000000, 2500000],
+        "bookingIds": ["uuid", "uuid"],
+        "format": "json"  // atau "zip" untuk download semua PNG + manifest.json
+    }
+
+    Response (200 OK, format json):
+    {
+        "qrisId": "uuid-of-active-qris",
+        "feeType": "rupiah",
+        "feeValue": 10000,
+        "count": 2,
+        "items": [
+            {
+                "bookingId": null,
+                "amount": 1000000,
+                "totalAmount": 1010000,
+                "dynamicQrisString": "00020126...[custom amount]",
+                "fotoQrUrl": "http://localhost:6543/qris/dynamic_[uuid].png"
+            }
+        ]
+    }
+
+    Response (200 OK, format zip): application/zip berisi qris_001.png, ... dan manifest.json
+    """
+    try:
+        # Parse JSON body
+        try:
+            body = request.json_body
+        except (ValueError, json.JSONDecodeError):
+            request.response.status = 400
+            return {"error": "Invalid JSON body"}
+
+        amounts = body.get("amounts")
+        booking_ids = body.get("bookingIds")
+        output_format = body.get("format", "json")
+
+        if bool(amounts) == bool(booking_ids):
+            request.response.status = 400
+            return {"error": "Provide either amounts or bookingIds"}
+
+        raw_items = amounts or booking_ids
+        if not isinstance(raw_items, list):
+            request.response.status = 400
+            return {"error": "amounts/bookingIds must be a list"}
+
+        if len(raw_items) > MAX_BATCH_SIZE:
+            request.response.status = 400
+            return {"error": f"Maximum {MAX_BATCH_SIZE} items per batch"}
+
+        if output_format not in ["json", "zip"]:
+            request.response.status = 400
+            return {"error": "format must be 'json' or 'zip'"}
+
+        if amounts:
+            items, error = _parse_amounts(amounts)
+            if error:
+                request.response.status = 400
+                return {"error": error}
+        else:
+            items, status, error = _load_booking_amounts(request, booking_ids)
+            if error:
+                request.response.status = status
+                return {"error": error}
+
+        # QRIS aktif + template hasil parsing diambil sekali untuk seluruh batch
+        qris = get_active_qris()
+
+        if not qris:
+            request.response.status = 404
+            return {"error": "QRIS not found. Silakan upload QRIS terlebih dahulu."}
+
+        for item in items:
+            item["dynamicQrisString"] = build_dynamic_qris_string(
+                qris["template"],
+                item["amount"],
+                qris["fee_type"],
+                qris["fee_value"]
+            )
+            item["totalAmount"] = calculate_total_amount(
+                item["amount"], qris["fee_type"], qris["fee_value"]
+            )
+
+        if output_format == "zip":
+            # PNG sudah terkompresi, ZIP_STORED menghindari kompresi ulang yang sia-sia
+            archive = BytesIO()
+            with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as zf:
+                for index, item in enumerate(items, start=1):
+                    item["file"] = f"qris_{index:03d}.png"
+                    zf.writestr(item["file"], render_qr_png(item["dynamicQrisString"]))
+                zf.writestr("manifest.json", json.dumps({
+                    "qrisId": str(qris["id"]),
+                    "feeType": qris["fee_type"],
+                    "feeValue": qris["fee_value"],
+                    "items": items,
+                }, indent=2))
+
+            return Response(
+                body=archive.getvalue(),
+                content_type="application/zip",
+                content_disposition='attachment; filename="qris_batch.zip"',
+            )
+
+        os.makedirs(STORAGE_DIR, exist_ok=True)
+        host_url = request.host_url.rstrip('/')
+        for item in items:
+            dynamic_qr_filename = f"dynamic_{uuid.uuid4()}.png"
+            make_qr_image(item["dynamicQrisString"]).save(
+                os.path.join(STORAGE_DIR, dynamic_qr_filename)
+            )
+            item["fotoQrUrl"] = f"{host_url}/qris/{dynamic_qr_filename}"
+
+        return {
+            "qrisId": str(qris["id"]),
+            "feeType": qris["fee_type"],
+            "feeValue": qris["fee_value"],
+            "count": len(items),
+            "items": items,
+        }
+
+    except Exception as e:
+        request.response.status = 500
+        return {"error": f"Internal server error: {str(e)}"}
@@ -4,12 +4,11 @@ import os
 import uuid
 from io import BytesIO
 from pyramid.view import view_config
-from sqlalchemy import select, desc
-import qrcode
 
-from helpers.qris_helper import generate_dynamic_qris_string
+from helpers.qr_image_helper import make_qr_image
+from helpers.qris_helper import build_dynamic_qris_string, calculate_total_amount
+from helpers.qris_cache_helper import get_active_qris
 from helpers.jwt_validate_helper import jwt_validate
-from models.qris_model import Qris
 
 # Storage path untuk generated QR codes
 STORAGE_DIR = "storage/qris"
@@ -20,7 +19,7 @@ STORAGE_DIR = "storage/qris"
 def payment_generate(request):
     """
     POST /api/payment/generate
-    Generate custom QRIS payment dengan amount (auto-fetch QRIS terbaru)
+    Generate custom QRIS payment dengan amount (pakai QRIS merchant yang aktif)
     
     Request (JSON):
     {
@@ -29,7 +28,7 @@ def payment_generate(request):
     
     Response (200 OK):
     {
-        "qrisId": "uuid-of-latest-qris",
+        "qrisId": "uuid-of-active-qris",
         "staticQrisString": "00020126450014com.midtrans...",
         "dynamicQrisString": "00020126...[custom amount]",
         "amount": 1000000,
@@ -63,36 +62,23 @@ def payment_generate(request):
             request.response.status = 400
             return {"error": "amount must be a valid number > 0"}
         
-        # Get latest QRIS from database (order by created_at descending)
-        db_session = request.dbsession
-        query = select(Qris).order_by(desc(Qris.created_at)).limit(1)
-        result = db_session.execute(query)
-        qris = result.scalar_one_or_none()
+        # Get active QRIS (process-local cache, tanpa query database)
+        qris = get_active_qris()
         
         if not qris:
             request.response.status = 404
             return {"error": "QRIS not found. Silakan upload QRIS terlebih dahulu."}
         
         # Generate dynamic QRIS string dengan amount dan fee
-        dynamic_qris_string = generate_dynamic_qris_string(
-            qris.static_qris_string,
+        dynamic_qris_string = build_dynamic_qris_string(
+            qris["template"],
             amount,
-            qris.fee_type,
-            qris.fee_value
+            qris["fee_type"],
+            qris["fee_value"]
         )
         
         # Generate QR code image dari dynamic QRIS string
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(dynamic_qris_string)
-        qr.make(fit=True)
-        
-        # Create PIL image
-        img = qr.make_image(fill_color="black", back_color="white")
+        img = make_qr_image(dynamic_qris_string)
         
         # Save generated QR code to storage
         os.makedirs(STORAGE_DIR, exist_ok=True)
@@ -101,26 +87,22 @@ def payment_generate(request):
         img.save(dynamic_qr_path)
         
         # Calculate total amount with fee
-        total_amount = amount
-        if qris.fee_type == "rupiah" and qris.fee_value:
-            total_amount += float(qris.fee_value)
-        elif qris.fee_type == "persentase" and qris.fee_value:
-            total_amount += (amount * float(qris.fee_value) / 100)
+        total_amount = calculate_total_amount(amount, qris["fee_type"], qris["fee_value"])
         
         # Generate accessible URL untuk generated QR code
         dynamic_qr_url = f"{request.host_url.rstrip('/')}/qris/{dynamic_qr_filename}"
         
         return {
-            "qrisId": str(qris.id),
-            "staticQrisString": qris.static_qris_string,
+            "qrisId": str(qris["id"]),
+            "staticQrisString": qris["static_qris_string"],
             "dynamicQrisString": dynamic_qris_string,
             "amount": amount,
-            "feeType": qris.fee_type,
-            "feeValue": float(qris.fee_value) if qris.fee_value else None,
+            "feeType": qris["fee_type"],
+            "feeValue": qris["fee_value"],
             "totalAmount": total_amount,
             "fotoQrUrl": dynamic_qr_url,
             "qrCodeImage": dynamic_qr_path,
-            "createdAt": qris.created_at.isoformat() if qris.created_at else None,
+            "createdAt": qris["created_at"].isoformat() if qris["created_at"] else None,
             "message": "Custom QRIS berhasil di-generate. Buka fotoQrUrl untuk QR code payment custom."
         }
     
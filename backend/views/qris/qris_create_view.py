@@ -1,15 +1,19 @@
 """Upload QRIS image and save"""
+import logging
 import os
 import uuid
-from io import BytesIO
-from PIL import Image
+from PIL import UnidentifiedImageError
 import qrcode
-from pyzbar.pyzbar import decode
 from pyramid.view import view_config
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from models.qris_model import Qris
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.qr_image_helper import decode_qr_image
+from helpers.qris_cache_helper import invalidate_active_qris
+
+
+logger = logging.getLogger(__name__)
 
 
 # Storage path configuration
@@ -37,6 +41,7 @@ def qris_create(request):
         "fotoQrPath": "storage/qris/qris_code.png",
         "feeType": "rupiah",
         "feeValue": 10000,
+        "isActive": true,
         "createdAt": "2024-01-01T00:00:00Z",
         "message": "QRIS berhasil diupload dan dibersihkan"
     }
@@ -66,20 +71,21 @@ def qris_create(request):
             request.response.status = 400
             return {"error": "foto_qr file size must be <= 5MB"}
         
-        # Auto-extract QRIS string dari image
-        image = Image.open(BytesIO(image_data))
-        decoded_objects = decode(image)
+        # Auto-extract QRIS string dari image (downscale + grayscale dulu, fallback bertahap)
+        try:
+            decoded = decode_qr_image(image_data)
+        except UnidentifiedImageError:
+            request.response.status = 400
+            return {"error": "foto_qr bukan file gambar yang valid"}
+        
+        logger.info("QRIS decoded", extra={"fields": {"strategy": decoded["strategy"], "timingsMs": decoded["timings"]}})
         
-        if not decoded_objects:
+        if not decoded["data"]:
             request.response.status = 400
             return {"error": "Tidak dapat membaca QR code dari gambar. Pastikan gambar berisi QR code yang jelas."}
         
         # Ambil QRIS string dari QR code yang ter-decode
-        static_qris_string = decoded_objects[0].data.decode('utf-8')
-        
-        if not static_qris_string:
-            request.response.status = 400
-            return {"error": "QR code tidak mengandung data."}
+        static_qris_string = decoded["data"]
         
         # Validate fee params
         fee_type = request.POST.get("fee_type", "").strip() or None
@@ -118,8 +124,8 @@ def qris_create(request):
                     file_to_delete = os.path.join(STORAGE_DIR, filename)
                     if os.path.isfile(file_to_delete):
                         os.remove(file_to_delete)
-        except Exception as e:
-            print(f"Error deleting old files: {str(e)}")
+        except Exception:
+            logger.exception("Error deleting old files")
         
         # Generate clean QR code dari QRIS string (tanpa file upload, hanya QR code bersih)
         qr = qrcode.QRCode(
@@ -139,6 +145,11 @@ def qris_create(request):
         file_path = os.path.join(STORAGE_DIR, clean_filename)
         img.save(file_path)
         
+        # QRIS baru menggantikan QRIS aktif sebelumnya
+        db_session.execute(
+            update(Qris).where(Qris.is_active.is_(True)).values(is_active=False)
+        )
+        
         # Save to database
         qris = Qris(
             foto_qr_path=file_path,
@@ -146,11 +157,13 @@ def qris_create(request):
             dynamic_qris_string=static_qris_string,  # Akan di-update di payment generate
             fee_type=fee_type,
             fee_value=fee_value,
+            is_active=True,
         )
         
         db_session.add(qris)
         db_session.flush()
         db_session.commit()
+        invalidate_active_qris()
         
         request.response.status = 201
         return {
@@ -159,6 +172,7 @@ def qris_create(request):
             "fotoQrPath": qris.foto_qr_path,
             "feeType": qris.fee_type,
             "feeValue": float(qris.fee_value) if qris.fee_value else None,
+            "isActive": qris.is_active,
             "createdAt": qris.created_at.isoformat() if qris.created_at else None,
             "message": "QRIS berhasil diupload dan dibersihkan (disimpan sebagai clean QR code)"
         }
@@ -3,11 +3,12 @@ import base64
 import io
 import json
 from pyramid.view import view_config
-from sqlalchemy import select
+from sqlalchemy import select, desc
 import qrcode
 
 from models.qris_model import Qris
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.qris_cache_helper import invalidate_active_qris
 
 
 @view_config(route_name="qris_detail", request_method="GET", renderer="json")
@@ -24,6 +25,7 @@ def qris_detail(request):
         "status": "aktif",
         "feeType": "rupiah",
         "feeValue": 10000,
+        "isActive": true,
         "staticQrisString": "00020126...",
         "dynamicQrisString": "00020126...",
         "fotoQr": "base64string",
@@ -54,6 +56,7 @@ def qris_detail(request):
             "fotoQrPath": qris.foto_qr_path,
             "feeType": qris.fee_type,
             "feeValue": float(qris.fee_value) if qris.fee_value else None,
+            "isActive": qris.is_active,
             "createdAt": qris.created_at.isoformat() if qris.created_at else None,
         }
     
@@ -90,9 +93,20 @@ def qris_delete(request):
             request.response.status = 404
             return {"error": "QRIS not found"}
         
+        was_active = qris.is_active
         db_session.delete(qris)
         db_session.flush()
+        
+        # Jika QRIS aktif dihapus, QRIS terbaru yang tersisa menjadi aktif
+        if was_active:
+            replacement = db_session.execute(
+                select(Qris).order_by(desc(Qris.created_at)).limit(1)
+            ).scalar_one_or_none()
+            if replacement:
+                replacement.is_active = True
+        
         db_session.commit()
+        invalidate_active_qris()
         
         return {"message": "QRIS berhasil dihapus"}
     
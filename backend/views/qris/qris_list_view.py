@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from models.qris_model import Qris
+from helpers.pagination_helper import get_pagination_params, paginate
 
 
 @view_config(route_name="qris", request_method="GET", renderer="json")
@@ -17,6 +18,8 @@ def qris_list(request):
     Query Parameters:
     - page (optional, default: 1): Page number
     - limit (optional, default: 10): Items per page
+    - after (optional): Cursor dari pagination.nextCursor (keyset, page diabaikan)
+    - count (optional, default: exact): exact | estimated | none
     
     Response:
     {
@@ -28,41 +31,34 @@ def qris_list(request):
                 "fotoQrPath": "storage/qris/filename.png",
                 "feeType": "rupiah",
                 "feeValue": 10000,
+                "isActive": true,
                 "createdAt": "2024-01-01T00:00:00Z"
             }
         ],
         "pagination": {
             "page": 1,
             "limit": 10,
-            "total": 50
+            "total": 50,
+            "nextCursor": "WyIyMDI0LTAxLTAxVDAwOjAwOjAwIiwgInV1aWQiXQ"
         }
     }
     """
     try:
         # Get pagination params
-        page = int(request.params.get("page", 1))
-        limit = int(request.params.get("limit", 10))
-        
-        # Validate pagination
-        page = max(1, page)
-        limit = max(1, min(limit, 100))  # Max 100 items per page
-        
-        offset = (page - 1) * limit
-        
-        # Build query
-        query = select(Qris).offset(offset).limit(limit)
+        pagination = get_pagination_params(request.params, default_limit=10, max_limit=100)
         
         # Get database session
         db_session = request.dbsession
         
-        # Execute query
-        result = db_session.execute(query)
-        qris_list = result.scalars().all()
-        
-        # Get total count
-        count_query = select(Qris)
-        count_result = db_session.execute(count_query)
-        total = len(count_result.scalars().all())
+        # Execute query (total pakai COUNT(*), bukan load semua row)
+        qris_list, meta = paginate(
+            db_session,
+            select(Qris),
+            pagination,
+            sort_column=Qris.created_at,
+            id_column=Qris.id,
+            descending=True,
+        )
         
         # Format response
         data = []
@@ -74,16 +70,13 @@ def qris_list(request):
                 "fotoQrPath": qris.foto_qr_path,
                 "feeType": qris.fee_type,
                 "feeValue": float(qris.fee_value) if qris.fee_value else None,
+                "isActive": qris.is_active,
                 "createdAt": qris.created_at.isoformat() if qris.created_at else None,
             })
         
         return {
             "data": data,
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total": total,
-            }
+            "pagination": meta
         }
     
     except Exception as e:
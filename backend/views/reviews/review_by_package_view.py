@@ -3,6 +3,7 @@ from pyramid.view import view_config
 from sqlalchemy import select
 
 from models.review_model import Review
+from helpers.pagination_helper import get_pagination_params, paginate, set_pagination_headers
 
 
 @view_config(route_name="review_by_package", request_method="GET", renderer="json")
@@ -11,6 +12,10 @@ def review_by_package(request):
     GET /api/reviews/package/{packageId}
     Get all reviews for a package
     
+    Query Parameters:
+    - page, limit, after, count (optional): Pagination, total di header X-Total-Count
+      dan cursor berikutnya di header X-Next-Cursor
+    
     Response (200 OK):
     [
         {
@@ -35,10 +40,32 @@ def review_by_package(request):
             request.response.status = 400
             return {"error": "Package ID is required"}
         
+        try:
+            pagination = get_pagination_params(request.params, required=False)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
         db_session = request.dbsession
         query = select(Review).where(Review.package_id == package_id).order_by(Review.created_at.desc())
-        result = db_session.execute(query)
-        reviews = result.scalars().all()
+        
+        if pagination:
+            try:
+                reviews, meta = paginate(
+                    db_session,
+                    query,
+                    pagination,
+                    sort_column=Review.created_at,
+                    id_column=Review.id,
+                    descending=True,
+                )
+            except ValueError as e:
+                request.response.status = 400
+                return {"error": str(e)}
+            set_pagination_headers(request.response, meta)
+        else:
+            result = db_session.execute(query)
+            reviews = result.scalars().all()
         
         return [
             {
@@ -0,0 +1,38 @@
+from pyramid.view import view_config
+from db import engine
+from helpers.health_helper import readiness
+
+
+@view_config(route_name="healthz", request_method="GET", renderer="json")
+def healthz(request):
+    """
+    GET /healthz
+    Liveness: proses hidup dan bisa melayani request (tanpa menyentuh database)
+
+    Response (200 OK):
+    {"status": "ok"}
+    """
+    request.response.cache_control = "no-store"
+    return {"status": "ok"}
+
+
+@view_config(route_name="readyz", request_method="GET", renderer="json")
+def readyz(request):
+    """
+    GET /readyz
+    Readiness: database terjangkau, migrasi di head, pool koneksi & antrian waitress belum penuh
+
+    Response (200 OK / 503 Service Unavailable):
+    {
+        "ready": true,
+        "checks": {
+            "pool": {"ok": true, "inUse": 2, "capacity": 15},
+            "queue": {"ok": true, "depth": 0, "active": 1, "threads": 8},
+            "database": {"ok": true, "latencyMs": 1.2, "revision": ["<alembic head>"], "head": ["<alembic head>"]}
+        }
+    }
+    """
+    result = readiness(engine)
+    request.response.status = 200 if result["ready"] else 503
+    request.response.cache_control = "no-store"
+    return result
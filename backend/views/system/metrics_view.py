@@ -0,0 +1,27 @@
+import os
+import secrets
+from pyramid.response import Response
+from pyramid.view import view_config
+from helpers.metrics_helper import render_metrics
+
+
+# Jika diisi, scraper wajib kirim "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+
+@view_config(route_name="metrics", request_method="GET", renderer="json")
+def metrics(request):
+    """
+    GET /metrics
+    Metric proses ini (latency, ukuran response, jumlah query SQL per route) untuk Prometheus
+
+    Response (200 OK, text/plain):
+    http_request_duration_seconds_bucket{route="packages",method="GET",le="0.05"} 120
+    db_queries_per_request_sum{route="bookings",method="GET"} 360
+    """
+    if METRICS_TOKEN:
+        expected = f"Bearer {METRICS_TOKEN}"
+        if not secrets.compare_digest(request.headers.get("Authorization", ""), expected):
+            return Response(json_body={"error": "Unauthorized"}, status=401)
+
+    return Response(text=render_metrics(), content_type="text/plain", charset="utf-8")
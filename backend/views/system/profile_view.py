@@ -0,0 +1,34 @@
+from pyramid.response import Response
+from pyramid.view import view_config
+from helpers.jwt_validate_helper import jwt_validate
+from helpers.permission_helper import requires
+from helpers.profiler_helper import sample_stacks, format_collapsed, ProfilerBusy
+
+
+@view_config(route_name="admin_profile", request_method="GET", renderer="json")
+@jwt_validate
+@requires(admin=True)
+def admin_profile(request):
+    """
+    GET /api/admin/profile?seconds=10&interval=0.005&idle=0
+    Sampling profiler semua thread proses ini selama N detik (hanya ADMIN_USER_IDS)
+    Request ini memakai satu thread waitress selama sampling berjalan
+
+    Response (200 OK, text/plain, collapsed stack untuk flamegraph.pl / speedscope):
+    waitress-2;handler_thread (task.py:64);...;login (login_view.py:32);verify_password (password_helper.py:64);_run (password_helper.py:35);_verify (password_helper.py:50) 412
+    """
+    try:
+        seconds = float(request.params.get("seconds", 10))
+        interval = float(request.params.get("interval", 0.005))
+    except ValueError:
+        return Response(json_body={"error": "seconds and interval must be numbers"}, status=400)
+    include_idle = request.params.get("idle") == "1"
+
+    try:
+        result = sample_stacks(seconds, interval, include_idle)
+    except ProfilerBusy as e:
+        return Response(json_body={"error": str(e)}, status=409)
+
+    response = Response(text=format_collapsed(result["stacks"]), content_type="text/plain", charset="utf-8")
+    response.headers["X-Profile-Samples"] = str(result["samples"])
+    return response
@@ -7,7 +7,7 @@ import { Alert, AlertDescription } from "@/components/ui/alert";
 import { Badge } from "@/components/ui/badge";
 import { Upload, X, CheckCircle, AlertCircle, Clock, QrCode, Image, Loader2 } from "lucide-react";
 import { toast } from "sonner";
-import { API_BASE_URL } from "@/services/api";
+import { getPaymentProofUrl } from "@/lib/image-utils";
 
 export function PaymentUpload({
   totalPrice,
@@ -24,13 +24,7 @@ export function PaymentUpload({
   const [selectedFile, setSelectedFile] = useState(null);
 
   // Convert relative URL to full URL
-  const getFullUrl = (url) => {
-    if (!url) return null;
-    if (url.startsWith("http")) return url;
-    return `${API_BASE_URL}${url}`;
-  };
-
-  const [previewUrl, setPreviewUrl] = useState(getFullUrl(paymentProofUrl));
+  const [previewUrl, setPreviewUrl] = useState(getPaymentProofUrl(paymentProofUrl));
   const [isUploading, setIsUploading] = useState(false);
   const fileInputRef = useRef(null);
 
@@ -62,7 +56,7 @@ export function PaymentUpload({
 
   const handleRemove = () => {
     setSelectedFile(null);
-    setPreviewUrl(getFullUrl(paymentProofUrl));
+    setPreviewUrl(getPaymentProofUrl(paymentProofUrl));
     if (fileInputRef.current) {
       fileInputRef.current.value = "";
     }
@@ -26,7 +26,7 @@ import { useBookingStore } from "@/store/booking-store";
 import { useDestinationStore } from "@/store/destination-store";
 import { format } from "date-fns";
 import { toast } from "sonner";
-import { API_BASE_URL } from "@/services/api";
+import { getImageUrl, getPaymentProofUrl } from "@/lib/image-utils";
 export function PaymentVerification() {
   const { pendingPayments, isLoading, fetchPendingPayments, verifyPayment, rejectPayment } =
     useBookingStore();
@@ -80,14 +80,6 @@ export function PaymentVerification() {
     return pkg?.name || "Unknown Package";
   };
 
-  const getPaymentProofUrl = (paymentProofUrl) => {
-    if (!paymentProofUrl) return null;
-    // If it's already a full URL, return as-is
-    if (paymentProofUrl.startsWith("http")) return paymentProofUrl;
-    // Otherwise, prepend backend base URL
-    return `${API_BASE_URL}${paymentProofUrl}`;
-  };
-
   return (
     <Card>
       <CardHeader>
@@ -177,7 +169,7 @@ export function PaymentVerification() {
                               />
                             </div>
                             <div className="text-muted-foreground mt-2 text-xs">
-                              Image URL: {getPaymentProofUrl(booking.paymentProofUrl)}
+                              Image URL: {getImageUrl(booking.paymentProofUrl)}
                             </div>
                           </DialogContent>
                         </Dialog>
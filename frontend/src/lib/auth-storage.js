@@ -5,6 +5,7 @@
  */
 
 const AUTH_TOKEN_KEY = "auth_token";
+const REFRESH_TOKEN_KEY = "refresh_token";
 const AUTH_STORAGE_KEY = "auth-storage";
 
 /**
@@ -28,6 +29,22 @@ export const removeAuthToken = () => {
   localStorage.removeItem(AUTH_TOKEN_KEY);
 };
 
+/**
+ * Save refresh token to localStorage (dipakai untuk minta access token baru)
+ */
+export const saveRefreshToken = (token) => {
+  if (token) {
+    localStorage.setItem(REFRESH_TOKEN_KEY, token);
+  }
+};
+
+/**
+ * Get refresh token from localStorage
+ */
+export const getRefreshToken = () => {
+  return localStorage.getItem(REFRESH_TOKEN_KEY);
+};
+
 /**
  * Check if auth token exists
  */
@@ -41,6 +58,7 @@ export const hasAuthToken = () => {
  */
 export const clearAuthStorage = () => {
   localStorage.removeItem(AUTH_TOKEN_KEY);
+  localStorage.removeItem(REFRESH_TOKEN_KEY);
   localStorage.removeItem(AUTH_STORAGE_KEY);
 };
 
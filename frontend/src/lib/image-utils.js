@@ -38,3 +38,18 @@ export function getImageUrls(images) {
   }
   return images.map(getImageUrl);
 }
+
+/**
+ * Get the full URL of a payment proof image
+ * Payment proofs are private; <img> cannot send the Authorization header,
+ * so the API returns the path with a short-lived ?sig= scoped to that file
+ * (the access token never goes into the URL)
+ * @param proofPath - The signed payment proof path from backend (e.g., "/payment_proofs/<bookingId>_<uuid>.jpg?sig=...")
+ * @returns Full URL, or null if there is no proof
+ */
+export function getPaymentProofUrl(proofPath) {
+  if (!proofPath) {
+    return null;
+  }
+  return getImageUrl(proofPath);
+}
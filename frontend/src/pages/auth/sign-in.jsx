@@ -7,7 +7,7 @@ import { Skeleton } from "@/components/ui/skeleton";
 import { useAuthStore } from "@/store/auth-store";
 import { toast } from "sonner";
 import { useSEO } from "@/hooks/use-seo";
-import { saveAuthToken, hasAuthToken } from "@/lib/auth-storage";
+import { saveAuthToken, saveRefreshToken, hasAuthToken } from "@/lib/auth-storage";
 import * as authService from "@/services/auth.service";
 
 const SignIn = ({
@@ -67,6 +67,7 @@ const SignIn = ({
 
       // Store JWT token using helper
       saveAuthToken(response.token);
+      saveRefreshToken(response.refreshToken);
 
       // Update auth store with user data
       login(response.user);
@@ -1,7 +1,13 @@
 import axios from "axios";
 import { logger } from "@/lib/logger";
 import { toast } from "sonner";
-import { getAuthToken, clearAuthStorage } from "@/lib/auth-storage";
+import {
+  getAuthToken,
+  getRefreshToken,
+  saveAuthToken,
+  saveRefreshToken,
+  clearAuthStorage,
+} from "@/lib/auth-storage";
 import { API_BASE_URL, API_TIMEOUT } from "@/lib/constants";
 
 // Re-export for backward compatibility
@@ -31,10 +37,53 @@ apiClient.interceptors.request.use(
   }
 );
 
+// Single in-flight refresh shared by all requests that got 401 at the same time
+let refreshPromise = null;
+
+const refreshAccessToken = () => {
+  if (!refreshPromise) {
+    refreshPromise = axios
+      .post(
+        `${API_BASE_URL}/api/auth/refresh`,
+        { refreshToken: getRefreshToken() },
+        { timeout: API_TIMEOUT }
+      )
+      .then(({ data }) => {
+        saveAuthToken(data.token);
+        saveRefreshToken(data.refreshToken);
+        return data.token;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
 // Response interceptor - handle errors globally
 apiClient.interceptors.response.use(
   (response) => response,
-  (error) => {
+  async (error) => {
+    const originalRequest = error.config;
+
+    // Access token expired - try refresh token once, then retry the original request
+    if (
+      error.response?.status === 401 &&
+      originalRequest &&
+      !originalRequest._retry &&
+      getRefreshToken() &&
+      !/\/api\/auth\/(login|register|refresh)/.test(originalRequest.url || "")
+    ) {
+      originalRequest._retry = true;
+      try {
+        const token = await refreshAccessToken();
+        originalRequest.headers.Authorization = `Bearer ${token}`;
+        return apiClient(originalRequest);
+      } catch {
+        // Refresh failed - fall through to the normal 401 handling
+      }
+    }
+
     if (error.response) {
       // Server responded with error status
       const { status, data } = error.response;